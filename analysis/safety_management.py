@@ -541,11 +541,11 @@ class SafetyManagementToolbox:
         repo.active_phase = name
         if name:
             reuse = self._reuse_map().get(name, {})
-            repo.reuse_phases = set(reuse.get("phases", set()))
-            repo.reuse_products = set(reuse.get("work_products", set()))
+            repo.reuse_phases = reuse.get("phases", ())
+            repo.reuse_products = reuse.get("work_products", ())
         else:
-            repo.reuse_phases = set()
-            repo.reuse_products = set()
+            repo.reuse_phases = ()
+            repo.reuse_products = ()
         if self.on_change:
             self.on_change()
 
@@ -944,11 +944,14 @@ class SafetyManagementToolbox:
         {targets}`` where *relation* is the connection stereotype used between
         work products such as ``"satisfied by"`` or ``"derived from"``.
         """
+        from analysis.models import REQUIREMENT_WORK_PRODUCTS
+
         repo = SysMLRepository.get_instance()
         diag_ids = self.diagrams.values()
         if self.active_module:
             names = self.diagrams_in_module(self.active_module)
             diag_ids = [self.diagrams.get(n) for n in names if self.diagrams.get(n)]
+        req_wps = set(REQUIREMENT_WORK_PRODUCTS)
         mapping: Dict[str, Dict[str, set[str]]] = {}
         for diag_id in diag_ids:
             if not repo.diagram_visible(diag_id):
@@ -967,12 +970,7 @@ class SafetyManagementToolbox:
                 if stereo in {"satisfied by", "derived from"}:
                     sname = id_to_name.get(conn.get("src"))
                     tname = id_to_name.get(conn.get("dst"))
-                    from analysis.models import REQUIREMENT_WORK_PRODUCTS
-                    req_wps = set(REQUIREMENT_WORK_PRODUCTS)
-                    if (
-                        sname in req_wps
-                        and tname in req_wps
-                    ):
+                    if sname in req_wps and tname in req_wps:
                         mapping.setdefault(sname, {}).setdefault(stereo, set()).add(tname)
         return mapping
 
@@ -374,15 +374,32 @@ def _load_json_with_comments_uncached(p: Path) -> Any:
     return json.loads(text)
 
 
+# Modification time of each file when it was last parsed, keyed by its
+# resolved path.  ``None`` marks files served from the packaged resources.
+_JSON_MTIMES: dict[Path, int | None] = {}
+
+
 def load_json_with_comments(path: str | Path) -> Any:
     """Load a JSON file allowing // and /* */ comments and trailing commas.
 
     Results are cached via :mod:`tools.memory_manager` to avoid repeated disk
-    reads when the same configuration file is requested multiple times.
+    reads when the same configuration file is requested multiple times.  The
+    cache entry is keyed on the file's modification time so edits made while
+    the tool is running are picked up by the next load.
     """
     p = Path(path)
-    key = f"json:{p.resolve()}"
-    return memory_manager.lazy_load(key, lambda: _load_json_with_comments_uncached(p))
+    resolved = p.resolve()
+    try:
+        mtime = resolved.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    prefix = f"json:{resolved}:"
+    if resolved in _JSON_MTIMES and _JSON_MTIMES[resolved] != mtime:
+        memory_manager.discard_prefix(prefix)
+    _JSON_MTIMES[resolved] = mtime
+    return memory_manager.lazy_load(
+        f"{prefix}{mtime}", lambda: _load_json_with_comments_uncached(p)
+    )
 
 
 def load_diagram_rules(path: str | Path) -> dict[str, Any]:
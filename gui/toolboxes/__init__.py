@@ -4333,6 +4333,7 @@ class RequirementsExplorerWindow(tk.Frame):
         phase = None
         if self.app and getattr(self.app, "safety_mgmt_toolbox", None):
             phase = getattr(self.app.safety_mgmt_toolbox, "active_module", None)
+        traces = SysMLRepository.get_instance().requirement_trace_labels()
         for rid, req in global_requirements.items():
             req_phase = req.get("phase")
             if phase and req_phase not in (phase, None):
@@ -4345,7 +4346,7 @@ class RequirementsExplorerWindow(tk.Frame):
                 continue
             if status and req.get("status", "") != status:
                 continue
-            trace = ", ".join(self._get_requirement_allocations(rid))
+            trace = ", ".join(traces.get(rid, ()))
             links = ", ".join(
                 f"{r.get('type')} {r.get('id')}" for r in req.get("relations", [])
             )
@@ -4427,18 +4428,6 @@ class RequirementsExplorerWindow(tk.Frame):
             global_requirements.pop(rid, None)
             self.tree.delete(item)
 
-    def _get_requirement_allocations(self, rid: str) -> list[str]:
-        repo = SysMLRepository.get_instance()
-        names: list[str] = []
-        for diag in repo.diagrams.values():
-            dname = diag.name or diag.diag_id
-            for obj in getattr(diag, "objects", []):
-                for r in obj.get("requirements", []):
-                    if r.get("id") == rid:
-                        oname = obj.get("properties", {}).get("name", obj.get("obj_type"))
-                        names.append(f"{dname}:{oname}")
-        return sorted(set(names))
-
 
 class CausalBayesianNetworkWindow(tk.Frame):
     """Minimal editor for Causal Bayesian Network analyses."""
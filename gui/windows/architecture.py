@@ -559,8 +559,36 @@ def _core_toolbox_template() -> dict[str, list[str] | dict]:
     _dedup_core_category(core)
     return core
 
+# Last ``_toolbox_defs`` result paired with the rule objects it was built from.
+_TOOLBOX_DEFS_CACHE: tuple[tuple, dict] | None = None
+
+
+def _toolbox_defs_sources() -> tuple:
+    """Return the module state ``_toolbox_defs`` derives its result from."""
+    return (
+        CONNECTION_RULES,
+        SAFETY_AI_RELATION_RULES,
+        GOV_ELEMENT_CLASSES,
+        SAFETY_AI_NODES,
+        GOV_CORE_NODES,
+        NODE_TO_GROUP,
+        _relations_for,
+        _external_relations_for,
+    )
+
+
 def _toolbox_defs() -> dict[str, dict[str, list[str] | dict]]:
-    """Return mapping of toolbox name to node/relation lists."""
+    """Return mapping of toolbox name to node/relation lists.
+
+    The result is cached until :func:`reload_config` runs or one of the rule
+    tables is rebound, so callers must copy it before making changes.
+    """
+    global _TOOLBOX_DEFS_CACHE
+    sources = _toolbox_defs_sources()
+    if _TOOLBOX_DEFS_CACHE is not None:
+        cached_sources, cached = _TOOLBOX_DEFS_CACHE
+        if all(a is b for a, b in zip(cached_sources, sources)):
+            return cached
     defs: dict[str, dict[str, list[str] | dict]] = {}
     for group, nodes in GOV_ELEMENT_CLASSES.items():
         if not nodes:
@@ -583,6 +611,7 @@ def _toolbox_defs() -> dict[str, dict[str, list[str] | dict]]:
     # existing elements. When ``GOV_CORE_NODES`` is empty the relationship lists
     # simply remain blank.
     defs["Governance Core"] = _core_toolbox_template()
+    _TOOLBOX_DEFS_CACHE = (sources, defs)
     return defs
 
 
@@ -923,8 +952,9 @@ def reload_config() -> None:
     global GOV_ELEMENT_NODES, GOV_ELEMENT_RELATIONS, GOV_ELEMENT_CLASSES
     global SAFETY_AI_RELATION_RULES, CONNECTION_RULES, NODE_CONNECTION_LIMITS, GUARD_NODES
     global NODE_TO_GROUP, GOV_CORE_NODES, REQ_PATTERN_RELATIONS, _BASE_CONN_TYPES
-    global _ARROW_FORWARD_BASE
+    global _ARROW_FORWARD_BASE, _TOOLBOX_DEFS_CACHE
     _CONFIG = load_diagram_rules(_CONFIG_PATH)
+    _TOOLBOX_DEFS_CACHE = None
     ARCH_DIAGRAM_TYPES = set(_CONFIG.get("arch_diagram_types", []))
     SAFETY_AI_NODES = _CONFIG.get("ai_nodes", [])
     SAFETY_AI_NODE_TYPES = set(SAFETY_AI_NODES)
@@ -1467,14 +1497,14 @@ def rename_block(repo: SysMLRepository, block_id: str, new_name: str) -> None:
     new_name = repo.ensure_unique_element_name(new_name, block_id)
     if old_name == new_name:
         return
-    block.name = new_name
+    repo.rename_element(block_id, new_name)
     # update part elements referencing this block
     for elem in repo.elements.values():
         if elem.elem_type != "Part":
             continue
         def_val = elem.properties.get("definition")
         if def_val == block_id or def_val == old_name:
-            elem.name = new_name
+            repo.rename_element(elem.elem_id, new_name)
             elem.properties["definition"] = block_id
     for diag in repo.diagrams.values():
         for obj in getattr(diag, "objects", []):
@@ -1790,7 +1820,7 @@ def add_multiplicity_parts(
                 f"{base_name}[{idx + 1}]", elem.elem_id
             )
             if _is_default_part_name(base_name, elem.name) and elem.name != expected:
-                elem.name = expected
+                repo.rename_element(elem.elem_id, expected)
 
     base_x = 50.0
     base_y = 50.0 + 60.0 * len(diag.objects)
@@ -1836,7 +1866,7 @@ def add_multiplicity_parts(
                 f"{base_name}[{idx + 1}]", elem.elem_id
             )
             if _is_default_part_name(base_name, elem.name) and elem.name != expected:
-                elem.name = expected
+                repo.rename_element(elem.elem_id, expected)
 
     return added
 
@@ -2195,7 +2225,7 @@ def _sync_block_parts_from_ibd(repo: SysMLRepository, diag_id: str) -> None:
         return
     block_id = (
         getattr(diag, "father", None)
-        or next((eid for eid, did in repo.element_diagrams.items() if did == diag_id), None)
+        or repo.get_linking_element(diag_id)
     )
     if not block_id or block_id not in repo.elements:
         return
@@ -2352,7 +2382,7 @@ def update_block_parts_from_ibd(repo: SysMLRepository, diagram: SysMLDiagram) ->
         return
     block_id = getattr(diagram, "father", None)
     if not block_id:
-        block_id = next((eid for eid, did in repo.element_diagrams.items() if did == diagram.diag_id), None)
+        block_id = repo.get_linking_element(diagram.diag_id)
     if not block_id or block_id not in repo.elements:
         return
     block = repo.elements[block_id]
@@ -2808,10 +2838,7 @@ def inherit_father_parts(repo: SysMLRepository, diagram: SysMLDiagram) -> list[d
         diagram.objects.append(new_obj)
         added.append(new_obj)
     # update child block partProperties with inherited names
-    child_id = next(
-        (eid for eid, did in repo.element_diagrams.items() if did == diagram.diag_id),
-        None,
-    )
+    child_id = repo.get_linking_element(diagram.diag_id)
     if child_id and father in repo.elements:
         child = repo.elements[child_id]
         father_elem = repo.elements[father]
@@ -3085,7 +3112,7 @@ def rename_port(
         return
     port.properties["name"] = new_name
     if port.element_id and port.element_id in repo.elements:
-        repo.elements[port.element_id].name = new_name
+        repo.rename_element(port.element_id, new_name)
         repo.elements[port.element_id].properties["name"] = new_name
     parent_id = port.properties.get("parent")
     if not parent_id:
@@ -3492,7 +3519,9 @@ def propagate_block_part_changes(repo: SysMLRepository, block_id: str) -> None:
     for elem in repo.elements.values():
         if elem.elem_type != "Part" or elem.properties.get("definition") != block_id:
             continue
-        elem.name = repo.ensure_unique_element_name(block.name, elem.elem_id)
+        repo.rename_element(
+            elem.elem_id, repo.ensure_unique_element_name(block.name, elem.elem_id)
+        )
 
         for prop in props:
             if prop in block.properties:
@@ -4981,7 +5010,7 @@ class SysMLDiagramWindow(tk.Frame):
                             pname = f"{base}{idx}"
                             idx += 1
                         new_obj.properties["name"] = pname
-                        element.name = pname
+                        self.repo.rename_element(element.elem_id, pname)
                     if pname not in ports:
                         ports.append(pname)
                         parent_obj.properties["ports"] = ", ".join(ports)
@@ -6935,14 +6964,7 @@ class SysMLDiagramWindow(tk.Frame):
                 diag = self.repo.diagrams.get(self.diagram_id)
                 block_id = (
                     getattr(diag, "father", None)
-                    or next(
-                        (
-                            eid
-                            for eid, did in self.repo.element_diagrams.items()
-                            if did == self.diagram_id
-                        ),
-                        None,
-                    )
+                    or self.repo.get_linking_element(self.diagram_id)
                 )
                 if block_id:
                     for rel in self.repo.relationships:
@@ -10131,10 +10153,7 @@ class SysMLDiagramWindow(tk.Frame):
         prev_parts = None
         block_id = None
         if obj.obj_type == "Part" and diag:
-            block_id = getattr(diag, "father", None) or next(
-                (eid for eid, did in self.repo.element_diagrams.items() if did == self.diagram_id),
-                None,
-            )
+            block_id = getattr(diag, "father", None) or self.repo.get_linking_element(self.diagram_id)
             if block_id and block_id in self.repo.elements:
                 block = self.repo.elements[block_id]
                 prev_parts = block.properties.get("partProperties")
@@ -10190,7 +10209,7 @@ class SysMLDiagramWindow(tk.Frame):
                 win._sync_to_repository()
         # update block properties
         diag = repo.diagrams.get(self.diagram_id)
-        block_id = getattr(diag, "father", None) or next((eid for eid, did in repo.element_diagrams.items() if did == self.diagram_id), None)
+        block_id = getattr(diag, "father", None) or repo.get_linking_element(self.diagram_id)
         name = ""
         elem = repo.elements.get(part_id)
         if elem:
@@ -10294,14 +10313,7 @@ class SysMLDiagramWindow(tk.Frame):
             if diag.diag_type == "Internal Block Diagram":
                 block_id = (
                     getattr(diag, "father", None)
-                    or next(
-                        (
-                            eid
-                            for eid, did in self.repo.element_diagrams.items()
-                            if did == self.diagram_id
-                        ),
-                        None,
-                    )
+                    or self.repo.get_linking_element(self.diagram_id)
                 )
                 if block_id:
                     added_mult = _enforce_ibd_multiplicity(
@@ -10998,7 +11010,7 @@ class SysMLObjectDialog(simpledialog.Dialog):
             ).grid(row=link_row, column=1, padx=4, pady=2)
             link_row += 1
         elif self.obj.obj_type == "Part":
-            blocks = [e for e in repo.elements.values() if e.elem_type == "Block"]
+            blocks = repo.elements_of_type("Block")
             idmap = {b.name or b.elem_id: b.elem_id for b in blocks}
             ttk.Label(link_frame, text="Definition:").grid(
                 row=link_row, column=0, sticky="e", padx=4, pady=2
@@ -11374,10 +11386,7 @@ class SysMLObjectDialog(simpledialog.Dialog):
         if hasattr(self.master, "diagram_id"):
             diag = repo.diagrams.get(self.master.diagram_id)
             if diag and diag.diag_type == "Internal Block Diagram":
-                parent_id = getattr(diag, "father", None) or next(
-                    (eid for eid, did in repo.element_diagrams.items() if did == diag.diag_id),
-                    None,
-                )
+                parent_id = getattr(diag, "father", None) or repo.get_linking_element(diag.diag_id)
 
         if parent_id and _multiplicity_limit_exceeded(
             repo,
@@ -11407,10 +11416,7 @@ class SysMLObjectDialog(simpledialog.Dialog):
             if self.obj.obj_type == "Part" and hasattr(self.master, "diagram_id"):
                 diag = repo.diagrams.get(self.master.diagram_id)
                 if diag and diag.diag_type == "Internal Block Diagram":
-                    parent_id = getattr(diag, "father", None) or next(
-                        (eid for eid, did in repo.element_diagrams.items() if did == diag.diag_id),
-                        None,
-                    )
+                    parent_id = getattr(diag, "father", None) or repo.get_linking_element(diag.diag_id)
             if parent_id and _part_name_exists(repo, parent_id, new_name, self.obj.element_id):
                 messagebox.showinfo("Add Part", "A part with that name already exists")
                 new_name = self.obj.properties.get("name", "")
@@ -11423,7 +11429,7 @@ class SysMLObjectDialog(simpledialog.Dialog):
                 if self.obj.obj_type in ("Block", "Block Boundary") and elem.elem_type == "Block":
                     rename_block(repo, elem.elem_id, new_name)
                 else:
-                    elem.name = new_name
+                    repo.rename_element(elem.elem_id, new_name)
             if self.obj.obj_type == "Port" and hasattr(self.master, "objects"):
                 rename_port(repo, self.obj, self.master.objects, new_name)
         else:
@@ -11671,10 +11677,7 @@ class SysMLObjectDialog(simpledialog.Dialog):
                 if hasattr(self.master, "diagram_id"):
                     diag = repo.diagrams.get(self.master.diagram_id)
                     if diag and diag.diag_type == "Internal Block Diagram":
-                        parent_id = getattr(diag, "father", None) or next(
-                            (eid for eid, did in repo.element_diagrams.items() if did == diag.diag_id),
-                            None,
-                        )
+                        parent_id = getattr(diag, "father", None) or repo.get_linking_element(diag.diag_id)
                 if parent_id:
                     rel = next(
                         (
@@ -13307,10 +13310,7 @@ class InternalBlockDiagramWindow(SysMLDiagramWindow):
             diag = repo.diagrams.get(self.diagram_id)
             block_id = (
                 getattr(diag, "father", None)
-                or next(
-                    (eid for eid, did in repo.element_diagrams.items() if did == self.diagram_id),
-                    None,
-                )
+                or repo.get_linking_element(self.diagram_id)
             )
             if block_id:
                 for rel in repo.relationships:
@@ -13374,7 +13374,7 @@ class InternalBlockDiagramWindow(SysMLDiagramWindow):
 
     def add_contained_parts(self) -> None:
         repo = self.repo
-        block_id = next((eid for eid, did in repo.element_diagrams.items() if did == self.diagram_id), None)
+        block_id = repo.get_linking_element(self.diagram_id)
         if not block_id or block_id not in repo.elements:
             messagebox.showinfo("Add Contained Parts", "No block is linked to this diagram")
             return
@@ -13685,7 +13685,7 @@ class DiagramPropertiesDialog(simpledialog.Dialog):
             )
         elif self.diagram.diag_type == "Internal Block Diagram":
             repo = SysMLRepository.get_instance()
-            blocks = [e for e in repo.elements.values() if e.elem_type == "Block"]
+            blocks = repo.elements_of_type("Block")
             idmap = {b.name or b.elem_id: b.elem_id for b in blocks}
             ttk.Label(master, text="Father:").grid(row=row, column=0, sticky="e", padx=4, pady=2)
             self.father_map = idmap
@@ -13731,7 +13731,9 @@ class PackagePropertiesDialog(simpledialog.Dialog):
         ttk.Entry(master, textvariable=self.name_var).grid(row=0, column=1, padx=4, pady=2)
 
     def apply(self):
-        self.package.name = self.name_var.get()
+        SysMLRepository.get_instance().rename_element(
+            self.package.elem_id, self.name_var.get()
+        )
 
 
 class ElementPropertiesDialog(simpledialog.Dialog):
@@ -13766,7 +13768,7 @@ class ElementPropertiesDialog(simpledialog.Dialog):
         if self.element.elem_type == "Block":
             rename_block(repo, self.element.elem_id, new_name)
         else:
-            self.element.name = new_name
+            repo.rename_element(self.element.elem_id, new_name)
         for prop, var in self.entries.items():
             self.element.properties[prop] = var.get()
 
@@ -14214,7 +14216,7 @@ class ArchitectureManagerDialog(tk.Frame):
                     if elem.elem_type == "Block":
                         rename_block(self.repo, elem.elem_id, name)
                     else:
-                        elem.name = name
+                        self.repo.rename_element(elem.elem_id, name)
                     self.populate()
 
     # ------------------------------------------------------------------
@@ -377,7 +377,7 @@ class StpaWindow(tk.Frame):
 
         # Fall back to diagram relationships if no connections are present
         for rel_id in getattr(diagram, "relationships", []):
-            rel = next((r for r in repo.relationships if r.rel_id == rel_id), None)
+            rel = repo.get_relationship(rel_id)
             if not rel:
                 continue
             rel_stereo = (rel.stereotype or "").lower()
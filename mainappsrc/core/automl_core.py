@@ -1369,8 +1369,10 @@ class AutoMLApp(
         self.safety_analysis.show_fmeda_list()
 
         # --- Requirement Traceability Helpers used by reviews and matrix view ---
-    def get_requirement_allocation_names(self, req_id):
-        return self.requirements_manager.get_requirement_allocation_names(req_id)
+    def get_requirement_allocation_names(self, req_id, allocations=None):
+        return self.requirements_manager.get_requirement_allocation_names(
+            req_id, allocations
+        )
 
     def get_requirement_goal_names(self, req_id):
         return self.requirements_manager.get_requirement_goal_names(req_id)
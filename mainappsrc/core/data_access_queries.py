@@ -172,10 +172,7 @@ class DataAccess_Queries:
         for diag in repo.visible_diagrams().values():
             if diag.diag_type != "Internal Block Diagram":
                 continue
-            blk_id = getattr(diag, "father", None) or next(
-                (eid for eid, did in repo.element_diagrams.items() if did == diag.diag_id),
-                None,
-            )
+            blk_id = getattr(diag, "father", None) or repo.get_linking_element(diag.diag_id)
             if blk_id and blk_id in repo.elements:
                 diag_block[diag.diag_id] = repo.elements[blk_id].name or blk_id
 
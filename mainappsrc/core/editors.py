@@ -214,24 +214,13 @@ class Editors:
         tree_frame.grid_columnconfigure(0, weight=1)
         tree_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        def _get_requirement_allocations(rid: str) -> list[str]:
-            repo = SysMLRepository.get_instance()
-            names: list[str] = []
-            for diag in repo.diagrams.values():
-                dname = diag.name or diag.diag_id
-                for obj in getattr(diag, "objects", []):
-                    for r in obj.get("requirements", []):
-                        if r.get("id") == rid:
-                            oname = obj.get("properties", {}).get("name", obj.get("obj_type"))
-                            names.append(f"{dname}:{oname}")
-            return sorted(set(names))
-
         def refresh_tree() -> None:
             tree.delete(*tree.get_children())
             max_lines = 1
+            traces = SysMLRepository.get_instance().requirement_trace_labels()
             for req in global_requirements.values():
                 rid = req.get("id", "")
-                trace = ", ".join(_get_requirement_allocations(rid))
+                trace = ", ".join(traces.get(rid, ()))
                 links = ", ".join(
                     f"{r.get('type')} {r.get('id')}" for r in req.get("relations", [])
                 )
@@ -415,9 +404,10 @@ class Editors:
                     first = False
                     widget.insert(tk.END, item, "removed")
 
+        allocations = SysMLRepository.get_instance().requirement_allocations()
         for req in reqs:
             rid = req.get("id")
-            alloc = ", ".join(app.get_requirement_allocation_names(rid))
+            alloc = ", ".join(app.get_requirement_allocation_names(rid, allocations))
             goals = ", ".join(app.get_requirement_goal_names(rid))
             text.insert(tk.END, f"[{rid}] {req.get('text','')}\n")
             text.insert(tk.END, "  Allocated to: ")
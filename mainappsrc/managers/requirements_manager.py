@@ -64,12 +64,24 @@ class RequirementsManagerSubApp:
         return {}
 
     # ------------------------------------------------------------------
-    def get_requirement_allocation_names(self, req_id: str) -> list[str]:
-        """Return names of model elements linked to ``req_id``."""
+    def get_requirement_allocation_names(
+        self, req_id: str, allocations: Dict[str, list] | None = None
+    ) -> list[str]:
+        """Return names of model elements linked to ``req_id``.
+
+        Callers resolving many requirements pass *allocations* from
+        :meth:`SysMLRepository.requirement_allocations` so the diagrams are
+        scanned once rather than once per requirement.
+        """
         names: list[str] = []
         repo = SysMLRepository.get_instance() if SysMLRepository else None
         if repo:
-            for diag_id, obj_id in repo.find_requirements(req_id):
+            if allocations is None:
+                pairs = repo.find_requirements(req_id)
+            else:
+                pairs = allocations.get(req_id, ())
+            obj_names: list[str] = []
+            for diag_id, obj_id in pairs:
                 diag = repo.diagrams.get(diag_id)
                 obj = next((o for o in getattr(diag, "objects", []) if o.get("obj_id") == obj_id), None)
                 dname = diag.name if diag else ""
@@ -78,12 +90,9 @@ class RequirementsManagerSubApp:
                     names.append(f"{dname}:{oname}")
                 elif dname or oname:
                     names.append(dname or oname)
-            for diag in repo.diagrams.values():
-                for obj in getattr(diag, "objects", []):
-                    reqs = obj.get("requirements", [])
-                    if any(r.get("id") == req_id for r in reqs):
-                        name = obj.get("properties", {}).get("name") or obj.get("obj_type", "")
-                        names.append(name)
+                if obj:
+                    obj_names.append(oname or obj.get("obj_type", ""))
+            names.extend(obj_names)
         for n in self.app.get_all_nodes(self.app.root_node):
             reqs = getattr(n, "safety_requirements", [])
             if any((r.get("id") if isinstance(r, dict) else getattr(r, "id", None)) == req_id for r in reqs):
@@ -772,9 +781,16 @@ class RequirementsManagerSubApp:
                     "Text",
                 ]
             )
+            allocations = (
+                SysMLRepository.get_instance().requirement_allocations()
+                if SysMLRepository
+                else None
+            )
             for req in global_requirements.values():
                 rid = req.get("id", "")
-                trace = ", ".join(self.get_requirement_allocation_names(rid))
+                trace = ", ".join(
+                    self.get_requirement_allocation_names(rid, allocations)
+                )
                 links = ", ".join(
                     f"{r.get('type')} {r.get('id')}" for r in req.get("relations", [])
                 )
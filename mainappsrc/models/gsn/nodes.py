@@ -27,6 +27,18 @@ import logging
 
 ALLOWED_AWAY_TYPES = {"Goal", "Solution", "Context", "Assumption", "Justification"}
 
+# Child node types permitted for each parent type, per relationship.
+_SOLVED_CHILDREN = frozenset({"Goal", "Strategy", "Solution", "Module"})
+_CONTEXT_CHILDREN = frozenset({"Context", "Assumption", "Justification"})
+_SOLVED_BY = {
+    "Goal": _SOLVED_CHILDREN,
+    "Strategy": frozenset({"Goal"}),
+    "Module": _SOLVED_CHILDREN,
+}
+_IN_CONTEXT_OF = dict.fromkeys(
+    ("Goal", "Strategy", "Solution", "Module"), _CONTEXT_CHILDREN
+)
+
 
 logger = logging.getLogger(__name__)
 
@@ -93,30 +105,18 @@ class GSNNode:
             allowed by the GSN standard.
         """
 
-        if relation not in {"solved", "context"}:
-            raise ValueError(f"Unknown relationship: {relation}")
-
         if relation == "solved":
-            allowed = {
-                "Goal": {"Goal", "Strategy", "Solution", "Module"},
-                "Strategy": {"Goal"},
-                "Module": {"Goal", "Strategy", "Solution", "Module"},
-            }
-            if self.node_type not in allowed or child.node_type not in allowed[self.node_type]:
+            if child.node_type not in _SOLVED_BY.get(self.node_type, ()):
                 raise ValueError(
                     f"{self.node_type} cannot be solved by {child.node_type}"
                 )
-        else:  # relation == "context"
-            allowed = {
-                "Goal": {"Context", "Assumption", "Justification"},
-                "Strategy": {"Context", "Assumption", "Justification"},
-                "Solution": {"Context", "Assumption", "Justification"},
-                "Module": {"Context", "Assumption", "Justification"},
-            }
-            if self.node_type not in allowed or child.node_type not in allowed[self.node_type]:
+        elif relation == "context":
+            if child.node_type not in _IN_CONTEXT_OF.get(self.node_type, ()):
                 raise ValueError(
                     f"{self.node_type} cannot have context {child.node_type}"
                 )
+        else:
+            raise ValueError(f"Unknown relationship: {relation}")
 
         if child not in self.children:
             self.children.append(child)
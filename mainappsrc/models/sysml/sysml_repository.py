@@ -18,15 +18,149 @@
 
 # Author: Miguel Marina <karel.capek.robotics@gmail.com>
 import json
+import math
+import operator
+from itertools import compress
 import uuid
-from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import os
+import sys
+import time
 import datetime
 import analysis.user_config as user_config
 
+try:  # optional dependency
+    import orjson
+except Exception:  # pragma: no cover - orjson may not be installed
+    orjson = None
+
 GLOBAL_PHASE = "GLOBAL"
 
+# Maximum number of undo and redo snapshots kept by the repository
+_UNDO_LIMIT = 50
+
+# Phase column accessor for diagram object/connection dictionaries
+_phase_of = operator.methodcaller("get", "phase")
+
+# Interned type names compared in hot loops; model strings are interned on
+# load so these comparisons usually succeed on identity.
+_ACTIVITY_DIAGRAM = sys.intern("Activity Diagram")
+_CALL_BEHAVIOR_ACTION = sys.intern("CallBehaviorAction")
+_ACTION_TYPES = frozenset(
+    sys.intern(t) for t in ("Action Usage", "Action", _CALL_BEHAVIOR_ACTION)
+)
+
+
+# Timestamp shared by calls within the same millisecond
+_last_ts_mono = 0.0
+_last_ts_str = ""
+
+
+def _now_iso() -> str:
+    """Return the current time in ISO format, reused for up to 1 ms.
+
+    Bulk edits touch many elements in a tight loop; formatting a fresh
+    ``datetime`` for each of them is measurable while sub-millisecond
+    differences carry no meaning for the modification metadata.
+    """
+    global _last_ts_mono, _last_ts_str
+    mono = time.monotonic()
+    if mono - _last_ts_mono >= 1e-3 or not _last_ts_str:
+        _last_ts_str = datetime.datetime.now().isoformat()
+        _last_ts_mono = mono
+    return _last_ts_str
+
+
+# (section, identifier key) pairs of repository snapshots
+_SNAPSHOT_SECTIONS = (
+    ("elements", "elem_id"),
+    ("relationships", "rel_id"),
+    ("diagrams", "diag_id"),
+)
+
+
+def _clone(value):
+    """Return a copy of JSON-like *value* with fresh dict and list containers.
+
+    Equivalent to what :func:`dataclasses.asdict` does for the nested
+    properties and diagram objects, without the generic ``deepcopy`` fallback
+    for leaf values, which are immutable strings and numbers here.
+    """
+    if isinstance(value, dict):
+        return {k: _clone(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_clone(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_clone(v) for v in value)
+    return value
+
+
+def _intern(value):
+    """Return *value* interned when it is a string."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _has_non_finite(value) -> bool:
+    """Return ``True`` if JSON-like *value* holds a NaN or infinite float."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _dumps(data) -> str:
+    """Return *data* as indented JSON, preferring :mod:`orjson` if present.
+
+    orjson writes NaN and infinities as ``null``, so such data goes through
+    the stdlib encoder, which keeps them as ``NaN``/``Infinity`` literals.
+    """
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bit; the stdlib handles them
+    return json.dumps(data, indent=2)
+
+
+def _loads(raw: bytes):
+    """Parse JSON *raw* bytes, preferring :mod:`orjson` if present."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals written by the stdlib encoder
+    return json.loads(raw)
+
+
+def _taken_diagram_names(names) -> set[str]:
+    """Return every name that collides with one of *names*.
+
+    A diagram name is taken when it is used verbatim or when another name
+    extends it with a space or underscore, so each name contributes itself
+    and all of its prefixes that end right before one of those separators.
+    """
+    taken: set[str] = set()
+    for name in names:
+        if not name:
+            continue
+        taken.add(name)
+        for i, ch in enumerate(name):
+            if ch == " " or ch == "_":
+                taken.add(name[:i])
+    return taken
+
 
 def _diagram_type_abbreviation(diag_type: str | None) -> str:
     """Return an upper-case abbreviation for *diag_type*.
@@ -36,7 +170,17 @@ def _diagram_type_abbreviation(diag_type: str | None) -> str:
     """
     return "" if not diag_type else "".join(word[0] for word in diag_type.split()).upper()
 
-@dataclass
+
+def _frozen_interned(values) -> frozenset:
+    """Return *values* as a frozenset with string members interned.
+
+    Reuse sets are consulted by every visibility predicate but change only
+    when the active lifecycle phase changes, so an immutable set of interned
+    strings keeps the membership tests cheap.
+    """
+    return frozenset(sys.intern(v) if isinstance(v, str) else v for v in values or ())
+
+@dataclass(slots=True)
 class SysMLElement:
     """Basic AutoML element stored in the repository."""
     elem_id: str
@@ -45,20 +189,43 @@ class SysMLElement:
     properties: Dict[str, str] = field(default_factory=dict)
     stereotypes: Dict[str, str] = field(default_factory=dict)
     owner: Optional[str] = None
-    created: str = field(default_factory=lambda: datetime.datetime.now().isoformat())
+    created: str = field(default_factory=_now_iso)
     author: str = field(default_factory=lambda: user_config.CURRENT_USER_NAME)
     author_email: str = field(default_factory=lambda: user_config.CURRENT_USER_EMAIL)
-    modified: str = field(default_factory=lambda: datetime.datetime.now().isoformat())
+    modified: str = field(default_factory=_now_iso)
     modified_by: str = field(default_factory=lambda: user_config.CURRENT_USER_NAME)
     modified_by_email: str = field(default_factory=lambda: user_config.CURRENT_USER_EMAIL)
     phase: Optional[str] = None
 
+    # ------------------------------------------------------------
+    def __post_init__(self) -> None:
+        self.elem_type = _intern(self.elem_type)
+
     # ------------------------------------------------------------
     def display_name(self) -> str:
         """Return element name annotated with its creation phase."""
         return f"{self.name} ({self.phase})" if self.phase else self.name
 
-@dataclass
+    # ------------------------------------------------------------
+    def to_dict(self) -> dict:
+        """Return a JSON-serialisable representation of the element."""
+        return {
+            "elem_id": self.elem_id,
+            "elem_type": self.elem_type,
+            "name": self.name,
+            "properties": _clone(self.properties),
+            "stereotypes": _clone(self.stereotypes),
+            "owner": self.owner,
+            "created": self.created,
+            "author": self.author,
+            "author_email": self.author_email,
+            "modified": self.modified,
+            "modified_by": self.modified_by,
+            "modified_by_email": self.modified_by_email,
+            "phase": self.phase,
+        }
+
+@dataclass(slots=True)
 class SysMLRelationship:
     rel_id: str
     rel_type: str
@@ -66,15 +233,38 @@ class SysMLRelationship:
     target: str
     stereotype: Optional[str] = None
     properties: Dict[str, str] = field(default_factory=dict)
-    created: str = field(default_factory=lambda: datetime.datetime.now().isoformat())
+    created: str = field(default_factory=_now_iso)
     author: str = field(default_factory=lambda: user_config.CURRENT_USER_NAME)
     author_email: str = field(default_factory=lambda: user_config.CURRENT_USER_EMAIL)
-    modified: str = field(default_factory=lambda: datetime.datetime.now().isoformat())
+    modified: str = field(default_factory=_now_iso)
     modified_by: str = field(default_factory=lambda: user_config.CURRENT_USER_NAME)
     modified_by_email: str = field(default_factory=lambda: user_config.CURRENT_USER_EMAIL)
     phase: Optional[str] = None
 
-@dataclass
+    # ------------------------------------------------------------
+    def __post_init__(self) -> None:
+        self.rel_type = _intern(self.rel_type)
+
+    # ------------------------------------------------------------
+    def to_dict(self) -> dict:
+        """Return a JSON-serialisable representation of the relationship."""
+        return {
+            "rel_id": self.rel_id,
+            "rel_type": self.rel_type,
+            "source": self.source,
+            "target": self.target,
+            "stereotype": self.stereotype,
+            "properties": _clone(self.properties),
+            "created": self.created,
+            "author": self.author,
+            "author_email": self.author_email,
+            "modified": self.modified,
+            "modified_by": self.modified_by,
+            "modified_by_email": self.modified_by_email,
+            "phase": self.phase,
+        }
+
+@dataclass(slots=True)
 class SysMLDiagram:
     diag_id: str
     diag_type: str
@@ -88,15 +278,19 @@ class SysMLDiagram:
     relationships: List[str] = field(default_factory=list)
     objects: List[dict] = field(default_factory=list)
     connections: List[dict] = field(default_factory=list)
-    created: str = field(default_factory=lambda: datetime.datetime.now().isoformat())
+    created: str = field(default_factory=_now_iso)
     author: str = field(default_factory=lambda: user_config.CURRENT_USER_NAME)
     author_email: str = field(default_factory=lambda: user_config.CURRENT_USER_EMAIL)
-    modified: str = field(default_factory=lambda: datetime.datetime.now().isoformat())
+    modified: str = field(default_factory=_now_iso)
     modified_by: str = field(default_factory=lambda: user_config.CURRENT_USER_NAME)
     modified_by_email: str = field(default_factory=lambda: user_config.CURRENT_USER_EMAIL)
     phase: Optional[str] = None
     locked: bool = False
 
+    # ------------------------------------------------------------
+    def __post_init__(self) -> None:
+        self.diag_type = _intern(self.diag_type)
+
     # ------------------------------------------------------------
     def display_name(self) -> str:
         """Return diagram name annotated with its type and creation phase."""
@@ -109,7 +303,28 @@ class SysMLDiagram:
     # ------------------------------------------------------------
     def to_dict(self) -> dict:
         """Return a JSON-serialisable representation of the diagram."""
-        return asdict(self)
+        return {
+            "diag_id": self.diag_id,
+            "diag_type": self.diag_type,
+            "name": self.name,
+            "package": self.package,
+            "description": self.description,
+            "color": self.color,
+            "father": self.father,
+            "tags": list(self.tags),
+            "elements": list(self.elements),
+            "relationships": list(self.relationships),
+            "objects": _clone(self.objects),
+            "connections": _clone(self.connections),
+            "created": self.created,
+            "author": self.author,
+            "author_email": self.author_email,
+            "modified": self.modified,
+            "modified_by": self.modified_by,
+            "modified_by_email": self.modified_by_email,
+            "phase": self.phase,
+            "locked": self.locked,
+        }
 
 class SysMLRepository:
     """Singleton repository for all AutoML elements and relationships."""
@@ -121,39 +336,85 @@ class SysMLRepository:
         self.diagrams: Dict[str, SysMLDiagram] = {}
         # map element_id -> diagram_id for implementation links
         self.element_diagrams: Dict[str, str] = {}
+        # inverse of ``element_diagrams``: diagram_id -> linking element ids
+        self._diagram_elements: Dict[str, Dict[str, None]] = {}
+        # (elements dict, its length, elem_type -> {elem_id: element}) built lazily
+        self._type_index: Optional[
+            tuple[dict, int, Dict[str, Dict[str, SysMLElement]]]
+        ] = None
+        # (elements dict, its length, name -> {elem_id: None}) built lazily
+        self._name_index: Optional[
+            tuple[dict, int, Dict[str, Dict[str, None]]]
+        ] = None
+        # name prefix -> lowest suffix that may still be free, see
+        # :meth:`_first_free_name`
+        self._name_suffixes: Dict[str, int] = {}
+        # (relationships list, its length, rel_id -> relationship) built lazily
+        self._rel_index: Optional[tuple[list, int, Dict[str, SysMLRelationship]]] = None
         # maintain undo and redo history of repository snapshots
-        self._undo_stack: list[dict] = []
-        self._redo_stack: list[dict] = []
+        self._undo_stack: deque[dict] = deque(maxlen=_UNDO_LIMIT)
+        self._redo_stack: deque[dict] = deque(maxlen=_UNDO_LIMIT)
+        # nesting depth of :meth:`_undo_batch` blocks
+        self._undo_depth = 0
         self.active_phase: Optional[str] = None
         # Phases reused by the currently active lifecycle phase. Elements or
         # diagrams belonging to any of these phases should remain visible even
         # though they were not created in ``active_phase``.
-        self.reuse_phases: set[str] = set()
+        self.reuse_phases = frozenset()
         # Work product types reused by the active phase. Any diagrams of these
         # types originating from other phases are visible but read-only.
-        self.reuse_products: set[str] = set()
-        # Diagrams made immutable after phase freeze
-        self.frozen_diagrams: set[str] = set()
+        self.reuse_products = frozenset()
         self.root_package = self.create_element("Package", name="Root")
 
+    # ------------------------------------------------------------
+    # Phase reuse configuration
+    # ------------------------------------------------------------
+    @property
+    def reuse_phases(self) -> frozenset[str]:
+        """Lifecycle phases whose content stays visible in ``active_phase``."""
+        return self._reuse_phases
+
+    @reuse_phases.setter
+    def reuse_phases(self, phases) -> None:
+        self._reuse_phases = _frozen_interned(phases)
+
+    @property
+    def reuse_products(self) -> frozenset[str]:
+        """Work product types reused by ``active_phase``."""
+        return self._reuse_products
+
+    @reuse_products.setter
+    def reuse_products(self, products) -> None:
+        self._reuse_products = _frozen_interned(products)
+
+    @property
+    def frozen_diagrams(self) -> frozenset[str]:
+        """IDs of diagrams made immutable after a phase freeze.
+
+        ``SysMLDiagram.locked`` is the single source of truth; the set is
+        derived on demand and read-only, so freeze or thaw a diagram by
+        setting its ``locked`` flag.
+        """
+        return frozenset(d.diag_id for d in self.diagrams.values() if d.locked)
+
     def touch_element(self, elem_id: str) -> None:
         elem = self.elements.get(elem_id)
         if elem:
-            elem.modified = datetime.datetime.now().isoformat()
+            elem.modified = _now_iso()
             elem.modified_by = user_config.CURRENT_USER_NAME
             elem.modified_by_email = user_config.CURRENT_USER_EMAIL
 
     def touch_diagram(self, diag_id: str) -> None:
         diag = self.diagrams.get(diag_id)
         if diag:
-            diag.modified = datetime.datetime.now().isoformat()
+            diag.modified = _now_iso()
             diag.modified_by = user_config.CURRENT_USER_NAME
             diag.modified_by_email = user_config.CURRENT_USER_EMAIL
 
     def touch_relationship(self, rel_id: str) -> None:
-        rel = next((r for r in self.relationships if r.rel_id == rel_id), None)
+        rel = self.get_relationship(rel_id)
         if rel:
-            rel.modified = datetime.datetime.now().isoformat()
+            rel.modified = _now_iso()
             rel.modified_by = user_config.CURRENT_USER_NAME
             rel.modified_by_email = user_config.CURRENT_USER_EMAIL
 
@@ -176,9 +437,9 @@ class SysMLRepository:
         """Return a JSON-serialisable snapshot of the repository."""
 
         return {
-            "elements": [asdict(e) for e in self.elements.values()],
-            "relationships": [asdict(r) for r in self.relationships],
-            "diagrams": [asdict(d) for d in self.diagrams.values()],
+            "elements": [e.to_dict() for e in self.elements.values()],
+            "relationships": [r.to_dict() for r in self.relationships],
+            "diagrams": [d.to_dict() for d in self.diagrams.values()],
             "element_diagrams": dict(self.element_diagrams),
             "active_phase": self.active_phase,
             "reuse_phases": list(self.reuse_phases),
@@ -197,7 +458,7 @@ class SysMLRepository:
         can merge the states to keep the undo history compact.
         """
 
-        cleaned = json.loads(json.dumps(data))
+        cleaned = _clone(data)
 
         def scrub(obj: Any) -> None:
             if isinstance(obj, dict):
@@ -212,6 +473,46 @@ class SysMLRepository:
         scrub(cleaned)
         return cleaned
 
+    @staticmethod
+    def _share_unchanged(state: dict, previous: dict) -> None:
+        """Replace entries of *state* equal to those in *previous* by the latter.
+
+        Consecutive snapshots usually differ in a handful of elements or
+        diagrams. Reusing the unchanged entry dictionaries of the previous
+        snapshot keeps the memory held by the undo history proportional to
+        what actually changed. Snapshots are therefore treated as immutable
+        and copied again by :meth:`_restore_snapshot` before being loaded.
+        Snapshots only ever hold model data, never the undo or redo history
+        itself, so sharing cannot nest one snapshot inside another.
+        """
+        for section, key in _SNAPSHOT_SECTIONS:
+            prev = {item[key]: item for item in previous.get(section, ())}
+            if not prev:
+                continue
+            items = state[section]
+            for i, item in enumerate(items):
+                old = prev.get(item[key])
+                if old is not None and old == item:
+                    items[i] = old
+
+    def _restore_snapshot(self, state: dict) -> None:
+        """Load undo snapshot *state* without aliasing its shared entries."""
+        self.from_dict(_clone(state))
+
+    @contextmanager
+    def _undo_batch(self):
+        """Record the enclosed mutations as a single undo step.
+
+        A snapshot is taken on entry; nested :meth:`push_undo_state` calls
+        made by the repository methods used inside the block are skipped.
+        """
+        self.push_undo_state()
+        self._undo_depth += 1
+        try:
+            yield
+        finally:
+            self._undo_depth -= 1
+
     def push_undo_state(self, strategy: str = "v4", sync_app: bool = True) -> None:
         """Save the current repository state for undo.
 
@@ -225,7 +526,11 @@ class SysMLRepository:
         undo step.
         """
 
+        if self._undo_depth:
+            return
         state = self.to_dict()
+        if self._undo_stack:
+            self._share_unchanged(state, self._undo_stack[-1])
         stripped = self._strip_object_positions(state)
 
         handler = getattr(
@@ -234,8 +539,6 @@ class SysMLRepository:
         changed = handler(state, stripped)
 
         if changed:
-            if len(self._undo_stack) > 50:
-                self._undo_stack.pop(0)
             self._redo_stack.clear()
             if sync_app:
                 try:
@@ -288,26 +591,26 @@ class SysMLRepository:
     def _push_undo_state_v3(self, state: dict, stripped: dict) -> bool:
         if self._undo_stack and self._undo_stack[-1] == state:
             return False
-        self._undo_stack.append(state)
-        if len(self._undo_stack) >= 3:
-            s1 = self._strip_object_positions(self._undo_stack[-3])
-            s2 = self._strip_object_positions(self._undo_stack[-2])
+        if len(self._undo_stack) >= 2:
+            s1 = self._strip_object_positions(self._undo_stack[-2])
+            s2 = self._strip_object_positions(self._undo_stack[-1])
             if s1 == s2 == stripped:
-                self._undo_stack.pop(-2)
-        if len(self._undo_stack) > 50:
-            self._undo_stack.pop(0)
+                self._undo_stack[-1] = state
+                return True
+        self._undo_stack.append(state)
         self._redo_stack.clear()
         return True
 
     def _push_undo_state_v4(self, state: dict, stripped: dict) -> bool:
         if self._undo_stack and self._undo_stack[-1] == state:
             return False
-        self._undo_stack.append(state)
-        if len(self._undo_stack) >= 3:
-            s1 = self._strip_object_positions(self._undo_stack[-3])
-            s2 = self._strip_object_positions(self._undo_stack[-2])
+        if len(self._undo_stack) >= 2:
+            s1 = self._strip_object_positions(self._undo_stack[-2])
+            s2 = self._strip_object_positions(self._undo_stack[-1])
             if s1 == s2 == stripped:
-                self._undo_stack.pop(-2)
+                self._undo_stack[-1] = state
+                return True
+        self._undo_stack.append(state)
         return True
 
     def undo(self, strategy: str = "v4") -> bool:
@@ -330,10 +633,9 @@ class SysMLRepository:
             if not self._undo_stack:
                 return False
         state = self._undo_stack.pop()
+        self._share_unchanged(current, state)
         self._redo_stack.append(current)
-        if len(self._redo_stack) > 50:
-            self._redo_stack.pop(0)
-        self.from_dict(state)
+        self._restore_snapshot(state)
         return True
 
     def _undo_v2(self) -> bool:
@@ -345,10 +647,9 @@ class SysMLRepository:
             if not self._undo_stack:
                 return False
         state = self._undo_stack.pop()
+        self._share_unchanged(current, state)
         self._redo_stack.append(current)
-        if len(self._redo_stack) > 50:
-            self._redo_stack.pop(0)
-        self.from_dict(state)
+        self._restore_snapshot(state)
         return True
 
     def _undo_v3(self) -> bool:
@@ -360,10 +661,9 @@ class SysMLRepository:
             if not self._undo_stack:
                 return False
         state = self._undo_stack.pop()
+        self._share_unchanged(current, state)
         self._redo_stack.append(current)
-        if len(self._redo_stack) > 50:
-            self._redo_stack.pop(0)
-        self.from_dict(state)
+        self._restore_snapshot(state)
         return True
 
     def _undo_v4(self) -> bool:
@@ -375,10 +675,9 @@ class SysMLRepository:
             if not self._undo_stack:
                 return False
         state = self._undo_stack.pop()
+        self._share_unchanged(current, state)
         self._redo_stack.append(current)
-        if len(self._redo_stack) > 50:
-            self._redo_stack.pop(0)
-        self.from_dict(state)
+        self._restore_snapshot(state)
         return True
 
     def _redo_v1(self) -> bool:
@@ -386,10 +685,9 @@ class SysMLRepository:
             return False
         current = self.to_dict()
         state = self._redo_stack.pop()
+        self._share_unchanged(current, state)
         self._undo_stack.append(current)
-        if len(self._undo_stack) > 50:
-            self._undo_stack.pop(0)
-        self.from_dict(state)
+        self._restore_snapshot(state)
         return True
 
     def _redo_v2(self) -> bool:
@@ -397,10 +695,9 @@ class SysMLRepository:
             return False
         current = self.to_dict()
         state = self._redo_stack.pop()
+        self._share_unchanged(current, state)
         self._undo_stack.append(current)
-        if len(self._undo_stack) > 50:
-            self._undo_stack.pop(0)
-        self.from_dict(state)
+        self._restore_snapshot(state)
         return True
 
     def _redo_v3(self) -> bool:
@@ -408,10 +705,9 @@ class SysMLRepository:
             return False
         current = self.to_dict()
         state = self._redo_stack.pop()
+        self._share_unchanged(current, state)
         self._undo_stack.append(current)
-        if len(self._undo_stack) > 50:
-            self._undo_stack.pop(0)
-        self.from_dict(state)
+        self._restore_snapshot(state)
         return True
 
     def _redo_v4(self) -> bool:
@@ -419,62 +715,142 @@ class SysMLRepository:
             return False
         current = self.to_dict()
         state = self._redo_stack.pop()
+        self._share_unchanged(current, state)
         self._undo_stack.append(current)
-        if len(self._undo_stack) > 50:
-            self._undo_stack.pop(0)
-        self.from_dict(state)
+        self._restore_snapshot(state)
         return True
 
     def ensure_unique_element_name(self, name: str, self_elem_id: str | None = None) -> str:
         """Return a unique element name based on *name* across all elements."""
         if not name:
             return name
-        existing = {
-            e.name
-            for eid, e in self.elements.items()
-            if eid != self_elem_id and e.name
-        }
-        base = name
-        suffix = 1
-        while name in existing:
-            name = f"{base}_{suffix}"
-            suffix += 1
-        return name
+        if not self._name_taken(name, self_elem_id):
+            return name
+        return self._first_free_name(f"{name}_", self_elem_id)
 
     def _default_name(self, elem_type: str) -> str:
         """Return a generated default name for ``elem_type``."""
         base = elem_type.replace(" ", "") or "Element"
-        existing = {
-            e.name
-            for e in self.elements.values()
-            if e.name and e.name.startswith(base)
-        }
-        suffix = 1
-        name = f"{base}{suffix}"
-        while name in existing:
+        return self._first_free_name(base)
+
+    def _first_free_name(self, prefix: str, self_elem_id: str | None = None) -> str:
+        """Return ``f"{prefix}{n}"`` for the smallest free ``n >= 1``.
+
+        Suffixes below the remembered start for *prefix* are known to be
+        taken, so creating many elements with the same name probes each
+        suffix once instead of rescanning from one. Renaming an element
+        (*self_elem_id*) may reuse its own suffix and therefore starts at one.
+        """
+        self._elements_by_name()  # rebuilding the index resets the suffixes
+        suffix = 1 if self_elem_id else self._name_suffixes.get(prefix, 1)
+        while self._name_taken(f"{prefix}{suffix}", self_elem_id):
             suffix += 1
-            name = f"{base}{suffix}"
-        return name
+        if not self_elem_id:
+            self._name_suffixes[prefix] = suffix
+        return f"{prefix}{suffix}"
+
+    def _name_taken(self, name: str, self_elem_id: str | None = None) -> bool:
+        """Return ``True`` if an element other than *self_elem_id* is *name*."""
+        elements = self.elements
+        return any(
+            eid != self_elem_id and eid in elements and elements[eid].name == name
+            for eid in self._elements_by_name().get(name, ())
+        )
+
+    def _elements_by_name(self) -> Dict[str, Dict[str, None]]:
+        """Return ``name -> {elem_id: None}`` for :attr:`elements`.
+
+        Like :meth:`_elements_by_type` the index is maintained by
+        :meth:`create_element` and :meth:`delete_element` and rebuilt when the
+        dictionary is replaced or changes size. Names must be changed through
+        :meth:`rename_element` to stay visible to the index.
+        """
+        elements = self.elements
+        cached = self._name_index
+        if cached is None or cached[0] is not elements or cached[1] != len(elements):
+            index: Dict[str, Dict[str, None]] = {}
+            for elem_id, elem in elements.items():
+                if elem.name:
+                    index.setdefault(elem.name, {})[elem_id] = None
+            cached = (elements, len(elements), index)
+            self._name_index = cached
+            self._name_suffixes = {}
+        return cached[2]
+
+    def _track_element_name(self, elem: SysMLElement, added: bool) -> None:
+        """Apply the addition or removal of *elem* to the name index."""
+        elements = self.elements
+        cached = self._name_index
+        before = len(elements) - 1 if added else len(elements) + 1
+        if cached is None or cached[0] is not elements or cached[1] != before:
+            self._name_index = None
+            return
+        if elem.name:
+            if added:
+                cached[2].setdefault(elem.name, {})[elem.elem_id] = None
+            else:
+                self._unindex_name(elem.name, elem.elem_id)
+        self._name_index = (elements, len(elements), cached[2])
+
+    def _unindex_name(self, name: str, elem_id: str) -> None:
+        """Drop *elem_id* from the *name* bucket and reopen its suffix."""
+        index = self._name_index[2]
+        bucket = index.get(name)
+        if bucket is not None:
+            bucket.pop(elem_id, None)
+            if not bucket:
+                del index[name]
+        # ``name`` may be ``f"{prefix}{n}"`` for any split of its trailing digits
+        suffixes = self._name_suffixes
+        pos = len(name)
+        while pos and name[pos - 1].isdigit():
+            pos -= 1
+            if name[pos] != "0":
+                prefix = name[:pos]
+                num = int(name[pos:])
+                if suffixes.get(prefix, 1) > num:
+                    suffixes[prefix] = num
+
+    def rename_element(self, elem_id: str, name: str) -> None:
+        """Set the name of element *elem_id*, keeping the name index current."""
+        elem = self.elements.get(elem_id)
+        if elem is None or elem.name == name:
+            return
+        index = self._elements_by_name()
+        if elem.name:
+            self._unindex_name(elem.name, elem_id)
+        elem.name = name
+        if name:
+            index.setdefault(name, {})[elem_id] = None
 
     def create_element(self, elem_type: str, name: str = "", properties: Optional[Dict[str, str]] = None, owner: Optional[str] = None) -> SysMLElement:
         self.push_undo_state()
         elem_id = str(uuid.uuid4())
-        if not name:
-            name = self._default_name(elem_type)
-        unique_name = self.ensure_unique_element_name(name)
+        if name:
+            unique_name = self.ensure_unique_element_name(name)
+        else:
+            # default names are already unique among all elements
+            unique_name = self._default_name(elem_type)
+        user = user_config.CURRENT_USER_NAME
+        email = user_config.CURRENT_USER_EMAIL
+        ts = _now_iso()
         elem = SysMLElement(
             elem_id,
             elem_type,
             unique_name,
             properties or {},
             owner=owner,
-            author=user_config.CURRENT_USER_NAME,
-            author_email=user_config.CURRENT_USER_EMAIL,
-            modified_by=user_config.CURRENT_USER_NAME,
-            modified_by_email=user_config.CURRENT_USER_EMAIL,
+            created=ts,
+            author=user,
+            author_email=email,
+            modified=ts,
+            modified_by=user,
+            modified_by_email=email,
             phase=self.active_phase,
         )
         self.elements[elem_id] = elem
+        self._track_element_type(elem, added=True)
+        self._track_element_name(elem, added=True)
         try:
             from analysis import safety_management as sm
             toolbox = getattr(sm, "ACTIVE_TOOLBOX", None)
@@ -536,21 +912,21 @@ class SysMLRepository:
                         for d in self.diagrams.values()
                         if d.diag_type == diag_type and d.name
                     }
+                    taken = _taken_diagram_names(existing)
                     base = name
                     suffix = 1
-                    while name in existing or any(
-                        n.startswith(f"{name} ") or n.startswith(f"{name}_") for n in existing
-                    ):
+                    while name in taken:
                         name = f"{base}_{suffix}"
                         suffix += 1
-            existing_all = {d.name for d in self.diagrams.values()}
+            taken = _taken_diagram_names(d.name for d in self.diagrams.values())
             base = name
             suffix = 1
-            while name in existing_all or any(
-                n.startswith(f"{name} ") or n.startswith(f"{name}_") for n in existing_all
-            ):
+            while name in taken:
                 name = f"{base}_{suffix}"
                 suffix += 1
+        user = user_config.CURRENT_USER_NAME
+        email = user_config.CURRENT_USER_EMAIL
+        ts = _now_iso()
         diagram = SysMLDiagram(
             diag_id,
             diag_type,
@@ -559,10 +935,12 @@ class SysMLRepository:
             description,
             color,
             father,
-            author=user_config.CURRENT_USER_NAME,
-            author_email=user_config.CURRENT_USER_EMAIL,
-            modified_by=user_config.CURRENT_USER_NAME,
-            modified_by_email=user_config.CURRENT_USER_EMAIL,
+            created=ts,
+            author=user,
+            author_email=email,
+            modified=ts,
+            modified_by=user,
+            modified_by_email=email,
             phase=self.active_phase,
         )
         self.diagrams[diag_id] = diagram
@@ -610,36 +988,44 @@ class SysMLRepository:
         """Remove an element and any relationships referencing it."""
         if self.element_read_only(elem_id):
             return
+        rels = self.relationships
+        remaining = [r for r in rels if r.source != elem_id and r.target != elem_id]
+        if elem_id not in self.elements and len(remaining) == len(rels):
+            return
         self.push_undo_state()
         if elem_id in self.elements:
-            del self.elements[elem_id]
-        self.relationships = [r for r in self.relationships if r.source != elem_id and r.target != elem_id]
+            elem = self.elements.pop(elem_id)
+            self._track_element_type(elem, added=False)
+            self._track_element_name(elem, added=False)
+        if len(remaining) != len(rels):
+            self.relationships = remaining
 
     def delete_package(self, pkg_id: str) -> None:
         """Delete a package and reassign its contents to the parent package."""
         pkg = self.elements.get(pkg_id)
         if not pkg or pkg.elem_type != "Package" or pkg_id == self.root_package.elem_id:
             return
-        self.push_undo_state()
-        parent = pkg.owner or self.root_package.elem_id
-        for elem in self.elements.values():
-            if elem.owner == pkg_id:
-                elem.owner = parent
-        for diag in self.diagrams.values():
-            if diag.package == pkg_id:
-                diag.package = parent
-        self.delete_element(pkg_id)
+        with self._undo_batch():
+            parent = pkg.owner or self.root_package.elem_id
+            for elem in self.elements.values():
+                if elem.owner == pkg_id:
+                    elem.owner = parent
+            for diag in self.diagrams.values():
+                if diag.package == pkg_id:
+                    diag.package = parent
+            self.delete_element(pkg_id)
 
     def delete_diagram(self, diag_id: str) -> None:
         if self.diagram_read_only(diag_id):
             return
+        if diag_id not in self.diagrams and diag_id not in self._diagram_elements:
+            return
         self.push_undo_state()
         if diag_id in self.diagrams:
             del self.diagrams[diag_id]
         # remove any element links to this diagram
-        for k, v in list(self.element_diagrams.items()):
-            if v == diag_id:
-                del self.element_diagrams[k]
+        for elem_id in self._diagram_elements.pop(diag_id, ()):
+            self.element_diagrams.pop(elem_id, None)
 
     def rename_phase(self, old: str, new: str) -> None:
         """Replace references to lifecycle phase ``old`` with ``new``.
@@ -663,10 +1049,10 @@ class SysMLRepository:
         for diag in self.diagrams.values():
             if diag.phase == old:
                 diag.phase = new
-            for obj in getattr(diag, "objects", []):
+            for obj in diag.objects:
                 if obj.get("phase") == old:
                     obj["phase"] = new
-            for conn in getattr(diag, "connections", []):
+            for conn in diag.connections:
                 if conn.get("phase") == old:
                     conn["phase"] = new
 
@@ -693,29 +1079,91 @@ class SysMLRepository:
     def load(self, path: str) -> None:
         if not os.path.exists(path):
             return
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = _loads(f.read())
         self.elements.clear()
         self.relationships.clear()
         self.diagrams.clear()
         for e in data.get("elements", []):
             elem = SysMLElement(**e)
             self.elements[elem.elem_id] = elem
+        self._type_index = None
+        self._name_index = None
         for r in data.get("relationships", []):
             rel = SysMLRelationship(**r)
             self.relationships.append(rel)
+        self._rel_index = None
         for d in data.get("diagrams", []):
             diag = SysMLDiagram(**d)
             self.diagrams[diag.diag_id] = diag
         self.element_diagrams = data.get("element_diagrams", {})
-        self.root_package = None
-        for elem in self.elements.values():
-            if elem.elem_type == "Package" and elem.owner is None:
-                self.root_package = elem
-                break
+        self._rebuild_diagram_links()
+        self._normalize_object_requirements()
+        self._intern_model_strings()
+        packages = self._elements_by_type().get("Package", {})
+        self.root_package = next(
+            (elem for elem in packages.values() if elem.owner is None), None
+        )
         if self.root_package is None:
             self.root_package = self.create_element("Package", name="Root")
 
+    def _elements_by_type(self) -> Dict[str, Dict[str, SysMLElement]]:
+        """Return ``elem_type -> {elem_id: element}`` for :attr:`elements`.
+
+        The index is kept up to date by :meth:`create_element` and
+        :meth:`delete_element` and rebuilt if the dictionary is replaced or
+        changes size behind the repository's back.
+        """
+        elements = self.elements
+        cached = self._type_index
+        if cached is None or cached[0] is not elements or cached[1] != len(elements):
+            index: Dict[str, Dict[str, SysMLElement]] = {}
+            for elem_id, elem in elements.items():
+                index.setdefault(elem.elem_type, {})[elem_id] = elem
+            cached = (elements, len(elements), index)
+            self._type_index = cached
+        return cached[2]
+
+    def _track_element_type(self, elem: SysMLElement, added: bool) -> None:
+        """Apply the addition or removal of *elem* to the type index."""
+        elements = self.elements
+        cached = self._type_index
+        before = len(elements) - 1 if added else len(elements) + 1
+        if cached is None or cached[0] is not elements or cached[1] != before:
+            self._type_index = None
+            return
+        bucket = cached[2].setdefault(elem.elem_type, {})
+        if added:
+            bucket[elem.elem_id] = elem
+        else:
+            bucket.pop(elem.elem_id, None)
+        self._type_index = (elements, len(elements), cached[2])
+
+    def elements_of_type(self, elem_type: str) -> List[SysMLElement]:
+        """Return all elements of ``elem_type`` in creation order."""
+        return list(self._elements_by_type().get(elem_type, {}).values())
+
+    def _relationship_index(self) -> Dict[str, SysMLRelationship]:
+        """Return a ``rel_id`` lookup for :attr:`relationships`.
+
+        Diagram windows replace or shrink the list directly, so the index is
+        rebuilt whenever the list object or its length changes.
+        """
+        rels = self.relationships
+        cached = self._rel_index
+        if cached is None or cached[0] is not rels or cached[1] != len(rels):
+            cached = (rels, len(rels), {r.rel_id: r for r in rels})
+            self._rel_index = cached
+        return cached[2]
+
+    def get_relationship(self, rel_id: str) -> Optional[SysMLRelationship]:
+        """Return the relationship with ``rel_id`` or ``None``."""
+        rel = self._relationship_index().get(rel_id)
+        if rel is None:
+            self._rel_index = None
+            rel = self._relationship_index().get(rel_id)
+        return rel
+
     def create_relationship(
         self,
         rel_type: str,
@@ -728,6 +1176,9 @@ class SysMLRepository:
         if record_undo:
             self.push_undo_state()
         rel_id = str(uuid.uuid4())
+        user = user_config.CURRENT_USER_NAME
+        email = user_config.CURRENT_USER_EMAIL
+        ts = _now_iso()
         rel = SysMLRelationship(
             rel_id,
             rel_type,
@@ -735,13 +1186,20 @@ class SysMLRepository:
             target,
             stereotype or rel_type.lower(),
             properties or {},
-            author=user_config.CURRENT_USER_NAME,
-            author_email=user_config.CURRENT_USER_EMAIL,
-            modified_by=user_config.CURRENT_USER_NAME,
-            modified_by_email=user_config.CURRENT_USER_EMAIL,
+            created=ts,
+            author=user,
+            author_email=email,
+            modified=ts,
+            modified_by=user,
+            modified_by_email=email,
             phase=self.active_phase,
         )
-        self.relationships.append(rel)
+        rels = self.relationships
+        cached = self._rel_index
+        rels.append(rel)
+        if cached is not None and cached[0] is rels and cached[1] == len(rels) - 1:
+            cached[2][rel_id] = rel
+            self._rel_index = (rels, len(rels), cached[2])
         return rel
 
     # ------------------------------------------------------------
@@ -756,12 +1214,12 @@ class SysMLRepository:
             return True
         if elem.phase in (None, GLOBAL_PHASE):
             return True
-        if elem.phase == self.active_phase or elem.phase in getattr(self, "reuse_phases", set()):
+        if elem.phase == self.active_phase or elem.phase in self.reuse_phases:
             return True
         diag_id = self.element_diagrams.get(elem_id)
         if diag_id:
             diag = self.diagrams.get(diag_id)
-            if diag and diag.diag_type in getattr(self, "reuse_products", set()):
+            if diag and diag.diag_type in self.reuse_products:
                 return True
         return False
 
@@ -770,29 +1228,31 @@ class SysMLRepository:
         diag = self.diagrams.get(diag_id)
         if not diag:
             return False
-        if "safety-management" in getattr(diag, "tags", []):
+        if "safety-management" in diag.tags:
             return True
         if self.active_phase is None:
             return True
         if diag.phase in (None, GLOBAL_PHASE):
             return True
-        if diag.phase == self.active_phase or diag.phase in getattr(self, "reuse_phases", set()):
+        if diag.phase == self.active_phase or diag.phase in self.reuse_phases:
             return True
-        return diag.diag_type in getattr(self, "reuse_products", set())
+        return diag.diag_type in self.reuse_products
 
     def element_read_only(self, elem_id: str) -> bool:
         """Return ``True`` if ``elem_id`` originates from a reused phase or work product."""
         elem = self.elements.get(elem_id)
         if not elem:
             return False
-        if self.active_phase is None or elem.phase is None:
+        active = self.active_phase
+        phase = elem.phase
+        if active is None or phase is None:
             return False
-        if elem.phase != self.active_phase and elem.phase in getattr(self, "reuse_phases", set()):
+        if phase != active and phase in self.reuse_phases:
             return True
-        diag_id = self.element_diagrams.get(elem_id)
-        if diag_id:
-            diag = self.diagrams.get(diag_id)
-            if diag and diag.diag_type in getattr(self, "reuse_products", set()) and diag.phase != self.active_phase:
+        linked = self.get_linked_diagram(elem_id)
+        if linked:
+            diag = self.diagrams.get(linked)
+            if diag and diag.diag_type in self.reuse_products:
                 return True
         return False
 
@@ -801,18 +1261,17 @@ class SysMLRepository:
         diag = self.diagrams.get(diag_id)
         if not diag:
             return False
-        if getattr(diag, "locked", False):
+        if diag.locked:
             return True
         if self.active_phase is None or diag.phase is None:
             return False
-        if diag.phase != self.active_phase and diag.phase in getattr(self, "reuse_phases", set()):
+        if diag.phase != self.active_phase and diag.phase in self.reuse_phases:
             return True
-        return diag.phase != self.active_phase and diag.diag_type in getattr(self, "reuse_products", set())
+        return diag.phase != self.active_phase and diag.diag_type in self.reuse_products
 
     # ------------------------------------------------------------
     def freeze_diagram(self, diag_id: str) -> None:
         """Mark a diagram as immutable."""
-        self.frozen_diagrams.add(diag_id)
         diag = self.diagrams.get(diag_id)
         if diag:
             diag.locked = True
@@ -820,7 +1279,6 @@ class SysMLRepository:
     # ------------------------------------------------------------
     def unfreeze_diagram(self, diag_id: str) -> None:
         """Allow modifications to a previously frozen diagram."""
-        self.frozen_diagrams.discard(diag_id)
         diag = self.diagrams.get(diag_id)
         if diag:
             diag.locked = False
@@ -836,18 +1294,18 @@ class SysMLRepository:
         match: set[Optional[str]] = {old}
         if old in (None, GLOBAL_PHASE):
             match.update({None, GLOBAL_PHASE})
-        for elem_id in getattr(diag, "elements", []):
+        for elem_id in diag.elements:
             elem = self.elements.get(elem_id)
             if elem and elem.phase in match:
                 elem.phase = phase
-        for rel_id in getattr(diag, "relationships", []):
-            rel = next((r for r in self.relationships if r.rel_id == rel_id), None)
+        for rel_id in diag.relationships:
+            rel = self.get_relationship(rel_id)
             if rel and rel.phase in match:
                 rel.phase = phase
-        for obj in getattr(diag, "objects", []):
+        for obj in diag.objects:
             if obj.get("phase") in match:
                 obj["phase"] = phase
-        for conn in getattr(diag, "connections", []):
+        for conn in diag.connections:
             if conn.get("phase") in match:
                 conn["phase"] = phase
 
@@ -859,8 +1317,7 @@ class SysMLRepository:
         if self.active_phase == old:
             self.active_phase = new
         if old in self.reuse_phases:
-            self.reuse_phases.remove(old)
-            self.reuse_phases.add(new)
+            self.reuse_phases = (self.reuse_phases - {old}) | {new}
         for elem in self.elements.values():
             if elem.phase == old:
                 elem.phase = new
@@ -877,38 +1334,26 @@ class SysMLRepository:
                 if conn.get("phase") == old:
                     conn["phase"] = new
 
-    def element_read_only(self, elem_id: str) -> bool:
-        """Return ``True`` if ``elem_id`` originates from a reused phase or work product."""
-        elem = self.elements.get(elem_id)
-        if not elem:
-            return False
-        if self.active_phase is None or elem.phase is None:
-            return False
-        if elem.phase != self.active_phase and elem.phase in getattr(self, "reuse_phases", set()):
-            return True
-        linked = self.get_linked_diagram(elem_id)
-        if linked:
-            diag = self.diagrams.get(linked)
-            if diag and diag.diag_type in getattr(self, "reuse_products", set()):
-                return True
-        return False
-
     def visible_elements(self) -> dict[str, SysMLElement]:
         """Return mapping of element IDs to elements visible in the active phase."""
+        if self.active_phase is None:
+            return dict(self.elements)
         return {eid: e for eid, e in self.elements.items() if self.element_visible(eid)}
 
     def visible_diagrams(self) -> dict[str, SysMLDiagram]:
         """Return mapping of diagram IDs to diagrams visible in the active phase."""
+        if self.active_phase is None:
+            return dict(self.diagrams)
         return {did: d for did, d in self.diagrams.items() if self.diagram_visible(did)}
 
     def object_visible(self, obj: dict, diag_id: Optional[str] = None) -> bool:
         """Return True if a diagram object should be visible in the active phase."""
         diag = self.diagrams.get(diag_id) if diag_id else None
-        if diag and ("safety-management" in getattr(diag, "tags", []) or diag.diag_type in getattr(self, "reuse_products", set())):
+        if diag and ("safety-management" in diag.tags or diag.diag_type in self.reuse_products):
             return True
         if self.active_phase is None:
             return True
-        if obj.get("phase") == self.active_phase or obj.get("phase") in getattr(self, "reuse_phases", set()):
+        if obj.get("phase") == self.active_phase or obj.get("phase") in self.reuse_phases:
             return True
         if obj.get("phase") in (None, GLOBAL_PHASE):
             elem = self.elements.get(obj.get("element_id"))
@@ -918,57 +1363,121 @@ class SysMLRepository:
     def connection_visible(self, conn: dict, diag_id: Optional[str] = None) -> bool:
         """Return True if a diagram connection should be visible in the active phase."""
         diag = self.diagrams.get(diag_id) if diag_id else None
-        if diag and ("safety-management" in getattr(diag, "tags", []) or diag.diag_type in getattr(self, "reuse_products", set())):
+        if diag and ("safety-management" in diag.tags or diag.diag_type in self.reuse_products):
             return True
         if self.active_phase is None:
             return True
-        if conn.get("phase") == self.active_phase or conn.get("phase") in getattr(self, "reuse_phases", set()):
+        if conn.get("phase") == self.active_phase or conn.get("phase") in self.reuse_phases:
             return True
         if conn.get("phase") in (None, GLOBAL_PHASE):
             return True
         return False
 
+    def _phase_unrestricted(self, diag: SysMLDiagram) -> bool:
+        """Return ``True`` if every object of *diag* is visible regardless of phase."""
+        return (
+            self.active_phase is None
+            or "safety-management" in diag.tags
+            or diag.diag_type in self.reuse_products
+        )
+
+    def _select_visible_objects(self, diag: SysMLDiagram, objects: list[dict]) -> list[dict]:
+        """Bulk form of :meth:`object_visible` for all *objects* of *diag*.
+
+        The diagram level checks are evaluated once instead of per object.
+        """
+        if self._phase_unrestricted(diag):
+            return list(objects)
+        phases = self.reuse_phases | {self.active_phase}
+        elements = self.elements
+        element_visible = self.element_visible
+        visible = []
+        for obj, phase in zip(objects, map(_phase_of, objects)):
+            if phase in phases:
+                visible.append(obj)
+            elif phase is None or phase == GLOBAL_PHASE:
+                elem = elements.get(obj.get("element_id"))
+                if elem is None or element_visible(elem.elem_id):
+                    visible.append(obj)
+        return visible
+
+    def _select_visible_connections(self, diag: SysMLDiagram, conns: list[dict]) -> list[dict]:
+        """Bulk form of :meth:`connection_visible` for all *conns* of *diag*."""
+        if self._phase_unrestricted(diag):
+            return list(conns)
+        phases = self.reuse_phases | {self.active_phase, None, GLOBAL_PHASE}
+        # Project the phase column once and select with a boolean mask so the
+        # whole filter runs without a per-connection Python frame.
+        return list(compress(conns, map(phases.__contains__, map(_phase_of, conns))))
+
     def visible_objects(self, diag_id: str) -> list[dict]:
         """Return list of objects in diagram ``diag_id`` visible in the active phase."""
         diag = self.diagrams.get(diag_id)
         if not diag:
             return []
-        return [o for o in getattr(diag, "objects", []) if self.object_visible(o, diag_id)]
+        return self._select_visible_objects(diag, diag.objects)
 
     def visible_connections(self, diag_id: str) -> list[dict]:
         """Return list of connections in diagram ``diag_id`` visible in the active phase."""
         diag = self.diagrams.get(diag_id)
         if not diag:
             return []
-        return [c for c in getattr(diag, "connections", []) if self.connection_visible(c, diag_id)]
+        return self._select_visible_connections(diag, diag.connections)
 
     # ------------------------------------------------------------
     # Diagram linkage helpers
     # ------------------------------------------------------------
     def link_diagram(self, elem_id: str, diag_id: Optional[str], record_undo: bool = True) -> None:
         """Associate an element with a diagram implementing it."""
+        old = self.element_diagrams.get(elem_id)
+        if old == diag_id:
+            return
         if record_undo:
             self.push_undo_state()
+        if old:
+            linked = self._diagram_elements.get(old)
+            if linked:
+                linked.pop(elem_id, None)
+                if not linked:
+                    del self._diagram_elements[old]
         if diag_id:
             self.element_diagrams[elem_id] = diag_id
+            self._diagram_elements.setdefault(diag_id, {})[elem_id] = None
         else:
             self.element_diagrams.pop(elem_id, None)
 
     def get_linked_diagram(self, elem_id: str) -> Optional[str]:
         return self.element_diagrams.get(elem_id)
 
+    def get_linking_elements(self, diag_id: str) -> set[str]:
+        """Return IDs of elements whose implementation is diagram ``diag_id``."""
+        return set(self._diagram_elements.get(diag_id, ()))
+
+    def get_linking_element(self, diag_id: str) -> Optional[str]:
+        """Return the first element whose implementation is ``diag_id``."""
+        return next(iter(self._diagram_elements.get(diag_id, ())), None)
+
+    def _rebuild_diagram_links(self) -> None:
+        """Recompute the diagram -> elements inverse of ``element_diagrams``."""
+        self._diagram_elements = {}
+        for elem_id, diag_id in self.element_diagrams.items():
+            self._diagram_elements.setdefault(diag_id, {})[elem_id] = None
+
     def serialize(self) -> str:
-        data = {
-            "elements": [asdict(elem) for elem in self.elements.values()],
-            "relationships": [asdict(rel) for rel in self.relationships],
-            "diagrams": [asdict(diag) for diag in self.diagrams.values()],
-            "element_diagrams": self.element_diagrams,
-        }
-        return json.dumps(data, indent=2)
+        return _dumps(self.to_dict())
 
     def to_dict(self) -> dict:
-        """Return a dictionary representation of the repository."""
-        return json.loads(self.serialize())
+        """Return a dictionary representation of the repository.
+
+        The result shares no mutable containers with the live model, so it
+        can be stored directly as an undo snapshot.
+        """
+        return {
+            "elements": [elem.to_dict() for elem in self.elements.values()],
+            "relationships": [rel.to_dict() for rel in self.relationships],
+            "diagrams": [diag.to_dict() for diag in self.diagrams.values()],
+            "element_diagrams": dict(self.element_diagrams),
+        }
 
     def from_dict(self, data: dict) -> None:
         """Load repository contents from a dictionary."""
@@ -978,18 +1487,23 @@ class SysMLRepository:
         for e in data.get("elements", []):
             elem = SysMLElement(**e)
             self.elements[elem.elem_id] = elem
+        self._type_index = None
+        self._name_index = None
         for r in data.get("relationships", []):
             rel = SysMLRelationship(**r)
             self.relationships.append(rel)
+        self._rel_index = None
         for d in data.get("diagrams", []):
             diag = SysMLDiagram(**d)
             self.diagrams[diag.diag_id] = diag
         self.element_diagrams = data.get("element_diagrams", {})
-        self.root_package = None
-        for elem in self.elements.values():
-            if elem.elem_type == "Package" and elem.owner is None:
-                self.root_package = elem
-                break
+        self._rebuild_diagram_links()
+        self._normalize_object_requirements()
+        self._intern_model_strings()
+        packages = self._elements_by_type().get("Package", {})
+        self.root_package = next(
+            (elem for elem in packages.values() if elem.owner is None), None
+        )
         if self.root_package is None:
             self.root_package = self.create_element("Package", name="Root")
 
@@ -997,64 +1511,154 @@ class SysMLRepository:
 
     def _resolve_part_definition_ids(self) -> None:
         """Ensure part definitions reference block IDs instead of names."""
-        name_map = {
-            e.name: e.elem_id
-            for e in self.elements.values()
-            if e.elem_type == "Block" and e.name
-        }
-        for elem in self.elements.values():
-            if elem.elem_type != "Part":
-                continue
+        elements = self.elements
+        by_type = self._elements_by_type()
+        # property dicts of parts whose definition is not an element id
+        pending = []
+        for elem in by_type.get("Part", {}).values():
             def_val = elem.properties.get("definition")
-            if def_val and def_val not in self.elements:
-                mapped = name_map.get(def_val)
-                if mapped:
-                    elem.properties["definition"] = mapped
+            if def_val and def_val not in elements:
+                pending.append(elem.properties)
         for diag in self.diagrams.values():
-            for obj in getattr(diag, "objects", []):
+            for obj in diag.objects:
                 if obj.get("obj_type") != "Part":
                     continue
-                def_val = obj.get("properties", {}).get("definition")
-                if def_val and def_val not in self.elements:
-                    mapped = name_map.get(def_val)
-                    if mapped:
-                        obj.setdefault("properties", {})["definition"] = mapped
+                props = obj.get("properties")
+                if props:
+                    def_val = props.get("definition")
+                    if def_val and def_val not in elements:
+                        pending.append(props)
+        if not pending:
+            return
+        name_map = {
+            e.name: e.elem_id for e in by_type.get("Block", {}).values() if e.name
+        }
+        for props in pending:
+            mapped = name_map.get(props["definition"])
+            if mapped:
+                props["definition"] = mapped
+
+    def _intern_model_strings(self) -> None:
+        """Intern phase and object type strings of all loaded model data.
+
+        Type names and phases come from a small vocabulary but JSON decoding
+        creates a fresh string for every occurrence. Interning makes equal
+        values share one object so equality and set membership tests in the
+        visibility and requirement helpers succeed on identity. Element,
+        relationship and diagram types are interned on construction.
+        """
+        for elem in self.elements.values():
+            elem.phase = _intern(elem.phase)
+        for rel in self.relationships:
+            rel.phase = _intern(rel.phase)
+        for diag in self.diagrams.values():
+            diag.phase = _intern(diag.phase)
+            for item in diag.objects:
+                if "obj_type" in item:
+                    item["obj_type"] = _intern(item["obj_type"])
+                if "phase" in item:
+                    item["phase"] = _intern(item["phase"])
+            for item in diag.connections:
+                if "phase" in item:
+                    item["phase"] = _intern(item["phase"])
+
+    def _normalize_object_requirements(self) -> None:
+        """Store every diagram object requirement as a ``{"id": ...}`` dict.
+
+        Older models recorded bare requirement IDs; normalising them on load
+        lets lookups read ``req.get("id")`` without type checks.
+        """
+        for diag in self.diagrams.values():
+            for obj in diag.objects:
+                reqs = obj.get("requirements")
+                if reqs and not all(isinstance(r, dict) for r in reqs):
+                    obj["requirements"] = [
+                        r if isinstance(r, dict) else {"id": r} for r in reqs
+                    ]
+
+    def _requirement_objects(self):
+        """Yield ``(req_id, diagram, obj)`` once per requirement on each object."""
+        for diag in self.diagrams.values():
+            for obj in diag.objects:
+                seen: set[str] = set()
+                for req in obj.get("requirements", []):
+                    rid = req.get("id")
+                    if rid in seen:
+                        continue
+                    seen.add(rid)
+                    yield rid, diag, obj
+
+    def requirement_allocations(self) -> Dict[str, List[Tuple[str, int]]]:
+        """Return mapping of requirement IDs to ``(diagram_id, obj_id)`` pairs.
+
+        The reverse index is built in a single pass over all diagram objects so
+        callers resolving many requirements avoid one full scan per lookup.
+        """
+        index: Dict[str, List[Tuple[str, int]]] = {}
+        for rid, diag, obj in self._requirement_objects():
+            index.setdefault(rid, []).append((diag.diag_id, obj.get("obj_id")))
+        return index
+
+    def requirement_trace_labels(self) -> Dict[str, List[str]]:
+        """Return requirement IDs mapped to sorted ``"diagram:object"`` labels.
+
+        Used for the *Trace* column of requirement tables, which is filled for
+        every requirement at once.
+        """
+        labels: Dict[str, set[str]] = {}
+        for rid, diag, obj in self._requirement_objects():
+            dname = diag.name or diag.diag_id
+            oname = obj.get("properties", {}).get("name", obj.get("obj_type"))
+            labels.setdefault(rid, set()).add(f"{dname}:{oname}")
+        return {rid: sorted(names) for rid, names in labels.items()}
 
     def find_requirements(self, req_id: str) -> List[Tuple[str, int]]:
         """Return list of (diagram_id, obj_id) where ``req_id`` is allocated."""
         matches: List[Tuple[str, int]] = []
         for diag_id, diag in self.diagrams.items():
-            for obj in getattr(diag, "objects", []):
+            for obj in diag.objects:
                 for req in obj.get("requirements", []):
-                    rid = req.get("id") if isinstance(req, dict) else req
-                    if rid == req_id:
+                    if req.get("id") == req_id:
                         matches.append((diag_id, obj.get("obj_id")))
                         break
         return matches
 
+    def object_display_name(self, obj: dict) -> str:
+        """Return the label used for diagram object *obj* in generated text.
+
+        The object's own ``name`` property wins, followed by the name of the
+        linked element and finally the object identifier.
+        """
+        props = obj.get("properties")
+        name = props.get("name") if props else None
+        if not name:
+            elem = self.elements.get(obj.get("element_id"))
+            name = elem.name if elem else ""
+        return name or str(obj.get("obj_id"))
+
     def get_activity_actions(self) -> list[str]:
         """Return all action names and activity diagram names."""
-        names = []
+        names: set[str] = set()
+        add = names.add
+        elements = self.elements
         for diag in self.diagrams.values():
-            if diag.diag_type != "Activity Diagram":
+            if diag.diag_type != _ACTIVITY_DIAGRAM:
                 continue
             if diag.name:
-                names.append(diag.name)
+                add(diag.name)
             for obj in diag.objects:
                 typ = obj.get("obj_type") or obj.get("type")
-                if typ in ("Action Usage", "Action", "CallBehaviorAction"):
+                if typ in _ACTION_TYPES:
                     name = obj.get("properties", {}).get("name", "")
-                    elem_id = obj.get("element_id")
-                    if not name and elem_id in self.elements:
-                        name = self.elements[elem_id].name
+                    if not name and (elem := elements.get(obj.get("element_id"))):
+                        name = elem.name
                     if name:
-                        names.append(name)
-            for elem_id in getattr(diag, "elements", []):
-                elem = self.elements.get(elem_id)
-                if elem and elem.elem_type in ("Action Usage", "Action", "CallBehaviorAction"):
-                    if elem.name:
-                        names.append(elem.name)
-        return sorted(set(n for n in names if n))
+                        add(name)
+            for elem_id in diag.elements:
+                elem = elements.get(elem_id)
+                if elem and elem.elem_type in _ACTION_TYPES and elem.name:
+                    add(elem.name)
+        return sorted(names)
 
     # ------------------------------------------------------------
     def generate_requirements(
@@ -1067,8 +1671,9 @@ class SysMLRepository:
         diag_id:
             Identifier of the diagram to process.
         _visited:
-            Internal set used to avoid infinite recursion when activity
-            diagrams reference each other via ``CallBehaviorAction`` objects.
+            Internal set of already expanded diagrams used to avoid cycles
+            when activity diagrams reference each other via
+            ``CallBehaviorAction`` objects.
 
         Returns
         -------
@@ -1080,51 +1685,65 @@ class SysMLRepository:
             connected is produced.
         """
 
+        return list(self.iter_requirements(diag_id, _visited))
+
+    def iter_requirements(
+        self, diag_id: str, _visited: set[str] | None = None
+    ) -> Iterator[tuple[str, str]]:
+        """Yield the requirements of :meth:`generate_requirements` lazily.
+
+        Requirements of called activities are produced as their
+        ``CallBehaviorAction`` is reached, so only the caller decides whether
+        the results are materialised.
+        """
+
         if _visited is None:
             _visited = set()
-        if diag_id in _visited:
-            return []
-        _visited.add(diag_id)
 
-        diag = self.diagrams.get(diag_id)
-        if not diag:
-            return []
+        # Explicit stack of (diagram, remaining objects, id -> name) frames.
+        # A called activity is expanded as soon as its CallBehaviorAction is
+        # reached, matching the order of the former recursive traversal.
+        frames: list[tuple[SysMLDiagram, Any, dict[int, str]]] = []
 
-        reqs: list[tuple[str, str]] = []
-
-        # Map object ids to human readable names for requirement text.
-        id_to_name: dict[int, str] = {}
-        for obj in getattr(diag, "objects", []):
-            obj_id = obj.get("obj_id")
-            name = obj.get("properties", {}).get("name") or ""
-            elem_id = obj.get("element_id")
-            if not name and elem_id in self.elements:
-                name = self.elements[elem_id].name
-            if not name:
-                name = str(obj_id)
-            id_to_name[obj_id] = name
-
-            # Recursively include requirements from called activities.
-            if (
-                diag.diag_type == "Activity Diagram"
-                and obj.get("obj_type") == "CallBehaviorAction"
-            ):
-                beh_id = obj.get("properties", {}).get("behavior")
-                if beh_id:
-                    reqs.extend(self.generate_requirements(beh_id, _visited))
-
-        for conn in getattr(diag, "connections", []):
-            src = id_to_name.get(conn.get("src"))
-            dst = id_to_name.get(conn.get("dst"))
-            if not src or not dst:
-                continue
-            if diag.diag_type == "Activity Diagram":
-                text = f"{src} shall precede {dst}."
-                req_type = "vehicle"
-            else:
-                text = f"{src} shall be connected to {dst}."
-                req_type = "functional"
-            reqs.append((text, req_type))
+        def enter(did: str) -> bool:
+            if did in _visited:
+                return False
+            _visited.add(did)
+            diag = self.diagrams.get(did)
+            if not diag:
+                return False
+            frames.append((diag, iter(diag.objects), {}))
+            return True
 
-        return reqs
+        object_name = self.object_display_name
+        enter(diag_id)
+        while frames:
+            diag, objects, id_to_name = frames[-1]
+            is_activity = diag.diag_type == _ACTIVITY_DIAGRAM
+            descended = False
+            # Map object ids to human readable names for requirement text.
+            for obj in objects:
+                id_to_name[obj.get("obj_id")] = object_name(obj)
+
+                # Include requirements from called activities first.
+                if is_activity and obj.get("obj_type") == _CALL_BEHAVIOR_ACTION:
+                    beh_id = obj.get("properties", {}).get("behavior")
+                    if beh_id and enter(beh_id):
+                        descended = True
+                        break
+            if descended:
+                continue
+            frames.pop()
 
+            for conn in diag.connections:
+                src = id_to_name.get(conn.get("src"))
+                dst = id_to_name.get(conn.get("dst"))
+                if not src or not dst:
+                    continue
+                if is_activity:
+                    text = f"{src} shall precede {dst}."
+                    req_type = "vehicle"
+                else:
+                    text = f"{src} shall be connected to {dst}."
+                    req_type = "functional"
+                yield text, req_type
@@ -17,31 +17,101 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 # Author: Miguel Marina <karel.capek.robotics@gmail.com>
+import json
 import re
 import os
 
+# Class openings, owned attributes and packagedElement closings in document
+# order so the XMI is scanned once. The file is not well-formed XML (comment
+# bodies contain raw markup), which rules out an XML pull parser.
+_XMI_TOKEN_PATTERN = re.compile(
+    r'<packagedElement[^>]*xmi:type="uml:Class"[^>]*name="([^"]+)"'
+    r'|<ownedAttribute[^>]*name="([^"]+)"'
+    r'|</packagedElement>'
+)
+
+
+# Bump whenever the parsing below changes what it extracts; caches written
+# for another version or token pattern are ignored and rebuilt.
+_CACHE_VERSION = 1
+_CACHE_KEY = f"{_CACHE_VERSION}:{_XMI_TOKEN_PATTERN.pattern}"
+
+_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'automl',
+)
+
+
+def _read_cached_properties(path, cache_path):
+    """Return properties cached for *path* or ``None`` when stale/missing."""
+    try:
+        if os.path.getmtime(cache_path) < os.path.getmtime(path):
+            return None
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get('key') != _CACHE_KEY
+        or data.get('source') != os.path.abspath(path)
+    ):
+        return None
+    props = data.get('properties')
+    return props if isinstance(props, dict) else None
+
+
+def _write_cached_properties(path, cache_path, props):
+    """Store *props* parsed from *path*; unwritable caches are skipped."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    data = {'key': _CACHE_KEY, 'source': os.path.abspath(path), 'properties': props}
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _parse_xmi_properties(text):
+    """Return ``{class name: [attribute names]}`` parsed from XMI *text*."""
+    start = text.find('<xmi:XMI')
+    if start == -1:
+        return None
+    props = {}
+    # Classes whose attributes are collected until the next closing tag
+    open_classes = []
+    for m in _XMI_TOKEN_PATTERN.finditer(text, start):
+        class_name, attr_name = m.group(1, 2)
+        if class_name is not None:
+            open_classes.append((class_name, []))
+        elif attr_name is not None:
+            for _name, attrs in open_classes:
+                attrs.append(attr_name)
+        else:
+            for name, attrs in open_classes:
+                props[name] = attrs
+            open_classes.clear()
+    return props
+
 
 def load_sysml_properties():
     path = os.path.join(os.path.dirname(__file__), 'SysML.xmi')
     if not os.path.exists(path):
         return {}
+    cache_path = os.path.join(_CACHE_DIR, 'SysML.xmi.properties.json')
+    props = _read_cached_properties(path, cache_path)
+    if props is not None:
+        return props
     with open(path, 'r', encoding='utf-8') as f:
-        text = f.read()
-    start = text.find('<xmi:XMI')
-    if start == -1:
+        props = _parse_xmi_properties(f.read())
+    if props is None:
         return {}
-    text = text[start:]
-    class_pattern = re.compile(r'<packagedElement[^>]*xmi:type="uml:Class"[^>]*name="([^"]+)"')
-    attr_pattern = re.compile(r'<ownedAttribute[^>]*name="([^"]+)"')
-    props = {}
-    for m in class_pattern.finditer(text):
-        name = m.group(1)
-        end = text.find('</packagedElement>', m.end())
-        if end == -1:
-            continue
-        block = text[m.end():end]
-        attrs = attr_pattern.findall(block)
-        props[name] = attrs
+    _write_cached_properties(path, cache_path, props)
     return props
 
 SYSML_PROPERTIES = load_sysml_properties()
@@ -333,7 +333,7 @@ class TreeSubApp:
                 )
                 app.safety_mgmt_toolbox.rename_document(analysis, old, node.name)
         elif kind == "pkg" and repo.elements.get(ident):
-            repo.elements[ident].name = new
+            repo.rename_element(ident, new)
         app.update_views()
         if hasattr(app, "_arch_window") and app._arch_window.winfo_exists():
             app._arch_window.populate()
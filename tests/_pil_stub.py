@@ -0,0 +1,40 @@
+# Author: Miguel Marina <karel.capek.robotics@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 Capek System Safety & Robotic Solutions
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Placeholder Pillow modules so AutoML can be imported without Pillow."""
+
+import sys
+import types
+
+PIL_MODULES = ("PIL", "PIL.Image", "PIL.ImageDraw", "PIL.ImageFont", "PIL.ImageTk")
+
+
+def install() -> None:
+    """Register empty ``PIL`` modules when Pillow is not installed.
+
+    Real Pillow is left untouched so tests exercising image output keep
+    using it whenever it is available.
+    """
+    try:
+        import PIL.Image  # noqa: F401
+        import PIL.ImageDraw  # noqa: F401
+        import PIL.ImageFont  # noqa: F401
+        import PIL.ImageTk  # noqa: F401
+    except ImportError:
+        for name in PIL_MODULES:
+            sys.modules.setdefault(name, types.ModuleType(name))
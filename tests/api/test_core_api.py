@@ -17,12 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """Tests for the core DLL API bindings."""
 
-import sys
-from pathlib import Path
-
-ROOT = Path(__file__).resolve().parents[2]
-sys.path.insert(0, str(ROOT))
-
 from mainappsrc.api import api
 
 add = api.add
@@ -0,0 +1,68 @@
+# Author: Miguel Marina <karel.capek.robotics@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 Capek System Safety & Robotic Solutions
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Session-wide test setup shared by all test modules."""
+
+import os
+import sys
+
+import pytest
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Make the repository root importable once for every test module.
+sys.path.insert(0, _REPO_ROOT)
+
+from _pil_stub import install as _install_pil_stub
+
+# Runs when pytest loads this file, i.e. before any test module is imported,
+# so module-level ``from AutoML import ...`` statements find Pillow or its
+# placeholder regardless of collection order.
+_install_pil_stub()
+
+
+@pytest.fixture(scope="session")
+def diagram_rules_cfg():
+    """Parsed ``config/rules/diagram_rules.json``, loaded once per session.
+
+    Tests must treat the returned mapping as read-only.
+    """
+    from config import load_diagram_rules
+
+    return load_diagram_rules(
+        os.path.join(_REPO_ROOT, "config", "rules", "diagram_rules.json")
+    )
+
+
+@pytest.fixture(scope="session")
+def tk_session_root():
+    """Hidden Tk root shared by GUI tests that only need a widget master.
+
+    Tests parent their widgets to it and destroy those widgets themselves.
+    Tests that detach tabs or tear windows down should keep creating their
+    own ``tk.Tk()`` instead.
+    """
+    import tkinter as tk
+
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("Tk not available")
+    root.withdraw()
+    yield root
+    root.destroy()
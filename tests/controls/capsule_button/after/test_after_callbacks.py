@@ -22,10 +22,6 @@ from __future__ import annotations
 
 import os
 import tkinter as tk
-import pathlib
-import sys
-
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[4]))
 
 import pytest
 
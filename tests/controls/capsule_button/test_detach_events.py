@@ -18,14 +18,10 @@
 
 """Event handling tests for :class:`CapsuleButton` after detachment."""
 
-import pathlib
-import sys
 import tkinter as tk
 
 import pytest
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[3]))
-
 from gui.controls.capsule_button import CapsuleButton
 
 
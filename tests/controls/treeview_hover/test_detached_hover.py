@@ -19,14 +19,11 @@
 """Regression tests for Treeview hover highlight after tab detachment."""
 
 import os
-import sys
-from pathlib import Path
 import tkinter as tk
 from tkinter import ttk
 
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[3]))
 from gui.controls.button_utils import enable_listbox_hover_highlight
 from gui.utils.closable_notebook import ClosableNotebook
 
@@ -25,7 +25,6 @@ from tkinter import ttk
 import pytest
 
 root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-sys.path.append(root_dir)
 sys.path.append(os.path.join(root_dir, "gui", "controls"))
 sys.path.append(os.path.join(root_dir, "gui", "utils"))
 from capsule_button import CapsuleButton
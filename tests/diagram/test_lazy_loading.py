@@ -18,11 +18,6 @@
 
 """Tests for lazy diagram element loading."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 from mainappsrc.core.diagram_renderer import DiagramRenderer
 
 
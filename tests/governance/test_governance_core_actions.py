@@ -17,58 +17,68 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import types
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[2]))
+import pytest
 
 from gui.architecture import GovernanceDiagramWindow
 from gui import architecture
 
 
-def test_governance_core_has_add_buttons(monkeypatch):
-    class DummyFrame:
-        def __init__(self, master=None, text=None):
-            self.master = master
-            self.text = text
-            self.children = []
-            if master and hasattr(master, "children"):
-                master.children.append(self)
+class DummyFrame:
+    def __init__(self, master=None, text=None):
+        self.master = master
+        self.text = text
+        self.children = []
+        if master and hasattr(master, "children"):
+            master.children.append(self)
 
-        def pack(self, *args, **kwargs):
-            pass
+    def pack(self, *args, **kwargs):
+        pass
 
-        def pack_forget(self, *args, **kwargs):
-            pass
+    def pack_forget(self, *args, **kwargs):
+        pass
 
-        def destroy(self, *args, **kwargs):
-            pass
+    def destroy(self, *args, **kwargs):
+        pass
 
-    class DummyButton:
-        def __init__(self, master=None, text="", image=None, compound=None, command=None):
-            self.master = master
-            self.text = text
-            self.command = command
-            if master and hasattr(master, "children"):
-                master.children.append(self)
 
-        def pack(self, *args, **kwargs):
-            pass
+class DummyButton:
+    def __init__(self, master=None, text="", image=None, compound=None, command=None):
+        self.master = master
+        self.text = text
+        self.command = command
+        if master and hasattr(master, "children"):
+            master.children.append(self)
 
-        def configure(self, **kwargs):
-            self.text = kwargs.get("text", self.text)
+    def pack(self, *args, **kwargs):
+        pass
 
-        def destroy(self):
-            pass
+    def configure(self, **kwargs):
+        self.text = kwargs.get("text", self.text)
 
-    class DummyTranslucidButton(DummyButton):
+    def destroy(self):
         pass
 
-    monkeypatch.setattr(architecture.ttk, "Frame", DummyFrame)
-    monkeypatch.setattr(architecture.ttk, "LabelFrame", DummyFrame)
-    monkeypatch.setattr(architecture.ttk, "Button", DummyButton)
-    monkeypatch.setattr(architecture, "TranslucidButton", DummyTranslucidButton)
 
+class DummyTranslucidButton(DummyButton):
+    pass
+
+
+_NOOP_SELECTOR = types.SimpleNamespace(configure=lambda **k: None)
+_CORE_TOOLBOX_VAR = types.SimpleNamespace(get=lambda: "Governance Core", set=lambda v: None)
+
+
+@pytest.fixture(scope="module")
+def dummy_widgets():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(architecture.ttk, "Frame", DummyFrame)
+        mp.setattr(architecture.ttk, "LabelFrame", DummyFrame)
+        mp.setattr(architecture.ttk, "Button", DummyButton)
+        mp.setattr(architecture, "TranslucidButton", DummyTranslucidButton)
+        yield
+
+
+def test_governance_core_has_add_buttons(dummy_widgets):
     win = GovernanceDiagramWindow.__new__(GovernanceDiagramWindow)
     toolbox = DummyFrame()
     toolbox.tk = True
@@ -76,11 +86,10 @@ def test_governance_core_has_add_buttons(monkeypatch):
     win.tools_frame = DummyFrame(toolbox)
     win.rel_frame = DummyFrame(toolbox)
     win._icon_for = lambda name: None
-    win.toolbox_selector = types.SimpleNamespace(configure=lambda **k: None)
-    win.toolbox_var = types.SimpleNamespace(get=lambda: "Governance Core", set=lambda v: None)
+    win.toolbox_selector = _NOOP_SELECTOR
+    win.toolbox_var = _CORE_TOOLBOX_VAR
     win._toolbox_frames = {}
     win._rebuild_toolboxes()
-    win._switch_toolbox()
     assert "Governance Core" in win._toolbox_frames
     core_frames = win._toolbox_frames["Governance Core"]
     assert win.rel_frame not in core_frames
@@ -113,26 +122,9 @@ def test_governance_core_present_without_nodes(monkeypatch):
     assert defs["Governance Core"]["nodes"] == []
 
 
-def test_rebuild_toolboxes_defers_initial_switch(monkeypatch):
+def test_rebuild_toolboxes_defers_initial_switch(dummy_widgets, monkeypatch):
     called = {}
 
-    class DummyFrame:
-        def __init__(self, master=None, text=None):
-            self.master = master
-            self.text = text
-            self.children = []
-            if master and hasattr(master, "children"):
-                master.children.append(self)
-
-        def pack(self, *args, **kwargs):
-            pass
-
-        def pack_forget(self, *args, **kwargs):
-            pass
-
-        def destroy(self, *args, **kwargs):
-            pass
-
     class DummyToolbox(DummyFrame):
         tk = True
 
@@ -140,39 +132,14 @@ def test_rebuild_toolboxes_defers_initial_switch(monkeypatch):
             called["delay"] = delay
             called["func"] = func
 
-    monkeypatch.setattr(architecture.ttk, "Frame", DummyFrame)
-    monkeypatch.setattr(architecture.ttk, "LabelFrame", DummyFrame)
-    class DummyButton:
-        def __init__(self, master=None, text="", image=None, compound=None, command=None):
-            self.master = master
-            self.text = text
-            self.command = command
-            if master and hasattr(master, "children"):
-                master.children.append(self)
-
-        def pack(self, *args, **kwargs):
-            pass
-
-        def configure(self, **kwargs):
-            self.text = kwargs.get("text", self.text)
-
-        def destroy(self):
-            pass
-
-    class DummyTranslucidButton(DummyButton):
-        pass
-
-    monkeypatch.setattr(architecture, "TranslucidButton", DummyTranslucidButton)
-    monkeypatch.setattr(architecture.ttk, "Button", DummyButton)
-
     win = GovernanceDiagramWindow.__new__(GovernanceDiagramWindow)
     toolbox = DummyToolbox()
     win.toolbox = toolbox
     win.tools_frame = DummyFrame(toolbox)
     win._toolbox_frames = {}
     win._frame_loaders = {}
-    win.toolbox_selector = types.SimpleNamespace(configure=lambda **k: None)
-    win.toolbox_var = types.SimpleNamespace(get=lambda: "Governance Core", set=lambda v: None)
+    win.toolbox_selector = _NOOP_SELECTOR
+    win.toolbox_var = _CORE_TOOLBOX_VAR
     monkeypatch.setattr(architecture, "_toolbox_defs", lambda: {})
     win._icon_for = lambda name: None
 
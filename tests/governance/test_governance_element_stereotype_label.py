@@ -17,28 +17,25 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import unittest
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from gui.architecture import SysMLDiagramWindow, SysMLObject
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
 
 
 class DummyFont:
-    def measure(self, text: str) -> int:
-        return len(text)
+    __slots__ = ()
+    measure = staticmethod(len)
 
     def metrics(self, name: str) -> int:
         return 1
 
 
 class DummyWindow:
+    __slots__ = ("repo", "zoom", "font", "diagram_id")
     _object_label_lines = SysMLDiagramWindow._object_label_lines
 
-    def __init__(self, diag_id):
-        self.repo = SysMLRepository.get_instance()
+    def __init__(self, repo, diag_id):
+        self.repo = repo
         self.zoom = 1.0
         self.font = DummyFont()
         self.diagram_id = diag_id
@@ -49,40 +46,36 @@ class DummyWindow:
 
 class GovernanceElementStereotypeTests(unittest.TestCase):
     def setUp(self):
-        SysMLRepository._instance = None
+        self.repo = SysMLRepository.reset_instance()
+        self.diag = self.repo.create_diagram("Governance Diagram")
 
     def test_task_label_includes_stereotype(self):
-        repo = SysMLRepository.get_instance()
-        diag = repo.create_diagram("Governance Diagram")
-        elem = repo.create_element("Action", name="Draft Plan")
+        elem = self.repo.create_element("Action", name="Draft Plan")
         obj = SysMLObject(1, "Action", 0.0, 0.0, element_id=elem.elem_id, properties={"name": "Draft Plan"})
-        win = DummyWindow(diag.diag_id)
+        win = DummyWindow(self.repo, self.diag.diag_id)
         lines = win._object_label_lines(obj)
         self.assertEqual("<<task>>", lines[0])
         self.assertEqual("Draft Plan", lines[1])
 
     def test_gateway_labels_hidden(self):
-        repo = SysMLRepository.get_instance()
-        diag = repo.create_diagram("Governance Diagram")
-        win = DummyWindow(diag.diag_id)
+        win = DummyWindow(self.repo, self.diag.diag_id)
         for idx, node_type in enumerate(["Decision", "Initial", "Final", "Merge"], start=1):
-            elem = repo.create_element(node_type, name="Gate")
-            obj = SysMLObject(
-                idx,
-                node_type,
-                0.0,
-                0.0,
-                element_id=elem.elem_id,
-                properties={"name": "Gate"},
-            )
-            lines = win._object_label_lines(obj)
-            self.assertEqual([], lines)
+            with self.subTest(node_type=node_type):
+                elem = self.repo.create_element(node_type, name="Gate")
+                obj = SysMLObject(
+                    idx,
+                    node_type,
+                    0.0,
+                    0.0,
+                    element_id=elem.elem_id,
+                    properties={"name": "Gate"},
+                )
+                lines = win._object_label_lines(obj)
+                self.assertEqual([], lines)
 
     def test_system_boundary_label_has_no_stereotype(self):
-        repo = SysMLRepository.get_instance()
-        diag = repo.create_diagram("Governance Diagram")
         obj = SysMLObject(1, "System Boundary", 0.0, 0.0, properties={"name": "Area"})
-        win = DummyWindow(diag.diag_id)
+        win = DummyWindow(self.repo, self.diag.diag_id)
         lines = win._object_label_lines(obj)
         self.assertEqual(["Area"], lines)
 
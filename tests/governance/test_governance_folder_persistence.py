@@ -19,11 +19,8 @@
 
 import importlib.util
 import os
-import sys
 import types
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 spec = importlib.util.spec_from_file_location(
     "analysis.safety_management",
     os.path.join(os.path.dirname(__file__), "..", "..", "analysis", "safety_management.py"),
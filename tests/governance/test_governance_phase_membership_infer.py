@@ -17,15 +17,13 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import tkinter as tk
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from analysis.safety_management import SafetyManagementToolbox, GovernanceModule
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
 from AutoML import AutoMLApp
 
+_TOOL_TO_WP = {info[1]: name for name, info in AutoMLApp.WORK_PRODUCT_INFO.items()}
+
 
 class DummyListbox:
     def __init__(self):
@@ -35,8 +33,8 @@ class DummyListbox:
     def get(self, *_):
         return self.items
 
-    def insert(self, index, item):
-        self.items.insert(index if isinstance(index, int) else len(self.items), item)
+    def insert(self, _index, item):
+        self.items.append(item)
 
     def itemconfig(self, index, foreground="black"):
         self.colors.append((index, foreground))
@@ -72,7 +70,7 @@ def test_repository_phase_enables_work_product():
     app.work_product_menus = {"GSN Argumentation": [(wp_menu, 0)], "GSN": [(parent_menu, 0)]}
     app.enabled_work_products = set()
     app.enable_process_area = lambda area: None
-    app.tool_to_work_product = {info[1]: name for name, info in AutoMLApp.WORK_PRODUCT_INFO.items()}
+    app.tool_to_work_product = _TOOL_TO_WP
     app.update_views = lambda: None
     app.safety_mgmt_toolbox = toolbox
     app.refresh_tool_enablement = AutoMLApp.refresh_tool_enablement.__get__(app, AutoMLApp)
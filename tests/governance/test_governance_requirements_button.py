@@ -19,6 +19,9 @@
 import types
 import sys
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
@@ -28,226 +31,187 @@ from gui import safety_management_toolbox as smt
 from analysis.models import global_requirements
 
 
-def test_requirements_button_opens_tab(monkeypatch):
-    repo = SysMLRepository.reset_instance()
-    diag = repo.create_diagram("Governance Diagram", name="Gov")
-    t1 = repo.create_element("Action", name="Start")
-    t2 = repo.create_element("Action", name="Finish")
-    diag.objects = [
-        {"obj_id": 1, "obj_type": "Action", "x": 0, "y": 0, "element_id": t1.elem_id, "properties": {"name": "Start"}},
-        {"obj_id": 2, "obj_type": "Action", "x": 0, "y": 0, "element_id": t2.elem_id, "properties": {"name": "Finish"}},
-    ]
-    diag.connections = [
-        {"src": 1, "dst": 2, "conn_type": "Flow", "name": "", "properties": {}}
-    ]
-
-    toolbox = SafetyManagementToolbox()
-    toolbox.diagrams["Gov"] = diag.diag_id
+class DummyTab:
+    def __init__(self):
+        self.children = []
 
-    class DummyTab:
-        def __init__(self):
-            self.children = []
+    def winfo_children(self):
+        return list(self.children)
 
-        def winfo_children(self):
-            return list(self.children)
 
-    tabs: list[tuple[str, DummyTab]] = []
+class DummyFrame:
+    def __init__(self, master):
+        self.master = master
+        self.children = []
+        master.children.append(self)
 
-    def _new_tab(title):
-        tab = DummyTab()
-        tabs.append((title, tab))
-        return tab
+    def winfo_children(self):
+        return list(self.children)
 
-    trees = []
+    def rowconfigure(self, *args, **kwargs):
+        pass
 
-    class DummyFrame:
-        def __init__(self, master):
-            self.master = master
-            self.children = []
-            master.children.append(self)
+    def columnconfigure(self, *args, **kwargs):
+        pass
 
-        def winfo_children(self):
-            return list(self.children)
+    def pack(self, **kwargs):
+        pass
 
-        def rowconfigure(self, *args, **kwargs):
-            pass
+    def destroy(self):
+        self.master.children.remove(self)
 
-        def columnconfigure(self, *args, **kwargs):
-            pass
 
-        def pack(self, **kwargs):
-            pass
+class DummyScrollbar:
+    def __init__(self, master, orient=None, command=None):
+        self.master = master
+        master.children.append(self)
 
-        def destroy(self):
-            self.master.children.remove(self)
+    def grid(self, *args, **kwargs):
+        pass
 
-    class DummyScrollbar:
-        def __init__(self, master, orient=None, command=None):
-            self.master = master
-            master.children.append(self)
+    def set(self, *args):
+        pass
 
-        def grid(self, *args, **kwargs):
-            pass
+    def destroy(self):
+        self.master.children.remove(self)
 
-        def set(self, *args):
-            pass
 
-        def destroy(self):
-            self.master.children.remove(self)
+class DummyTree:
+    def __init__(self, master, columns, show="headings"):
+        self.rows = []
+        master.children.append(self)
 
-    class DummyTree:
-        def __init__(self, master, columns, show="headings"):
-            self.rows = []
-            trees.append(self)
-            master.children.append(self)
+    def heading(self, col, text=""):
+        pass
 
-        def heading(self, col, text=""):
-            pass
+    def insert(self, parent, idx, values):
+        self.rows.append(values)
 
-        def insert(self, parent, idx, values):
-            self.rows.append(values)
+    def configure(self, **kwargs):
+        pass
 
-        def configure(self, **kwargs):
-            pass
+    def yview(self, *args):
+        pass
 
-        def yview(self, *args):
-            pass
+    def xview(self, *args):
+        pass
 
-        def xview(self, *args):
-            pass
+    def grid(self, *args, **kwargs):
+        pass
 
-        def grid(self, *args, **kwargs):
-            pass
-
-        def get_children(self):
-            return list(range(len(self.rows)))
-
-        def delete(self, *items):
-            self.rows = []
-
-    monkeypatch.setattr(smt.ttk, "Frame", DummyFrame)
-    monkeypatch.setattr(smt.ttk, "Scrollbar", DummyScrollbar)
-    monkeypatch.setattr(smt.ttk, "Treeview", DummyTree)
-
-    win = SafetyManagementWindow.__new__(SafetyManagementWindow)
-    win.toolbox = toolbox
-    win.app = types.SimpleNamespace(_new_tab=_new_tab)
-    win.diag_var = types.SimpleNamespace(get=lambda: "Gov")
-
-    global_requirements.clear()
-    win.generate_requirements()
+    def get_children(self):
+        return list(range(len(self.rows)))
 
-    assert tabs
-    title, _tab = tabs[0]
-    assert "Gov Requirements" in title
-    assert trees and trees[0].rows
-    texts = [row[2] for row in trees[0].rows]
-    assert any("Start (Action) shall precede 'Finish (Action)'." in t for t in texts)
-    # Ensure requirement types are organizational
-    assert all(row[1] == "organizational" for row in trees[0].rows)
-    assert all(row[4] == "draft" for row in trees[0].rows)
-    # Requirements added to global registry
-    assert len(global_requirements) == len(trees[0].rows)
-    assert all(req.get("diagram") == "Gov" for req in global_requirements.values())
+    def delete(self, *items):
+        self.rows = []
 
 
-def test_requirements_button_no_change(monkeypatch):
-    repo = SysMLRepository.reset_instance()
-    diag = repo.create_diagram("Governance Diagram", name="Gov")
-    t1 = repo.create_element("Action", name="Start")
-    t2 = repo.create_element("Action", name="Finish")
-    diag.objects = [
-        {"obj_id": 1, "obj_type": "Action", "x": 0, "y": 0, "element_id": t1.elem_id, "properties": {"name": "Start"}},
-        {"obj_id": 2, "obj_type": "Action", "x": 0, "y": 0, "element_id": t2.elem_id, "properties": {"name": "Finish"}},
-    ]
-    diag.connections = [
-        {"src": 1, "dst": 2, "conn_type": "Flow", "name": "", "properties": {}}
-    ]
+class DummyVar:
+    def __init__(self, value):
+        self.value = value
 
-    toolbox = SafetyManagementToolbox()
-    toolbox.diagrams["Gov"] = diag.diag_id
+    def get(self):
+        return self.value
 
-    class DummyTab:
-        def __init__(self):
-            self.children = []
+    def set(self, value):
+        self.value = value
 
-        def winfo_children(self):
-            return list(self.children)
 
-    def _new_tab(title):
-        return DummyTab()
+@pytest.fixture
+def collector():
+    """Record the tabs and trees the requirements window creates."""
+    ns = types.SimpleNamespace(tabs=[], trees=[])
 
-    class DummyFrame:
-        def __init__(self, master):
-            self.master = master
-            self.children = []
-            master.children.append(self)
+    def new_tab(title):
+        tab = DummyTab()
+        ns.tabs.append((title, tab))
+        return tab
 
-        def winfo_children(self):
-            return list(self.children)
+    def new_tree(*args, **kwargs):
+        tree = DummyTree(*args, **kwargs)
+        ns.trees.append(tree)
+        return tree
 
-        def rowconfigure(self, *args, **kwargs):
-            pass
+    ns.new_tab = new_tab
+    ns.new_tree = new_tree
+    return ns
 
-        def columnconfigure(self, *args, **kwargs):
-            pass
 
-        def pack(self, **kwargs):
-            pass
+@pytest.fixture
+def patch_ttk(collector):
+    with patch.multiple(
+        smt.ttk, Frame=DummyFrame, Scrollbar=DummyScrollbar, Treeview=collector.new_tree
+    ):
+        yield collector
 
-        def destroy(self):
-            self.master.children.remove(self)
 
-    class DummyScrollbar:
-        def __init__(self, master, orient=None, command=None):
-            self.master = master
-            master.children.append(self)
+def _make_objects(start, finish):
+    return [
+        {"obj_id": 1, "obj_type": "Action", "x": 0, "y": 0, "element_id": start.elem_id, "properties": {"name": "Start"}},
+        {"obj_id": 2, "obj_type": "Action", "x": 0, "y": 0, "element_id": finish.elem_id, "properties": {"name": "Finish"}},
+    ]
 
-        def grid(self, *args, **kwargs):
-            pass
 
-        def set(self, *args):
-            pass
+def _make_connections():
+    return [
+        {"src": 1, "dst": 2, "conn_type": "Flow", "name": "", "properties": {}}
+    ]
 
-        def destroy(self):
-            self.master.children.remove(self)
 
-    class DummyTree:
-        def __init__(self, master, columns, show="headings"):
-            self.rows = []
-            master.children.append(self)
+def _governance_toolbox(*names):
+    """Return a toolbox with one Start -> Finish governance diagram per name."""
+    repo = SysMLRepository.reset_instance()
+    t1 = repo.create_element("Action", name="Start")
+    t2 = repo.create_element("Action", name="Finish")
+    toolbox = SafetyManagementToolbox()
+    diagrams = []
+    for name in names:
+        diag = repo.create_diagram("Governance Diagram", name=name)
+        diag.objects = _make_objects(t1, t2)
+        diag.connections = _make_connections()
+        toolbox.diagrams[name] = diag.diag_id
+        diagrams.append(diag)
+    return toolbox, diagrams
 
-        def heading(self, col, text=""):
-            pass
 
-        def insert(self, parent, idx, values):
-            self.rows.append(values)
+@pytest.fixture
+def gov_toolbox():
+    toolbox, _diagrams = _governance_toolbox("Gov")
+    return toolbox
 
-        def configure(self, **kwargs):
-            pass
 
-        def yview(self, *args):
-            pass
+@pytest.fixture
+def gov_diagram_pair():
+    return _governance_toolbox("Gov1", "Gov2")
 
-        def xview(self, *args):
-            pass
 
-        def grid(self, *args, **kwargs):
-            pass
+def test_requirements_button_opens_tab(patch_ttk, gov_toolbox):
+    win = SafetyManagementWindow.__new__(SafetyManagementWindow)
+    win.toolbox = gov_toolbox
+    win.app = types.SimpleNamespace(_new_tab=patch_ttk.new_tab)
+    win.diag_var = types.SimpleNamespace(get=lambda: "Gov")
 
-        def get_children(self):
-            return list(range(len(self.rows)))
+    global_requirements.clear()
+    win.generate_requirements()
 
-        def delete(self, *items):
-            self.rows = []
+    assert patch_ttk.tabs
+    title, _tab = patch_ttk.tabs[0]
+    assert "Gov Requirements" in title
+    assert patch_ttk.trees and patch_ttk.trees[0].rows
+    texts = [row[2] for row in patch_ttk.trees[0].rows]
+    assert any("Start (Action) shall precede 'Finish (Action)'." in t for t in texts)
+    # Ensure requirement types are organizational
+    assert all(row[1] == "organizational" for row in patch_ttk.trees[0].rows)
+    assert all(row[4] == "draft" for row in patch_ttk.trees[0].rows)
+    # Requirements added to global registry
+    assert len(global_requirements) == len(patch_ttk.trees[0].rows)
+    assert all(req.get("diagram") == "Gov" for req in global_requirements.values())
 
-    monkeypatch.setattr(smt.ttk, "Frame", DummyFrame)
-    monkeypatch.setattr(smt.ttk, "Scrollbar", DummyScrollbar)
-    monkeypatch.setattr(smt.ttk, "Treeview", DummyTree)
 
+def test_requirements_button_no_change(patch_ttk, gov_toolbox):
     win = SafetyManagementWindow.__new__(SafetyManagementWindow)
-    win.toolbox = toolbox
-    win.app = types.SimpleNamespace(_new_tab=_new_tab)
+    win.toolbox = gov_toolbox
+    win.app = types.SimpleNamespace(_new_tab=patch_ttk.new_tab)
     win.diag_var = types.SimpleNamespace(get=lambda: "Gov")
 
     global_requirements.clear()
@@ -261,120 +225,24 @@ def test_requirements_button_no_change(monkeypatch):
     assert all(global_requirements[rid]["diagram"] == "Gov" for rid in rids)
 
 
-def test_other_diagram_requirements_preserved(monkeypatch):
-    repo = SysMLRepository.reset_instance()
-    diag1 = repo.create_diagram("Governance Diagram", name="Gov1")
-    diag2 = repo.create_diagram("Governance Diagram", name="Gov2")
-    t1 = repo.create_element("Action", name="Start")
-    t2 = repo.create_element("Action", name="Finish")
-    objs = [
-        {"obj_id": 1, "obj_type": "Action", "x": 0, "y": 0, "element_id": t1.elem_id, "properties": {"name": "Start"}},
-        {"obj_id": 2, "obj_type": "Action", "x": 0, "y": 0, "element_id": t2.elem_id, "properties": {"name": "Finish"}},
-    ]
-    conns = [
-        {"src": 1, "dst": 2, "conn_type": "Flow", "name": "", "properties": {}}
-    ]
-    diag1.objects = [dict(o) for o in objs]
-    diag1.connections = list(conns)
-    diag2.objects = [dict(o) for o in objs]
-    diag2.connections = list(conns)
-
-    toolbox = SafetyManagementToolbox()
-    toolbox.diagrams["Gov1"] = diag1.diag_id
-    toolbox.diagrams["Gov2"] = diag2.diag_id
-
-    class DummyTab:
-        def __init__(self):
-            self.children = []
-
-        def winfo_children(self):
-            return list(self.children)
-
-    def _new_tab(title):
-        return DummyTab()
-
-    class DummyFrame:
-        def __init__(self, master):
-            self.master = master
-            self.children = []
-            master.children.append(self)
-
-        def winfo_children(self):
-            return list(self.children)
-
-        def rowconfigure(self, *args, **kwargs):
-            pass
-
-        def columnconfigure(self, *args, **kwargs):
-            pass
-
-        def pack(self, **kwargs):
-            pass
-
-        def destroy(self):
-            self.master.children.remove(self)
-
-    class DummyScrollbar:
-        def __init__(self, master, orient=None, command=None):
-            self.master = master
-            master.children.append(self)
-
-        def grid(self, *args, **kwargs):
-            pass
-
-        def set(self, *args):
-            pass
-
-        def destroy(self):
-            self.master.children.remove(self)
-
-    class DummyTree:
-        def __init__(self, master, columns, show="headings"):
-            self.rows = []
-            master.children.append(self)
-
-        def heading(self, col, text=""):
-            pass
-
-        def insert(self, parent, idx, values):
-            self.rows.append(values)
-
-        def configure(self, **kwargs):
-            pass
-
-        def yview(self, *args):
-            pass
-
-        def xview(self, *args):
-            pass
-
-        def grid(self, *args, **kwargs):
-            pass
-
-        def get_children(self):
-            return list(range(len(self.rows)))
-
-        def delete(self, *items):
-            self.rows = []
-
-    monkeypatch.setattr(smt.ttk, "Frame", DummyFrame)
-    monkeypatch.setattr(smt.ttk, "Scrollbar", DummyScrollbar)
-    monkeypatch.setattr(smt.ttk, "Treeview", DummyTree)
+def test_other_diagram_requirements_preserved(patch_ttk, gov_diagram_pair):
+    toolbox, (diag1, _diag2) = gov_diagram_pair
 
     win = SafetyManagementWindow.__new__(SafetyManagementWindow)
     win.toolbox = toolbox
-    win.app = types.SimpleNamespace(_new_tab=_new_tab)
+    win.app = types.SimpleNamespace(_new_tab=patch_ttk.new_tab)
+
+    win.diag_var = DummyVar("Gov1")
 
     global_requirements.clear()
-    win.diag_var = types.SimpleNamespace(get=lambda: "Gov1")
     win.generate_requirements()
-    win.diag_var = types.SimpleNamespace(get=lambda: "Gov2")
+    win.diag_var.set("Gov2")
     win.generate_requirements()
     rids = set(global_requirements)
 
     # Move object in first diagram; requirements unchanged
     diag1.objects[0]["x"] = 10
-    win.diag_var = types.SimpleNamespace(get=lambda: "Gov1")
+    win.diag_var.set("Gov1")
     win.generate_requirements()
 
     assert len(global_requirements) == len(rids)
@@ -18,11 +18,9 @@
 
 import json
 import warnings
-from pathlib import Path
 import sys
 import types
 
-sys.path.append(str(Path(__file__).resolve().parents[2]))
 import mainappsrc  # type: ignore
 import mainappsrc.ui  # type: ignore
 ui_stub = types.ModuleType("mainappsrc.ui.app_lifecycle_ui")
@@ -19,10 +19,6 @@
 
 import copy
 import types
-from pathlib import Path
-import sys
-
-sys.path.append(str(Path(__file__).resolve().parents[2]))
 
 import gui.architecture as arch
 from gui.architecture import GovernanceDiagramWindow
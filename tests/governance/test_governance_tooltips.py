@@ -20,11 +20,12 @@ import sys
 import types
 from pathlib import Path
 
+import pytest
+
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from gui.architecture import SysMLDiagramWindow, SysMLObject
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
-from config import load_diagram_rules
 
 
 class DummyCanvas:
@@ -38,6 +39,9 @@ class DummyCanvas:
         pass
 
 
+_CANVAS = DummyCanvas()
+
+
 class DummyTip:
     def __init__(self, widget, text, automatic=False):
         self.text = text
@@ -49,48 +53,75 @@ class DummyTip:
         pass
 
 
-def _expected_text(cfg, node_type: str) -> str:
+def _index_rules(cfg):
+    """Invert the governance rules into per-node outgoing/incoming maps."""
     rules = cfg["connection_rules"]["Governance Diagram"]
-    outgoing = {}
-    incoming = {}
+    outgoing_by_node = {}
+    incoming_by_node = {}
     for rel, srcs in rules.items():
-        targets = srcs.get(node_type, [])
-        if targets:
-            outgoing[rel] = sorted(targets)
         for src, dests in srcs.items():
-            if node_type in dests:
-                incoming.setdefault(rel, []).append(src)
-    if not outgoing and not incoming:
-        return ""
-
-    rows = []
-    for rel in sorted(set(outgoing) | set(incoming)):
-        outs = ", ".join(outgoing.get(rel, []))
-        ins = ", ".join(sorted(incoming.get(rel, [])))
-        rows.append((rel, outs, ins))
-
-    headers = ("Relation", "To Others", "From Others")
-    col_widths = [
-        max(len(row[i]) for row in rows + [headers]) for i in range(3)
-    ]
-    lines = [
-        " | ".join(h.ljust(col_widths[i]) for i, h in enumerate(headers)),
-        "-+-".join("-" * col_widths[i] for i in range(3)),
+            if dests:
+                outgoing_by_node.setdefault(src, {})[rel] = sorted(dests)
+            for dst in dict.fromkeys(dests):
+                incoming_by_node.setdefault(dst, {}).setdefault(rel, []).append(src)
+    return outgoing_by_node, incoming_by_node
+
+
+def _expected_rows(outgoing: dict, incoming: dict) -> list[tuple[str, str, str]]:
+    return [
+        (rel, ", ".join(outgoing.get(rel, [])), ", ".join(sorted(incoming.get(rel, []))))
+        for rel in sorted(set(outgoing) | set(incoming))
     ]
-    for row in rows:
-        lines.append(
-            " | ".join(row[i].ljust(col_widths[i]) for i in range(3))
+
+
+_TOOLTIP_HEADERS = ("Relation", "To Others", "From Others")
+
+
+def _tooltip_rows(text: str) -> list[tuple[str, str, str]]:
+    """Check the tooltip table layout and parse its body back into rows."""
+    header, rule, *body = text.splitlines()
+    cells = header.split(" | ")
+    assert tuple(cell.strip() for cell in cells) == _TOOLTIP_HEADERS
+    assert rule == "-+-".join("-" * len(cell) for cell in cells)
+    assert all(len(line) == len(header) for line in body)
+    return [tuple(cell.strip() for cell in line.split(" | ")) for line in body]
+
+
+@pytest.fixture
+def make_sysml_window():
+    """Return a factory for headless diagram windows with hover state set."""
+
+    def _make(repo, diag, **overrides):
+        win = SysMLDiagramWindow.__new__(SysMLDiagramWindow)
+        win.canvas = _CANVAS
+        win._conn_tip = DummyTip(win.canvas, "")
+        win._conn_tip_obj = None
+        win.repo = repo
+        win.diagram_id = diag.diag_id
+        win.current_tool = "Select"
+        win.start = None
+        win.zoom = 1.0
+        win.objects = []
+        for name, value in overrides.items():
+            setattr(win, name, value)
+        return win
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def expected_tooltips(diagram_rules_cfg):
+    """Expected tooltip rows for each node type hovered in this module."""
+    outgoing_by_node, incoming_by_node = _index_rules(diagram_rules_cfg)
+    return {
+        node_type: _expected_rows(
+            outgoing_by_node.get(node_type, {}), incoming_by_node.get(node_type, {})
         )
-    return "\n".join(lines)
+        for node_type in ("Role", "Organization", "Operation")
+    }
 
 
-def test_governance_element_tooltips(monkeypatch):
-    cfg = load_diagram_rules(
-        Path(__file__).resolve().parents[1]
-        / "config"
-        / "rules"
-        / "diagram_rules.json"
-    )
+def test_governance_element_tooltips(make_sysml_window, expected_tooltips):
     SysMLRepository.reset_instance()
     repo = SysMLRepository.get_instance()
     diag = repo.create_diagram("Governance Diagram", name="Gov")
@@ -99,47 +130,26 @@ def test_governance_element_tooltips(monkeypatch):
     org = SysMLObject(2, "Organization", 200.0, 0.0)
     op = SysMLObject(3, "Operation", 400.0, 0.0)
 
-    win = SysMLDiagramWindow.__new__(SysMLDiagramWindow)
-    win.canvas = DummyCanvas()
-    win._conn_tip = DummyTip(win.canvas, "")
-    win._conn_tip_obj = None
-    win.repo = repo
-    win.diagram_id = diag.diag_id
-    win.current_tool = "Select"
-    win.start = None
-    win.zoom = 1.0
-    win.objects = [role, org, op]
-    win.find_object = SysMLDiagramWindow.find_object.__get__(win)
+    win = make_sysml_window(repo, diag, objects=[role, org, op])
 
     win.on_mouse_move(types.SimpleNamespace(x=0, y=0))
-    assert win._conn_tip.text == _expected_text(cfg, "Role")
+    assert _tooltip_rows(win._conn_tip.text) == expected_tooltips["Role"]
 
     win.on_mouse_move(types.SimpleNamespace(x=200, y=0))
-    assert win._conn_tip.text == _expected_text(cfg, "Organization")
+    assert _tooltip_rows(win._conn_tip.text) == expected_tooltips["Organization"]
 
     win.on_mouse_move(types.SimpleNamespace(x=400, y=0))
-    assert win._conn_tip.text == _expected_text(cfg, "Operation")
+    assert _tooltip_rows(win._conn_tip.text) == expected_tooltips["Operation"]
 
 
-def test_tooltip_hides_during_drag(monkeypatch):
+def test_tooltip_hides_during_drag(make_sysml_window):
     SysMLRepository.reset_instance()
     repo = SysMLRepository.get_instance()
     diag = repo.create_diagram("Governance Diagram", name="Gov")
 
     role = SysMLObject(1, "Role", 0.0, 0.0)
 
-    win = SysMLDiagramWindow.__new__(SysMLDiagramWindow)
-    win.canvas = DummyCanvas()
-    win._conn_tip = DummyTip(win.canvas, "")
-    win._conn_tip_obj = None
-    win.repo = repo
-    win.diagram_id = diag.diag_id
-    win.current_tool = "Select"
-    win.start = None
-    win.zoom = 1.0
-    win.objects = [role]
-    win.connections = []
-    win.find_object = SysMLDiagramWindow.find_object.__get__(win)
+    win = make_sysml_window(repo, diag, objects=[role], connections=[])
     win.redraw = lambda: None
     win.update_property_view = lambda: None
     win._sync_to_repository = lambda: None
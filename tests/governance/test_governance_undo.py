@@ -18,20 +18,12 @@
 
 import os
 import sys
-import types
 
 # Ensure repository root is on the Python path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-# Provide dummy PIL modules so AutoML can be imported without Pillow
-sys.modules.setdefault("PIL", types.ModuleType("PIL"))
-sys.modules.setdefault("PIL.Image", types.ModuleType("PIL.Image"))
-sys.modules.setdefault("PIL.ImageTk", types.ModuleType("PIL.ImageTk"))
-sys.modules.setdefault("PIL.ImageDraw", types.ModuleType("PIL.ImageDraw"))
-sys.modules.setdefault("PIL.ImageFont", types.ModuleType("PIL.ImageFont"))
-
 from AutoML import AutoMLApp
-from gui.architecture import GovernanceDiagramWindow, SysMLObject
+from gui.architecture import GovernanceDiagramWindow
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
 from mainappsrc.managers.undo_manager import UndoRedoManager
 
@@ -25,7 +25,6 @@ from pathlib import Path
 import types
 
 ROOT = Path(__file__).resolve().parents[2]
-sys.path.append(str(ROOT))
 sys.path.append(str(ROOT / "tests"))
 
 from gui.controls import messagebox
@@ -0,0 +1,47 @@
+# Author: Miguel Marina <karel.capek.robotics@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 Capek System Safety & Robotic Solutions
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Fixtures shared by the GSN diagram tests."""
+
+import pytest
+
+
+@pytest.fixture
+def bare_gsn_win():
+    """Return a factory for ``GSNDiagramWindow`` objects that skip ``__init__``.
+
+    The window starts unzoomed with nothing selected, no pending connection
+    or drag and empty canvas-id lookups; keyword arguments set or override
+    further attributes.
+    """
+    from gui.gsn_diagram_window import GSNDiagramWindow
+
+    def _make(**overrides):
+        win = GSNDiagramWindow.__new__(GSNDiagramWindow)
+        win.zoom = 1.0
+        win.selected_node = None
+        win._connect_mode = None
+        win._connect_parent = None
+        win._drag_node = None
+        win.id_to_node = {}
+        win.id_to_relation = {}
+        for name, value in overrides.items():
+            setattr(win, name, value)
+        return win
+
+    return _make
@@ -20,12 +20,6 @@ import types
 import os
 import sys
 
-sys.modules.setdefault("PIL", types.ModuleType("PIL"))
-sys.modules.setdefault("PIL.Image", types.ModuleType("PIL.Image"))
-sys.modules.setdefault("PIL.ImageDraw", types.ModuleType("PIL.ImageDraw"))
-sys.modules.setdefault("PIL.ImageFont", types.ModuleType("PIL.ImageFont"))
-sys.modules.setdefault("PIL.ImageTk", types.ModuleType("PIL.ImageTk"))
-
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from mainappsrc.models.gsn import GSNNode, GSNDiagram
@@ -17,17 +17,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import unittest
-import types
 import os
 import sys
-import pytest
-
-# Provide dummy PIL modules so AutoML can be imported without Pillow
-sys.modules.setdefault("PIL", types.ModuleType("PIL"))
-sys.modules.setdefault("PIL.Image", types.ModuleType("PIL.Image"))
-sys.modules.setdefault("PIL.ImageDraw", types.ModuleType("PIL.ImageDraw"))
-sys.modules.setdefault("PIL.ImageFont", types.ModuleType("PIL.ImageFont"))
-sys.modules.setdefault("PIL.ImageTk", types.ModuleType("PIL.ImageTk"))
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
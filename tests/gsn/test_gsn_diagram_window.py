@@ -16,16 +16,102 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import tkinter as tk
-import types
 import csv
-import tempfile
+import types
 from unittest import mock
 
+import pytest
+
+# Only the tkinter module is needed: the windows here draw on stub canvases,
+# so unlike the modules gated on _tk_available no display is required.
+tk = pytest.importorskip("tkinter")
+
 import gui.gsn_diagram_window as gdw
 from gui.gsn_diagram_window import GSNDiagramWindow
 from mainappsrc.models.gsn import GSNNode, GSNDiagram, GSNModule
-import pytest
+
+
+class CanvasStub:
+    """Configurable stand-in for the diagram canvas.
+
+    ``overlap_ids`` are reported by ``find_overlapping``; when ``hit_point``
+    is given they are only reported for regions containing that point.
+    """
+
+    __slots__ = (
+        "off_x",
+        "off_y",
+        "_bbox",
+        "_hits",
+        "_closest",
+        "_tags",
+        "_hit_point",
+        "cursor",
+        "lines",
+        "config",
+    )
+
+    def __init__(
+        self,
+        off_x=0,
+        off_y=0,
+        bbox=(0, 0, 0, 0),
+        overlap_ids=(),
+        tags_map=None,
+        hit_point=None,
+    ):
+        self.off_x = off_x
+        self.off_y = off_y
+        self._bbox = bbox
+        self._hits = tuple(overlap_ids)
+        self._closest = self._hits or (1,)
+        self._hit_point = hit_point
+        self._tags = tags_map or {}
+        self.cursor = None
+        self.lines = []
+        self.config = {}
+
+    def canvasx(self, x):
+        return x + self.off_x
+
+    def canvasy(self, y):
+        return y + self.off_y
+
+    def create_line(self, *args, **kwargs):
+        self.lines.append(kwargs)
+
+    def create_rectangle(self, *args, **kwargs):
+        pass
+
+    def delete(self, *args, **kwargs):
+        pass
+
+    def configure(self, **kwargs):
+        self.config.update(kwargs)
+        if "cursor" in kwargs:
+            self.cursor = kwargs["cursor"]
+
+    def bbox(self, tag):
+        return self._bbox
+
+    def find_overlapping(self, x1, y1, x2, y2):
+        if self._hit_point is not None:
+            px, py = self._hit_point
+            if not (x1 <= px <= x2 and y1 <= py <= y2):
+                return ()
+        return self._hits
+
+    def find_closest(self, x, y):
+        return self._closest
+
+    def gettags(self, item):
+        return self._tags.get(item, ())
+
+    def after(self, *args, **kwargs):
+        return None
+
+    def after_cancel(self, *args, **kwargs):
+        pass
 
 
 def test_gsn_diagram_window_button_labels():
@@ -37,147 +123,52 @@ def test_gsn_diagram_window_button_labels():
     assert "Module" in labels
 
 
-def test_zoom_methods_adjust_factor():
-    win = GSNDiagramWindow.__new__(GSNDiagramWindow)
-    win.zoom = 1.0
-    win.refresh = lambda: None
+def test_zoom_methods_adjust_factor(bare_gsn_win):
+    win = bare_gsn_win(refresh=lambda: None)
     GSNDiagramWindow.zoom_in(win)
     assert win.zoom > 1.0
     GSNDiagramWindow.zoom_out(win)
     assert abs(win.zoom - 1.0) < 1e-6
 
 
-def test_temp_connection_line_is_dotted():
-    """Dragging in connect mode should draw a dotted preview line."""
-    win = GSNDiagramWindow.__new__(GSNDiagramWindow)
-    win.zoom = 1.0
-    win._connect_mode = "solved"
-    win._connect_parent = GSNNode("p", "Goal", x=10, y=20)
-    win._drag_node = None
-    lines = []
-
-    class CanvasStub:
-        def canvasx(self, x):
-            return x
-
-        def canvasy(self, y):
-            return y
-
-        def create_line(self, *args, **kwargs):
-            lines.append(kwargs)
-
-        def delete(self, *args, **kwargs):
-            pass
-
-    win.canvas = CanvasStub()
-    event = type("Event", (), {"x": 100, "y": 100})
-    win._on_drag(event)
-    assert lines and lines[0].get("dash") == (2, 2)
-    assert lines[0].get("arrow") == tk.LAST
-
-
-def test_temp_connection_line_has_arrow_in_context_mode():
-    """Context connections preview with an arrow."""
-    win = GSNDiagramWindow.__new__(GSNDiagramWindow)
-    win.zoom = 1.0
-    win._connect_mode = "context"
-    win._connect_parent = GSNNode("p", "Goal", x=10, y=20)
-    win._drag_node = None
-    lines = []
-
-    class CanvasStub:
-        def canvasx(self, x):
-            return x
-
-        def canvasy(self, y):
-            return y
-
-        def create_line(self, *args, **kwargs):
-            lines.append(kwargs)
-
-        def delete(self, *args, **kwargs):
-            pass
-
-    win.canvas = CanvasStub()
-    event = type("Event", (), {"x": 50, "y": 50})
+@pytest.mark.parametrize("mode", ["solved", "context"])
+def test_temp_connection_line_is_dotted_with_arrow(bare_gsn_win, mode):
+    """Dragging in connect mode should draw a dotted preview arrow."""
+    win = bare_gsn_win(
+        _connect_mode=mode,
+        _connect_parent=GSNNode("p", "Goal", x=10, y=20),
+        canvas=CanvasStub(),
+    )
+    event = types.SimpleNamespace(x=100, y=100)
     win._on_drag(event)
+    lines = win.canvas.lines
     assert lines and lines[0].get("dash") == (2, 2)
     assert lines[0].get("arrow") == tk.LAST
 
 
-def test_on_release_creates_context_link():
-    """Releasing in context mode should mark the relation accordingly."""
-    win = GSNDiagramWindow.__new__(GSNDiagramWindow)
-    win.zoom = 1.0
-    parent = GSNNode("p", "Goal")
-    child = GSNNode("c", "Context")
-
-    class CanvasStub:
-        def __init__(self):
-            self.cursor = None
-
-        def canvasx(self, x):
-            return x
-
-        def canvasy(self, y):
-            return y
-
-        def delete(self, *a, **k):
-            pass
-
-        def configure(self, **kwargs):
-            if "cursor" in kwargs:
-                self.cursor = kwargs["cursor"]
-
-    win.canvas = CanvasStub()
-    win._node_at = lambda x, y: child
-    win.refresh = lambda: None
-
-    GSNDiagramWindow.connect_in_context(win)
-    assert win.canvas.cursor == "hand2"
-    win._connect_parent = parent
-    event = type("Event", (), {"x": 0, "y": 0})
-    win._on_release(event)
-    assert child in parent.children
-    assert child in parent.context_children
-    assert win.canvas.cursor == ""
-
-
-def test_solved_by_cursor_and_reset():
-    """Solved-by connections change the cursor and reset after completion."""
-    win = GSNDiagramWindow.__new__(GSNDiagramWindow)
-    win.zoom = 1.0
+@pytest.mark.parametrize(
+    "connect, child_type, cursor, in_context",
+    [
+        (GSNDiagramWindow.connect_solved_by, "Goal", "tcross", False),
+        (GSNDiagramWindow.connect_in_context, "Context", "hand2", True),
+    ],
+    ids=["solved", "context"],
+)
+def test_connect_cursor_and_release(bare_gsn_win, connect, child_type, cursor, in_context):
+    """Connect modes set a cursor, link on release and reset the cursor."""
     parent = GSNNode("p", "Goal")
-    child = GSNNode("c", "Goal")
-
-    class CanvasStub:
-        def __init__(self):
-            self.cursor = None
-
-        def canvasx(self, x):
-            return x
-
-        def canvasy(self, y):
-            return y
-
-        def delete(self, *a, **k):
-            pass
-
-        def configure(self, **kwargs):
-            if "cursor" in kwargs:
-                self.cursor = kwargs["cursor"]
-
-    win.canvas = CanvasStub()
-    win._node_at = lambda x, y: child
-    win.refresh = lambda: None
+    child = GSNNode("c", child_type)
+    win = bare_gsn_win(
+        canvas=CanvasStub(), _node_at=lambda x, y: child, refresh=lambda: None
+    )
 
-    GSNDiagramWindow.connect_solved_by(win)
-    assert win.canvas.cursor == "tcross"
+    connect(win)
+    assert win.canvas.cursor == cursor
     win._connect_parent = parent
-    event = type("Event", (), {"x": 0, "y": 0})
+    event = types.SimpleNamespace(x=0, y=0)
     win._on_release(event)
     assert child in parent.children
-    assert child not in parent.context_children
+    assert (child in parent.context_children) is in_context
     assert win.canvas.cursor == ""
 
 
@@ -188,32 +179,12 @@ def test_solved_by_cursor_and_reset():
         ("solved", "Goal", "children"),
     ],
 )
-def test_on_release_uses_raw_coords_for_connection(mode, child_type, attr):
+def test_on_release_uses_raw_coords_for_connection(bare_gsn_win, mode, child_type, attr):
     """Connections should resolve the target using raw event coordinates."""
-    win = GSNDiagramWindow.__new__(GSNDiagramWindow)
-    win.zoom = 1.0
+    win = bare_gsn_win(canvas=CanvasStub(off_x=10, off_y=20))
     parent = GSNNode("p", "Goal")
     child = GSNNode("c", child_type)
 
-    class CanvasStub:
-        def __init__(self):
-            self.cursor = None
-
-        def canvasx(self, x):
-            return x + 10
-
-        def canvasy(self, y):
-            return y + 20
-
-        def delete(self, *a, **k):
-            pass
-
-        def configure(self, **kwargs):
-            if "cursor" in kwargs:
-                self.cursor = kwargs["cursor"]
-
-    win.canvas = CanvasStub()
-
     def node_at(x, y):
         return child if (x, y) == (0, 0) else None
 
@@ -226,16 +197,14 @@ def test_on_release_uses_raw_coords_for_connection(mode, child_type, attr):
         GSNDiagramWindow.connect_solved_by(win)
 
     win._connect_parent = parent
-    event = type("Event", (), {"x": 0, "y": 0})
+    event = types.SimpleNamespace(x=0, y=0)
     win._on_release(event)
     assert child in getattr(parent, attr)
 
 
-def test_refresh_updates_scrollregion():
+def test_refresh_updates_scrollregion(bare_gsn_win):
     """Refresh should configure the canvas scrollregion."""
-    win = GSNDiagramWindow.__new__(GSNDiagramWindow)
-    win.selected_node = None
-    win.zoom = 1.0
+    win = bare_gsn_win()
 
     class DiagramStub:
         def _traverse(self):
@@ -246,93 +215,39 @@ def test_refresh_updates_scrollregion():
 
     win.diagram = DiagramStub()
 
-    class CanvasStub:
-        def __init__(self):
-            self.config = {}
-
-        def delete(self, *a, **k):
-            pass
-
-        def bbox(self, tag):
-            return (0, 0, 100, 100)
-
-        def configure(self, **kwargs):
-            self.config.update(kwargs)
-
-        def create_rectangle(self, *args, **kwargs):
-            pass
-
-    win.canvas = CanvasStub()
+    win.canvas = CanvasStub(bbox=(0, 0, 100, 100))
     win.id_to_node = {}
     win.refresh()
     assert win.canvas.config.get("scrollregion") == (0, 0, 100, 100)
 
 
-def test_click_and_drag_uses_canvas_coordinates():
+def test_click_and_drag_uses_canvas_coordinates(bare_gsn_win):
     """Selection and dragging should honour canvas scrolling."""
-    win = GSNDiagramWindow.__new__(GSNDiagramWindow)
-    win.zoom = 1.0
-    win._connect_mode = None
-    win.refresh = lambda: None
+    win = bare_gsn_win(refresh=lambda: None)
     node = GSNNode("n", "Goal", x=150, y=250)
 
-    class CanvasStub:
-        def __init__(self):
-            self.off_x = 100
-            self.off_y = 200
-
-        def canvasx(self, x):
-            return x + self.off_x
-
-        def canvasy(self, y):
-            return y + self.off_y
-
-        def find_overlapping(self, x1, y1, x2, y2):
-            if x1 <= 150 <= x2 and y1 <= 250 <= y2:
-                return [1]
-            return []
-
-        def find_closest(self, x, y):
-            return [1]
-
-        def gettags(self, item):
-            return ("node-id",) if item == 1 else ()
-
-        def delete(self, *args, **kwargs):
-            pass
-
-        def after(self, *args, **kwargs):
-            return None
-
-        def after_cancel(self, *args, **kwargs):
-            pass
-
-        def create_line(self, *args, **kwargs):
-            pass
-
-        def bbox(self, tag):
-            return (0, 0, 0, 0)
-
-    win.canvas = CanvasStub()
+    win.canvas = CanvasStub(
+        off_x=100,
+        off_y=200,
+        overlap_ids=[1],
+        tags_map={1: ("node-id",)},
+        hit_point=(150, 250),
+    )
     win.id_to_node = {"node-id": node}
 
-    event = type("Evt", (), {"x": 50, "y": 50})
+    event = types.SimpleNamespace(x=50, y=50)
     win._on_click(event)
     assert win.selected_node is node
 
-    drag = type("Evt", (), {"x": 60, "y": 60})
+    drag = types.SimpleNamespace(x=60, y=60)
     win._on_drag(drag)
     assert node.x == 160 and node.y == 260
 
 
-def test_add_module_uses_existing_modules(monkeypatch):
+def test_add_module_uses_existing_modules(monkeypatch, bare_gsn_win):
     app = types.SimpleNamespace(gsn_modules=[GSNModule("Pkg1"), GSNModule("Pkg2")])
     diagram = GSNDiagram(GSNNode("r", "Goal"))
-    win = GSNDiagramWindow.__new__(GSNDiagramWindow)
-    win.app = app
-    win.diagram = diagram
-    win.selected_node = None
-    win.refresh = lambda: None
+    win = bare_gsn_win(app=app, diagram=diagram, refresh=lambda: None)
     class DummyDialog:
         def __init__(self, *a, **k):
             self.selection = "Pkg2"
@@ -343,69 +258,38 @@ def test_add_module_uses_existing_modules(monkeypatch):
     assert names == ["Pkg2"]
 
 
-def test_right_click_node_shows_menu(monkeypatch):
-    """Right-clicking a node should show edit and delete options."""
-    win = GSNDiagramWindow.__new__(GSNDiagramWindow)
+def _right_click_node(win):
     node = GSNNode("n", "Goal")
     win.id_to_node = {node.unique_id: node}
-    win.id_to_relation = {}
-    win.canvas = type(
-        "CanvasStub",
-        (),
-        {
-            "canvasx": lambda self, x: x,
-            "canvasy": lambda self, y: y,
-            "find_overlapping": lambda self, a, b, c, d: [1],
-            "find_closest": lambda self, x, y: [1],
-            "gettags": lambda self, item: (node.unique_id,),
-        },
-    )()
-    captured = {}
-
-    class MenuStub:
-        def __init__(self, *a, **k):
-            captured["menu"] = self
-            self.items = []
-
-        def add_command(self, label, command):
-            self.items.append(label)
-
-        def tk_popup(self, x, y):
-            pass
-
-        def grab_release(self):
-            pass
-
-    monkeypatch.setattr(tk, "Menu", MenuStub)
     win._edit_node = lambda n: None
     win._delete_node = lambda n: None
-    event = type("Evt", (), {"x": 0, "y": 0, "x_root": 0, "y_root": 0})
-    GSNDiagramWindow._on_right_click(win, event)
-    assert captured["menu"].items == ["Edit", "Delete"]
+    return node.unique_id
 
 
-def test_right_click_connection_shows_menu(monkeypatch):
-    """Right-clicking a connection should show edit and delete options."""
-    win = GSNDiagramWindow.__new__(GSNDiagramWindow)
-    win.zoom = 1.0
+def _rel_map(win, edges):
+    """Map each ``(parent, child)`` edge to its canvas relation id."""
+    return {win._rel_id(p, c): (p, c) for p, c in edges}
+
+
+def _right_click_connection(win):
     parent = GSNNode("p", "Goal")
     child = GSNNode("c", "Goal")
-    rel_id = win._rel_id(parent, child)
-    win.id_to_node = {}
-    win.id_to_relation = {rel_id: (parent, child)}
+    win.id_to_relation = _rel_map(win, [(parent, child)])
     win.diagram = GSNDiagram(parent)
     win.diagram.add_node(child)
-    win.canvas = type(
-        "CanvasStub",
-        (),
-        {
-            "canvasx": lambda self, x: x,
-            "canvasy": lambda self, y: y,
-            "find_overlapping": lambda self, a, b, c, d: [1],
-            "find_closest": lambda self, x, y: [1],
-            "gettags": lambda self, item: (rel_id,),
-        },
-    )()
+    win._edit_connection = lambda p, c: None
+    win._delete_connection = lambda p, c: None
+    return next(iter(win.id_to_relation))
+
+
+@pytest.mark.parametrize(
+    "setup", [_right_click_node, _right_click_connection], ids=["node", "connection"]
+)
+def test_right_click_shows_menu(monkeypatch, bare_gsn_win, setup):
+    """Right-clicking a node or connection should show edit and delete options."""
+    win = bare_gsn_win()
+    tag = setup(win)
+    win.canvas = CanvasStub(overlap_ids=[1], tags_map={1: (tag,)})
     captured = {}
 
     class MenuStub:
@@ -423,14 +307,12 @@ def test_right_click_connection_shows_menu(monkeypatch):
             pass
 
     monkeypatch.setattr(tk, "Menu", MenuStub)
-    win._edit_connection = lambda p, c: None
-    win._delete_connection = lambda p, c: None
-    event = type("Evt", (), {"x": 0, "y": 0, "x_root": 0, "y_root": 0})
+    event = types.SimpleNamespace(x=0, y=0, x_root=0, y_root=0)
     GSNDiagramWindow._on_right_click(win, event)
     assert captured["menu"].items == ["Edit", "Delete"]
 
 
-def test_refresh_sets_app_for_spi_lookup():
+def test_refresh_sets_app_for_spi_lookup(bare_gsn_win):
     root = GSNNode("Root", "Goal")
     sol = GSNNode("Sol", "Solution")
     sol.spi_target = "Brake Time (SOTIF)"
@@ -446,13 +328,7 @@ def test_refresh_sets_app_for_spi_lookup():
 
     app = types.SimpleNamespace(top_events=[TopEvent()])
 
-    win = GSNDiagramWindow.__new__(GSNDiagramWindow)
-    win.app = app
-    win.diagram = diag
-    win.zoom = 1.0
-    win.selected_node = None
-    win.id_to_node = {}
-    win.id_to_relation = {}
+    win = bare_gsn_win(app=app, diagram=diag)
 
     captured = {}
 
@@ -462,16 +338,6 @@ def test_refresh_sets_app_for_spi_lookup():
     diag.draw = draw
     diag._traverse = lambda: [root, sol]
 
-    class CanvasStub:
-        def delete(self, *a, **k):
-            pass
-
-        def bbox(self, tag):
-            return (0, 0, 0, 0)
-
-        def configure(self, **k):
-            pass
-
     win.canvas = CanvasStub()
 
     GSNDiagramWindow.refresh(win)
@@ -479,14 +345,13 @@ def test_refresh_sets_app_for_spi_lookup():
     assert "SPI: 1e-5/h" in captured.get("text", "")
 
 
-def test_export_csv_writes_nodes(tmp_path, monkeypatch):
+def test_export_csv_writes_nodes(tmp_path, monkeypatch, bare_gsn_win):
     root = GSNNode("Root", "Goal")
     child = GSNNode("Child", "Solution")
     root.add_child(child)
     diag = GSNDiagram(root)
     diag.add_node(child)
-    win = GSNDiagramWindow.__new__(GSNDiagramWindow)
-    win.diagram = diag
+    win = bare_gsn_win(diagram=diag)
     path = tmp_path / "out.csv"
     monkeypatch.setattr(gdw.filedialog, "asksaveasfilename", lambda **k: str(path))
     GSNDiagramWindow.export_csv(win)
@@ -495,10 +360,11 @@ def test_export_csv_writes_nodes(tmp_path, monkeypatch):
     assert rows[0] == ["ID", "Name", "Type", "Description", "Children", "Context"]
     assert [root.unique_id, "Root", "Goal", "", child.unique_id, ""] in rows
     assert [child.unique_id, "Child", "Solution", "", "", ""] in rows
+    assert len(rows) == 3
 
 
-def test_gsn_diagram_window_binds_undo_redo():
-    win = GSNDiagramWindow.__new__(GSNDiagramWindow)
+def test_gsn_diagram_window_binds_undo_redo(bare_gsn_win):
+    win = bare_gsn_win()
     bindings = {}
 
     def fake_bind(seq, func):
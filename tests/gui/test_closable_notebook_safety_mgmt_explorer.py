@@ -18,15 +18,11 @@
 
 """Regression tests for detaching the Safety Management Explorer."""
 
-import os
 import sys
 import types
 import tkinter as tk
 import pytest
 
-root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-sys.path.append(root_dir)
-
 
 class _Repo:
     diagrams = {}
@@ -19,11 +19,6 @@
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 from mainappsrc.services.service_loader import LazyServiceRegistry
 from mainappsrc.services import AnalysisUtilsService
 
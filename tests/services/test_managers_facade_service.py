@@ -19,13 +19,9 @@
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 from contextlib import contextmanager, ExitStack
 from unittest.mock import MagicMock, patch
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 from mainappsrc.services.managers import ManagersFacadeService
 
 MANAGER_PATH = "mainappsrc.services.managers.managers_facade_service"
@@ -20,11 +20,6 @@
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 from mainappsrc.services.safety_ui import SafetyUIService
 from mainappsrc.core.automl_core import AutoMLApp
 
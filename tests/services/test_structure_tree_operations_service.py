@@ -19,11 +19,8 @@
 """Tests for :mod:`mainappsrc.services.project_structure.structure_tree_operations_service`."""
 
 import ast
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 import types
 from mainappsrc.services.project_structure import StructureTreeOperationsService
 from mainappsrc.core import structure_tree_operations as sto
@@ -19,13 +19,9 @@
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 from mainappsrc.services.windows import WindowControllersService
 from mainappsrc.core.event_dispatcher import EventDispatcher
 from gui.controls.window_controllers import WindowControllers
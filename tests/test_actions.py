@@ -18,9 +18,6 @@
 
 # Author: Miguel Marina <karel.capek.robotics@gmail.com>
 import unittest
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
 
 class ActionNameTests(unittest.TestCase):
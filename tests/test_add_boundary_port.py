@@ -18,9 +18,6 @@
 
 import unittest
 from types import SimpleNamespace
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from gui.architecture import SysMLDiagramWindow, SysMLObject, set_ibd_father
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
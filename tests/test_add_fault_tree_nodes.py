@@ -18,13 +18,8 @@
 
 """Ensure fault-tree nodes are created when invoking add_node_of_type."""
 
-import sys
-import pathlib
 import types
 
-repo_root = pathlib.Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(repo_root))
-
 import AutoML
 
 AutoMLApp = AutoML.AutoMLApp
@@ -18,13 +18,8 @@
 
 """Verify that gates can be added in Prototype Assurance Analysis diagrams."""
 
-import sys
-import pathlib
 import types
 
-repo_root = pathlib.Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(repo_root))
-
 import AutoML
 
 AutoMLApp = AutoML.AutoMLApp
@@ -16,11 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 def test_ai_database_and_cylinder_icons():
     arch_path = Path(__file__).resolve().parents[1] / "gui" / "architecture.py"
     content = arch_path.read_text()
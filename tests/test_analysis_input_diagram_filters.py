@@ -18,11 +18,6 @@
 
 import types
 
-import sys
-import os
-
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
 from gui.stpa_window import StpaWindow
 from gui.threat_window import ThreatWindow
@@ -16,12 +16,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
 import sys
 import types
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
 try:
     from AutoML import AutoMLApp
 except ModuleNotFoundError:
@@ -17,12 +17,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import json
-import os
-import sys
 import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
 from AutoML import AutoMLApp
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
 from mainappsrc.managers.undo_manager import UndoRedoManager
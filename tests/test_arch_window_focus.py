@@ -16,13 +16,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
-import sys
 import types
 import weakref
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
 from AutoML import AutoMLApp
 from mainappsrc.managers.diagram_clipboard_manager import DiagramClipboardManager
 from gui.architecture import (
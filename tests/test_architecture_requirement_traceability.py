@@ -16,11 +16,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
 from analysis.safety_management import SafetyManagementToolbox
 from analysis.models import global_requirements
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
@@ -16,14 +16,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import sys
-from pathlib import Path
 import tkinter as tk
 from tkinter import ttk
 
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 from gui.controls.button_utils import add_hover_highlight
 from gui.utils.closable_notebook import ClosableNotebook
 
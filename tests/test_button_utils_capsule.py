@@ -16,13 +16,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import sys
-from pathlib import Path
 import tkinter as tk
 import pytest
 from tkinter import ttk
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 from gui.controls.button_utils import set_uniform_button_width
 
 
@@ -16,16 +16,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import sys
 import os
 import ctypes
 import types
-from pathlib import Path
 import tkinter as tk
 
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 from gui.controls.capsule_button import CapsuleButton, _darken, _hex_to_rgb
 
 
@@ -16,10 +16,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
 import sys
 import types
 import unittest
+from dataclasses import dataclass, field
 
 # ---------------------------------------------------------------------------
 # Provide a light-weight stub of the Pillow API used by AutoML.  The real
@@ -75,33 +75,22 @@ PIL_stub.ImageTk = object
 # ---------------------------------------------------------------------------
 # Minimal numpy stub supporting the features required by auto_generate_fta_diagram
 # ---------------------------------------------------------------------------
-class _Vector:
-    def __init__(self, data):
-        self.x, self.y = data
+class _Vector(complex):
+    """2D point backed by :class:`complex` so arithmetic runs in C."""
 
-    def __sub__(self, other):
-        return _Vector((self.x - other.x, self.y - other.y))
+    __slots__ = ()
 
-    def __add__(self, other):
-        return _Vector((self.x + other.x, self.y + other.y))
-
-    def __truediv__(self, scalar):
-        return _Vector((self.x / scalar, self.y / scalar))
-
-    def __mul__(self, scalar):
-        return _Vector((self.x * scalar, self.y * scalar))
-
-    __rmul__ = __mul__
+    x = property(lambda self: self.real)
+    y = property(lambda self: self.imag)
 
     def __iter__(self):
-        yield self.x
-        yield self.y
+        yield self.real
+        yield self.imag
 
 def _array(data):
-    return _Vector(data)
+    return _Vector(data[0], data[1])
 
-def _norm(vec):
-    return (vec.x ** 2 + vec.y ** 2) ** 0.5
+_norm = abs
 
 numpy_stub = types.ModuleType("numpy")
 numpy_stub.array = _array
@@ -111,7 +100,6 @@ numpy_stub.linalg = types.SimpleNamespace(norm=_norm)
 numpy_stub.isscalar = lambda x: isinstance(x, (int, float, bool))
 numpy_stub.bool_ = bool
 sys.modules.setdefault("numpy", numpy_stub)
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from AutoML import AutoMLApp
 import AutoML as _AutoML
@@ -120,31 +108,34 @@ _AutoML.ImageDraw = PIL_stub.ImageDraw
 _AutoML.ImageFont = PIL_stub.ImageFont
 
 
+@dataclass(slots=True)
 class DummyNode:
-    def __init__(self, unique_id, node_type, name, gate_type=None, children=None, input_subtype=""):
-        self.unique_id = unique_id
-        self.node_type = node_type
-        self.name = name
-        self.gate_type = gate_type
-        self.children = children or []
-        self.input_subtype = input_subtype
+    unique_id: int
+    node_type: str
+    name: str
+    gate_type: str | None = None
+    children: list = field(default_factory=list)
+    input_subtype: str = ""
 
 
 class CauseEffectDiagramTests(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # Inject PIL stub so AutoML's image utilities work without Pillow
-        self._orig_pil = sys.modules.get("PIL")
+        cls._orig_pil = sys.modules.get("PIL")
         sys.modules["PIL"] = PIL_stub
         import AutoML as _AutoML
         _AutoML.Image = PIL_stub.Image
         _AutoML.ImageDraw = PIL_stub.ImageDraw
         _AutoML.ImageFont = PIL_stub.ImageFont
-        # Create a minimal AutoMLApp instance without initialising Tk
-        self.app = AutoMLApp.__new__(AutoMLApp)
-
-    def tearDown(self):
-        if self._orig_pil is not None:
-            sys.modules["PIL"] = self._orig_pil
+        # Create a minimal AutoMLApp instance without initialising Tk; the
+        # tests only call stateless helpers on it.
+        cls.app = AutoMLApp.__new__(AutoMLApp)
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls._orig_pil is not None:
+            sys.modules["PIL"] = cls._orig_pil
         else:
             sys.modules.pop("PIL", None)
 
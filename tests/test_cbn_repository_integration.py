@@ -16,13 +16,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
-import sys
 import types
 from unittest import mock
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
 from gui.causal_bayesian_network_window import CausalBayesianNetworkWindow
 from tests.test_causal_bayesian_ui import _setup_window
 
@@ -23,7 +23,6 @@ import tkinter as tk
 from tkinter import ttk
 
 root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-sys.path.append(root_dir)
 sys.path.append(os.path.join(root_dir, "gui", "utils"))
 from closable_notebook import ClosableNotebook  # type: ignore
 
@@ -16,6 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os
 from pathlib import Path
 from config.config_loader import load_json_with_comments
 from tools.memory_manager import manager as memory_manager
@@ -56,3 +57,15 @@ class TestConfigLoader:
             assert calls["count"] == 1
         finally:
             memory_manager.cleanup()
+
+    def test_reloads_after_file_change(self, tmp_path):
+        cfg = tmp_path / "cfg.json"
+        cfg.write_text("{\"a\": 1}")
+        try:
+            assert load_json_with_comments(cfg) == {"a": 1}
+            cfg.write_text("{\"a\": 2}")
+            stamp = cfg.stat().st_mtime_ns + 1_000_000_000
+            os.utime(cfg, ns=(stamp, stamp))
+            assert load_json_with_comments(cfg) == {"a": 2}
+        finally:
+            memory_manager.cleanup()
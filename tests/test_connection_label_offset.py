@@ -17,10 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import unittest
-import os
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository, SysMLDiagram
 from gui.architecture import SysMLDiagramWindow, DiagramConnection, SysMLObject
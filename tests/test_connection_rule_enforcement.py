@@ -17,10 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import json
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from gui import architecture
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository, SysMLRelationship
@@ -17,10 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import sys
-from pathlib import Path
-
-# Ensure repository root is importable
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from tools.crash_report_logger import (
     CrashLoggerV3,
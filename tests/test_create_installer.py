@@ -19,9 +19,7 @@
 import zipfile
 import tarfile
 from pathlib import Path
-import sys
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 from tools import create_installer as ci
 
 
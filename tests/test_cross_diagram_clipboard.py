@@ -19,12 +19,8 @@
 import types
 
 
-import os
-import sys
 import types
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
 from AutoML import AutoMLApp
 from mainappsrc.managers.diagram_clipboard_manager import DiagramClipboardManager
 from gui.architecture import SysMLDiagramWindow, _get_next_id, SysMLObject, ARCH_WINDOWS
@@ -18,19 +18,9 @@
 
 import csv
 import os
-import sys
 import tempfile
 import unittest
 from unittest import mock
-import types
-
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-# Provide minimal PIL stubs to satisfy AutoML imports
-sys.modules.setdefault("PIL", types.ModuleType("PIL"))
-sys.modules.setdefault("PIL.Image", types.ModuleType("PIL.Image"))
-sys.modules.setdefault("PIL.ImageDraw", types.ModuleType("PIL.ImageDraw"))
-sys.modules.setdefault("PIL.ImageFont", types.ModuleType("PIL.ImageFont"))
-sys.modules.setdefault("PIL.ImageTk", types.ModuleType("PIL.ImageTk"))
 
 from AutoML import AutoMLApp
 from analysis.models import CybersecurityGoal
@@ -18,10 +18,6 @@
 """Tests for :mod:`DataAccessQueriesService`."""
 
 from types import SimpleNamespace
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import mainappsrc.services.data_access.data_access_queries_service as svc_module
 
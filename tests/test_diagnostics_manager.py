@@ -17,13 +17,9 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import asyncio
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from tools.diagnostics_manager import (
     AsyncDiagnosticsManager,
     DiagnosticError,
@@ -16,17 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import sys, types, pathlib
-
-# Ensure repository root is on path
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
-
-# Stub PIL modules to allow importing AutoML without Pillow
-sys.modules.setdefault("PIL", types.ModuleType("PIL"))
-sys.modules.setdefault("PIL.Image", types.ModuleType("PIL.Image"))
-sys.modules.setdefault("PIL.ImageDraw", types.ModuleType("PIL.ImageDraw"))
-sys.modules.setdefault("PIL.ImageFont", types.ModuleType("PIL.ImageFont"))
-sys.modules.setdefault("PIL.ImageTk", types.ModuleType("PIL.ImageTk"))
+import types
 
 import importlib
 
@@ -36,7 +26,6 @@ FaultTreeNode = AutoML.FaultTreeNode
 import mainappsrc.core.page_diagram as page_module
 PageDiagram = page_module.PageDiagram
 
-import pytest
 
 class DummyMenu:
     last = None
@@ -18,11 +18,9 @@
 
 import json
 from pathlib import Path
-import sys
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 from config import load_diagram_rules, validate_diagram_rules
 
 
@@ -16,11 +16,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from gui.safety_management_toolbox import SafetyManagementWindow
 from gui import safety_management_toolbox as smt
 from analysis.models import global_requirements
@@ -16,21 +16,21 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import pytest
+
 from gui.architecture import format_diagram_name
 from mainappsrc.models.sysml.sysml_repository import SysMLDiagram
 
 
-def test_format_diagram_name_adds_abbreviation():
-    diag = SysMLDiagram("d1", "Control Flow Diagram", name="Diag")
-    assert format_diagram_name(diag) == "Diag : CFD"
-
-
-def test_format_diagram_name_ibd():
-    diag = SysMLDiagram("d2", "Internal Block Diagram", name="Struct")
-    assert format_diagram_name(diag) == "Struct : IBD"
-
-
-def test_format_diagram_name_does_not_duplicate():
-    diag = SysMLDiagram("d3", "Control Flow Diagram", name="Diag : CFD")
-    assert format_diagram_name(diag) == "Diag : CFD"
-
+@pytest.mark.parametrize(
+    "diag_type, name, expected",
+    [
+        ("Control Flow Diagram", "Diag", "Diag : CFD"),
+        ("Internal Block Diagram", "Struct", "Struct : IBD"),
+        ("Control Flow Diagram", "Diag : CFD", "Diag : CFD"),
+    ],
+    ids=["adds_abbreviation", "ibd", "does_not_duplicate"],
+)
+def test_format_diagram_name(diag_type, name, expected):
+    diag = SysMLDiagram("d1", diag_type, name=name)
+    assert format_diagram_name(diag) == expected
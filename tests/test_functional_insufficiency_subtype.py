@@ -17,12 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import unittest
-import types, sys
-sys.modules.setdefault('PIL', types.ModuleType('PIL'))
-sys.modules.setdefault('PIL.Image', types.ModuleType('PIL.Image'))
-sys.modules.setdefault('PIL.ImageDraw', types.ModuleType('PIL.ImageDraw'))
-sys.modules.setdefault('PIL.ImageFont', types.ModuleType('PIL.ImageFont'))
-sys.modules.setdefault('PIL.ImageTk', types.ModuleType('PIL.ImageTk'))
 
 from AutoML import AutoMLApp, FaultTreeNode
 
@@ -17,11 +17,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import types
-import os
 import sys
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
 # Provide a minimal Pillow stub so importing AutoML does not fail.
 pil = types.ModuleType("PIL")
 pil.Image = types.ModuleType("Image")
@@ -17,10 +17,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from types import SimpleNamespace
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 from gui.controls.button_utils import enable_listbox_hover_highlight, _blend_with
 
 
@@ -16,14 +16,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
-import sys
 import tkinter as tk
 
 import pytest
 
-# Ensure repository root in path
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from gui import logger  # noqa: E402
 from gui.controls import messagebox  # noqa: E402
 from AutoML import AutoMLApp  # noqa: E402
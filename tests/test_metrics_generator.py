@@ -21,8 +21,6 @@ import sys
 import subprocess
 import json
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from tools.metrics_generator import collect_metrics
 
 
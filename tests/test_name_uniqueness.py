@@ -16,12 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
-import sys
 from types import SimpleNamespace
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
 from mainappsrc.models.gsn import GSNNode, GSNDiagram
 from analysis.causal_bayesian_network import CausalBayesianNetworkDoc
 from gui.name_utils import (
@@ -20,11 +20,7 @@
 
 from __future__ import annotations
 
-import sys
 import types
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import mainappsrc.ui.app_lifecycle_ui as app_lifecycle_ui
 
@@ -16,19 +16,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import sys, types, pathlib
+import types
 from unittest.mock import MagicMock
 
-# Ensure repository root on path
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
-
-# Stub PIL modules for AutoML import
-sys.modules.setdefault("PIL", types.ModuleType("PIL"))
-sys.modules.setdefault("PIL.Image", types.ModuleType("PIL.Image"))
-sys.modules.setdefault("PIL.ImageDraw", types.ModuleType("PIL.ImageDraw"))
-sys.modules.setdefault("PIL.ImageFont", types.ModuleType("PIL.ImageFont"))
-sys.modules.setdefault("PIL.ImageTk", types.ModuleType("PIL.ImageTk"))
-
 from AutoML import AutoMLApp
 import AutoML
 from mainappsrc.managers.undo_manager import UndoRedoManager
@@ -18,20 +18,8 @@
 
 """Unit tests for :class:`NodeCloneService`."""
 
-import os
-import sys
-import types
 import unittest
 
-# Provide dummy PIL modules so AutoML can be imported without Pillow
-sys.modules.setdefault("PIL", types.ModuleType("PIL"))
-sys.modules.setdefault("PIL.Image", types.ModuleType("PIL.Image"))
-sys.modules.setdefault("PIL.ImageDraw", types.ModuleType("PIL.ImageDraw"))
-sys.modules.setdefault("PIL.ImageFont", types.ModuleType("PIL.ImageFont"))
-sys.modules.setdefault("PIL.ImageTk", types.ModuleType("PIL.ImageTk"))
-
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
 from mainappsrc.models.fta.fault_tree_node import FaultTreeNode
 from mainappsrc.core.node_clone_service import NodeCloneService
 from mainappsrc.models.gsn.nodes import GSNNode
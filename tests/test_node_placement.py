@@ -16,12 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import sys
 import types
-from pathlib import Path
-
-# Ensure repository root is on path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from mainappsrc.models.fta.fault_tree_node import FaultTreeNode, add_node_of_type
 
@@ -17,9 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import unittest
-import sys, pathlib
-
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
 
 from mainappsrc.automl_core import AutoMLApp, FaultTreeNode
 from analysis.models import HazopDoc, HazopEntry, HaraDoc, HaraEntry
@@ -16,12 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import sys
-from pathlib import Path
 import types
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from mainappsrc.core.navigation_selection_input import Navigation_Selection_Input
 
 
@@ -23,8 +23,9 @@ from gui.architecture import SysMLObject
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
 
 class DummyWin:
-    def __init__(self, diagram):
-        self.repo = SysMLRepository.get_instance()
+    __slots__ = ("repo", "diagram_id", "objects", "connections", "app")
+    def __init__(self, repo, diagram):
+        self.repo = repo
         self.diagram_id = diagram.diag_id
         self.objects = []
         self.connections = []
@@ -48,9 +49,8 @@ class PartDefinitionLimitTests(unittest.TestCase):
         ibd = repo.create_diagram("Internal Block Diagram")
         repo.link_diagram(a.elem_id, ibd.diag_id)
         architecture.add_composite_aggregation_part(repo, a.elem_id, b.elem_id, "1")
-        win = DummyWin(ibd)
-        for o in ibd.objects:
-            win.objects.append(SysMLObject(**o))
+        win = DummyWin(repo, ibd)
+        win.objects = [SysMLObject(**o) for o in ibd.objects]
         new_elem = repo.create_element("Part", name="P")
         repo.add_element_to_diagram(ibd.diag_id, new_elem.elem_id)
         new_obj = SysMLObject(99, "Part", 0, 0, element_id=new_elem.elem_id, properties={})
@@ -21,36 +21,41 @@ from gui.architecture import SysMLObject, SysMLDiagramWindow
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
 
 class DummyFont:
+    __slots__ = ()
     def measure(self, text: str) -> int:
         return len(text)
     def metrics(self, name: str) -> int:
         return 1
 
 class DummyWindow:
+    __slots__ = ("repo", "zoom", "font", "diagram_id")
     _object_label_lines = SysMLDiagramWindow._object_label_lines
-    def __init__(self, diag_id):
-        self.repo = SysMLRepository.get_instance()
+    def __init__(self, repo, diag_id):
+        self.repo = repo
         self.zoom = 1.0
         self.font = DummyFont()
         self.diagram_id = diag_id
 
 class PartMultiplicityLabelTests(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         SysMLRepository._instance = None
-        self.repo = SysMLRepository.get_instance()
-
-    def test_label_shows_index_and_range(self):
-        repo = self.repo
-        whole = repo.create_element("Block", name="Whole")
-        part_blk = repo.create_element("Block", name="PartB")
+        cls.repo = repo = SysMLRepository.get_instance()
+        cls.whole = repo.create_element("Block", name="Whole")
+        cls.part_blk = repo.create_element("Block", name="PartB")
         repo.create_relationship(
             "Composite Aggregation",
-            whole.elem_id,
-            part_blk.elem_id,
+            cls.whole.elem_id,
+            cls.part_blk.elem_id,
             properties={"multiplicity": "1..*"},
         )
-        ibd = repo.create_diagram("Internal Block Diagram")
-        repo.link_diagram(whole.elem_id, ibd.diag_id)
+        cls.ibd = repo.create_diagram("Internal Block Diagram")
+        repo.link_diagram(cls.whole.elem_id, cls.ibd.diag_id)
+
+    def test_label_shows_index_and_range(self):
+        repo = self.repo
+        part_blk = self.part_blk
+        ibd = self.ibd
         elem = repo.create_element(
             "Part", name="Part[1]", properties={"definition": part_blk.elem_id}
         )
@@ -65,7 +70,7 @@ class PartMultiplicityLabelTests(unittest.TestCase):
             "height": 40.0,
             "properties": {"definition": part_blk.elem_id},
         }
-        win = DummyWindow(ibd.diag_id)
+        win = DummyWindow(repo, ibd.diag_id)
         obj = SysMLObject(**obj_data)
         lines = win._object_label_lines(obj)
         self.assertIn("Part 1 : PartB [1..*]", lines)
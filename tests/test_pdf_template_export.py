@@ -18,7 +18,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import sys
-import os
 import json
 import types
 from pathlib import Path
@@ -95,7 +94,6 @@ rl_colors = types.ModuleType("reportlab.lib.colors")
 rl_colors.lightblue = rl_colors.grey = rl_colors.lightgrey = "c"
 sys.modules.setdefault("reportlab.lib.colors", rl_colors)
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from AutoML import AutoMLApp
 from tkinter import filedialog
 from mainappsrc.core.reporting_export import Reporting_Export
@@ -17,10 +17,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import types
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import pytest
 
 from gui.safety_management_toolbox import SafetyManagementWindow
 from gui import safety_management_toolbox as smt
@@ -28,20 +26,40 @@ from analysis.models import global_requirements
 
 
 class DummyGov:
+    __slots__ = ("_reqs", "calls")
+
     def __init__(self, reqs):
         self._reqs = reqs
+        self.calls = 0
 
     def generate_requirements(self):
+        self.calls += 1
         return self._reqs
 
 
+@pytest.fixture(autouse=True)
+def _isolate_global_requirements():
+    """Run each test against an empty ``global_requirements`` registry."""
+    # The toolbox imported the dict itself, so it is emptied and refilled in
+    # place rather than swapped on ``analysis.models``.
+    saved = dict(global_requirements)
+    global_requirements.clear()
+    yield
+    global_requirements.clear()
+    global_requirements.update(saved)
+
+
+_PHASE_DIAGRAMS = {"Phase1": frozenset({"D"}), "GLOBAL": frozenset({"L"})}
+_DIAGRAM_PHASES = {"D": "Phase1", "L": "GLOBAL"}
+
+
 def _setup_window(monkeypatch):
     win = SafetyManagementWindow.__new__(SafetyManagementWindow)
     toolbox = types.SimpleNamespace(
         diagrams={"D": "id1", "L": "id2"},
-        diagrams_for_module=lambda phase: {"D"} if phase == "Phase1" else {"L"} if phase == "GLOBAL" else set(),
+        diagrams_for_module=lambda phase: _PHASE_DIAGRAMS.get(phase, frozenset()),
         list_modules=lambda: ["Phase1", "GLOBAL"],
-        module_for_diagram=lambda name: "Phase1" if name == "D" else "GLOBAL",
+        module_for_diagram=lambda name: _DIAGRAM_PHASES.get(name, "GLOBAL"),
         list_diagrams=lambda: {"D", "L"},
     )
     win.toolbox = toolbox
@@ -59,31 +77,31 @@ def test_phase_requirement_updates_existing(monkeypatch):
     win = _setup_window(monkeypatch)
 
     # First generation with organizational type
-    monkeypatch.setattr(
-        smt.GovernanceDiagram,
-        "from_repository",
-        lambda repo, diag_id: DummyGov([("Req", "organizational")]),
-    )
-    global_requirements.clear()
-    win.generate_phase_requirements("Phase1")
-    rids = list(global_requirements.keys())
-    assert len(rids) == 1
-    rid1 = rids[0]
+    with monkeypatch.context() as m:
+        m.setattr(
+            smt.GovernanceDiagram,
+            "from_repository",
+            lambda repo, diag_id: DummyGov([("Req", "organizational")]),
+        )
+        win.generate_phase_requirements("Phase1")
+    # The autouse fixture starts the registry empty, so it holds only the
+    # requirements generated here.
+    (rid1,) = global_requirements
     assert global_requirements[rid1]["phase"] == "Phase1"
     assert global_requirements[rid1]["req_type"] == "organizational"
     assert global_requirements[rid1]["status"] == "draft"
 
     # Regenerate with a different type; old requirement becomes obsolete and a
     # new one is created
-    monkeypatch.setattr(
-        smt.GovernanceDiagram,
-        "from_repository",
-        lambda repo, diag_id: DummyGov([("Req", "product")]),
-    )
-    win.generate_phase_requirements("Phase1")
-    assert len(global_requirements) == 2
+    with monkeypatch.context() as m:
+        m.setattr(
+            smt.GovernanceDiagram,
+            "from_repository",
+            lambda repo, diag_id: DummyGov([("Req", "product")]),
+        )
+        win.generate_phase_requirements("Phase1")
+    (new_rid,) = global_requirements.keys() - {rid1}
     assert global_requirements[rid1]["status"] == "obsolete"
-    new_rid = next(r for r in global_requirements if r != rid1)
     assert global_requirements[new_rid]["req_type"] == "product"
     assert global_requirements[new_rid]["status"] == "draft"
 
@@ -91,19 +109,21 @@ def test_phase_requirement_updates_existing(monkeypatch):
 def test_phase_requirement_no_change(monkeypatch):
     win = _setup_window(monkeypatch)
 
+    gov = DummyGov([("Req", "organizational")])
     monkeypatch.setattr(
-        smt.GovernanceDiagram,
-        "from_repository",
-        lambda repo, diag_id: DummyGov([("Req", "organizational")]),
+        smt.GovernanceDiagram, "from_repository", lambda repo, diag_id: gov
     )
-    global_requirements.clear()
     win.generate_phase_requirements("Phase1")
-    rid = next(iter(global_requirements))
+    (rid,) = global_requirements
+    req = global_requirements[rid]
 
-    # Regenerate without changes; requirement should remain and not become obsolete
+    # Regenerate without changes; the unchanged requirement set takes the early
+    # return, so the existing entry is left untouched rather than rebuilt
     win.generate_phase_requirements("Phase1")
+    assert gov.calls == 2
     assert len(global_requirements) == 1
-    assert global_requirements[rid]["status"] == "draft"
+    assert global_requirements[rid] is req
+    assert req["status"] == "draft"
 
 
 def test_lifecycle_requirements_visible_in_phases(monkeypatch):
@@ -125,7 +145,6 @@ def test_lifecycle_requirements_visible_in_phases(monkeypatch):
         return types.SimpleNamespace(refresh_table=lambda ids: None)
     win._display_requirements = display_stub
 
-    global_requirements.clear()
     # Generate lifecycle requirement
     win.generate_lifecycle_requirements()
     life_rid = next(iter(global_requirements))
@@ -139,7 +158,6 @@ def test_lifecycle_requirements_visible_in_phases(monkeypatch):
 
 def test_delete_obsolete(monkeypatch):
     win = _setup_window(monkeypatch)
-    global_requirements.clear()
     global_requirements.update(
         {
             "obs": {"status": "obsolete"},
@@ -183,7 +201,6 @@ def test_lifecycle_tab_refresh(monkeypatch):
 
     win._display_requirements = display_stub
 
-    global_requirements.clear()
     win.generate_lifecycle_requirements()
     frame = frames[0]
     assert frame.ids  # initial requirement present
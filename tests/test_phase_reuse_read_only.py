@@ -17,10 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from dataclasses import asdict
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from gui.architecture import SysMLObject, DiagramConnection, rename_block, rename_port
 from analysis.safety_management import SafetyManagementToolbox, GovernanceModule
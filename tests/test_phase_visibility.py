@@ -75,6 +75,29 @@ def test_diagram_objects_and_connections_follow_phase_visibility():
     assert repo.visible_connections(diag.diag_id)
 
 
+def test_visible_objects_track_diagram_changes():
+    repo = SysMLRepository.reset_instance()
+    toolbox = SafetyManagementToolbox()
+    toolbox.modules = [GovernanceModule("P1"), GovernanceModule("P2")]
+    toolbox.set_active_module("P1")
+    diag = repo.create_diagram("Block Definition Diagram")
+    diag.objects.append(asdict(SysMLObject(1, "Block", 0.0, 0.0)))
+    first = repo.visible_objects(diag.diag_id)
+    assert first[0] is diag.objects[0]
+    diag.objects.append(asdict(SysMLObject(2, "Block", 0.0, 0.0)))
+    assert [o["obj_id"] for o in repo.visible_objects(diag.diag_id)] == [1, 2]
+    diag.objects[0] = asdict(SysMLObject(3, "Block", 0.0, 0.0))
+    assert repo.visible_objects(diag.diag_id)[0] is diag.objects[0]
+    toolbox.set_active_module("P2")
+    assert repo.visible_objects(diag.diag_id) == []
+    toolbox.set_active_module("P1")
+    assert len(repo.visible_objects(diag.diag_id)) == 2
+    diag.objects[1]["phase"] = "P2"
+    assert [o["obj_id"] for o in repo.visible_objects(diag.diag_id)] == [3]
+    repo.set_diagram_phase(diag.diag_id, "P2")
+    assert repo.visible_objects(diag.diag_id) == []
+
+
 def test_diagram_window_respects_phase():
     repo = SysMLRepository.reset_instance()
     toolbox = SafetyManagementToolbox()
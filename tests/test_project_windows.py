@@ -19,12 +19,9 @@
 """Project window lifecycle tests."""
 
 import os
-import sys
 import tkinter as tk
 import pytest
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
 from gui.utils.closable_notebook import ClosableNotebook
 from mainappsrc.managers.project_manager import ProjectManager
 
@@ -17,9 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import unittest
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from gui.architecture import SysMLObject, SysMLDiagramWindow
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository, SysMLDiagram
 
@@ -17,7 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import sys
-import os
 import unittest
 
 import tests.test_cause_effect_diagram as base_stub
@@ -28,7 +27,6 @@ if PIL_stub is None:
     raise RuntimeError("Pillow stub not loaded")
 PIL_stub.ImageTk = object
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from AutoML import AutoMLApp
 
 class CauseEffectPDFTests(unittest.TestCase):
@@ -20,7 +20,6 @@
 import unittest
 import os
 import sys
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
 from analysis.user_config import set_current_user
 
@@ -71,11 +70,251 @@ class RepositoryTests(unittest.TestCase):
         self.assertIn("Car", js)
         self.assertIn(blk.elem_id, js)
 
+    def test_serialize_matches_stdlib_json(self):
+        import json
+
+        self.repo.create_element("Block", name="Größe", properties={"mass": "1"})
+        data = self.repo.to_dict()
+        self.assertEqual(json.loads(self.repo.serialize()), data)
+        path = "repo_encoding.json"
+        self.repo.save(path)
+        SysMLRepository._instance = None
+        new_repo = SysMLRepository.get_instance()
+        new_repo.load(path)
+        os.remove(path)
+        self.assertEqual(new_repo.to_dict(), data)
+
+    def test_non_finite_properties_round_trip(self):
+        import math
+
+        blk = self.repo.create_element(
+            "Block", name="B", properties={"mass": float("nan"), "limit": float("inf")}
+        )
+        js = self.repo.serialize()
+        self.assertIn("NaN", js)
+        self.assertIn("Infinity", js)
+        path = "repo_non_finite.json"
+        self.repo.save(path)
+        SysMLRepository._instance = None
+        new_repo = SysMLRepository.get_instance()
+        new_repo.load(path)
+        os.remove(path)
+        props = new_repo.elements[blk.elem_id].properties
+        self.assertTrue(math.isnan(props["mass"]))
+        self.assertEqual(props["limit"], float("inf"))
+
+    def test_type_names_are_interned(self):
+        import json
+
+        self.repo.create_element("".join(["Blo", "ck"]), name="A")
+        self.repo.create_diagram("Block Diagram", name="BD")
+        self.repo.from_dict(json.loads(self.repo.serialize()))
+        for elem in self.repo.elements.values():
+            self.assertIs(elem.elem_type, sys.intern(elem.elem_type))
+        for diag in self.repo.diagrams.values():
+            self.assertIs(diag.diag_type, sys.intern(diag.diag_type))
+
+    def test_to_dict_matches_asdict(self):
+        from dataclasses import asdict
+
+        blk = self.repo.create_element("Block", name="Car", properties={"mass": "1"})
+        rel = self.repo.create_relationship("Association", blk.elem_id, blk.elem_id)
+        diag = self.repo.create_diagram("Block Diagram", name="BD")
+        diag.objects = [{"obj_id": 1, "properties": {"name": "Car"}, "requirements": []}]
+        for item in (blk, rel, diag):
+            data = item.to_dict()
+            self.assertEqual(data, asdict(item))
+            self.assertEqual(list(data), list(asdict(item)))
+        copied = diag.to_dict()["objects"][0]
+        self.assertIsNot(copied["properties"], diag.objects[0]["properties"])
+
+    def test_undo_snapshots_share_unchanged_entries(self):
+        a = self.repo.create_element("Block", name="A")
+        self.repo.create_element("Block", name="B")
+        self.repo.push_undo_state(sync_app=False)
+        first = self.repo._undo_stack[-1]
+        self.repo.touch_element(a.elem_id)
+        a.name = "A2"
+        self.repo.push_undo_state(sync_app=False)
+        second = self.repo._undo_stack[-1]
+        shared = [
+            e for e in second["elements"]
+            if any(e is old for old in first["elements"])
+        ]
+        self.assertEqual(len(shared), len(second["elements"]) - 1)
+        self.assertTrue(self.repo.undo())
+        redo_state = self.repo._redo_stack[-1]
+        self.assertNotIn("_undo_stack", redo_state)
+        shared = [
+            e for e in redo_state["elements"]
+            if any(e is old for old in first["elements"])
+        ]
+        self.assertEqual(len(shared), len(redo_state["elements"]) - 1)
+        self.repo.elements[a.elem_id].properties["k"] = "v"
+        self.assertTrue(all("k" not in e["properties"] for e in first["elements"]))
+
+    def test_undo_history_is_capped(self):
+        for i in range(60):
+            self.repo.create_element("Block", name=f"B{i}")
+            self.repo.push_undo_state(sync_app=False)
+        self.assertEqual(len(self.repo._undo_stack), 50)
+        self.assertEqual(
+            len(self.repo._undo_stack[-1]["elements"]), len(self.repo.elements)
+        )
+
+    def test_from_dict_resolves_part_definition_names(self):
+        blk = self.repo.create_element("Block", name="Engine")
+        part = self.repo.create_element(
+            "Part", name="P", properties={"definition": "Engine"}
+        )
+        diag = self.repo.create_diagram("Internal Block Diagram", name="IBD")
+        diag.objects = [
+            {"obj_id": 1, "obj_type": "Part", "properties": {"definition": "Engine"}},
+            {"obj_id": 2, "obj_type": "Part", "properties": {"definition": "Other"}},
+        ]
+        self.repo.from_dict(self.repo.to_dict())
+        self.assertEqual(
+            self.repo.elements[part.elem_id].properties["definition"], blk.elem_id
+        )
+        objs = self.repo.diagrams[diag.diag_id].objects
+        self.assertEqual(objs[0]["properties"]["definition"], blk.elem_id)
+        self.assertEqual(objs[1]["properties"]["definition"], "Other")
+
+    def test_delete_package_is_one_undo_step(self):
+        pkg = self.repo.create_package("Pkg")
+        blk = self.repo.create_element("Block", name="B", owner=pkg.elem_id)
+        self.repo.push_undo_state(sync_app=False)
+        depth = len(self.repo._undo_stack)
+        self.repo.delete_package(pkg.elem_id)
+        self.assertEqual(len(self.repo._undo_stack), depth)
+        self.assertTrue(self.repo.undo())
+        self.assertIn(pkg.elem_id, self.repo.elements)
+        self.assertEqual(self.repo.elements[blk.elem_id].owner, pkg.elem_id)
+
+    def test_noop_mutations_skip_undo_snapshots(self):
+        blk = self.repo.create_element("Block", name="A")
+        diag = self.repo.create_diagram("Activity Diagram", name="AD")
+        self.repo.link_diagram(blk.elem_id, diag.diag_id)
+        calls = []
+        original = self.repo.push_undo_state
+        self.repo.push_undo_state = lambda *a, **k: calls.append(1) or original(*a, **k)
+        self.repo.link_diagram(blk.elem_id, diag.diag_id)
+        self.repo.delete_element("missing")
+        self.repo.delete_diagram("missing")
+        self.assertEqual(calls, [])
+        self.repo.delete_diagram(diag.diag_id)
+        self.assertEqual(len(calls), 1)
+        self.assertIsNone(self.repo.get_linked_diagram(blk.elem_id))
+
+    def test_elements_of_type_follows_model_changes(self):
+        from mainappsrc.models.sysml.sysml_repository import SysMLElement
+
+        b1 = self.repo.create_element("Block", name="B1")
+        self.assertEqual(self.repo.elements_of_type("Block"), [b1])
+        b2 = self.repo.create_element("Block", name="B2")
+        self.repo.delete_element(b1.elem_id)
+        self.assertEqual(self.repo.elements_of_type("Block"), [b2])
+        extra = SysMLElement("x", "Block", name="X")
+        self.repo.elements[extra.elem_id] = extra
+        self.assertEqual(self.repo.elements_of_type("Block"), [b2, extra])
+        self.repo.from_dict(self.repo.to_dict())
+        self.assertEqual(
+            [e.name for e in self.repo.elements_of_type("Block")], ["B2", "X"]
+        )
+        self.assertEqual(self.repo.elements_of_type("Package"), [self.repo.root_package])
+
+    def test_get_relationship_tracks_list_changes(self):
+        a = self.repo.create_element("Block", name="A")
+        b = self.repo.create_element("Block", name="B")
+        r1 = self.repo.create_relationship("Association", a.elem_id, b.elem_id)
+        self.assertIs(self.repo.get_relationship(r1.rel_id), r1)
+        r2 = self.repo.create_relationship("Association", b.elem_id, a.elem_id)
+        self.assertIs(self.repo.get_relationship(r2.rel_id), r2)
+        self.repo.relationships = [r2]
+        self.assertIs(self.repo.get_relationship(r2.rel_id), r2)
+        self.repo.from_dict(self.repo.to_dict())
+        reloaded = self.repo.get_relationship(r2.rel_id)
+        self.assertIs(reloaded, self.repo.relationships[0])
+        self.assertIsNot(reloaded, r2)
+        self.assertIsNone(self.repo.get_relationship("missing"))
+
+    def test_taken_diagram_names_cover_separator_prefixes(self):
+        from mainappsrc.models.sysml.sysml_repository import _taken_diagram_names
+
+        taken = _taken_diagram_names(["Ctrl Loop_2", ""])
+        self.assertEqual(taken, {"Ctrl Loop_2", "Ctrl", "Ctrl Loop"})
+        d1 = self.repo.create_diagram("Block Diagram", name="Ctrl")
+        d2 = self.repo.create_diagram("Block Diagram", name="Ctrl")
+        self.assertEqual((d1.name, d2.name), ("Ctrl", "Ctrl_1"))
+
     def test_sysml_properties_port(self):
         from mainappsrc.models.sysml.sysml_spec import SYSML_PROPERTIES
         self.assertIn("PortUsage", SYSML_PROPERTIES)
         self.assertIn("direction", SYSML_PROPERTIES["PortUsage"])
 
+    def test_sysml_properties_cache_follows_source_mtime(self):
+        import tempfile
+        from mainappsrc.models.sysml import sysml_spec
+
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "SysML.xmi")
+            cache = os.path.join(tmp, "cache", "props.json")
+            with open(src, "w", encoding="utf-8") as f:
+                f.write("<xmi:XMI/>")
+            sysml_spec._write_cached_properties(src, cache, {"BlockUsage": ["ports"]})
+            os.utime(src, (0, 0))
+            self.assertEqual(
+                sysml_spec._read_cached_properties(src, cache),
+                {"BlockUsage": ["ports"]},
+            )
+            os.utime(cache, (0, 0))
+            os.utime(src, None)
+            self.assertIsNone(sysml_spec._read_cached_properties(src, cache))
+
+    def test_sysml_properties_cache_rejects_other_parser_version(self):
+        import json
+        import tempfile
+        from mainappsrc.models.sysml import sysml_spec
+
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "SysML.xmi")
+            cache = os.path.join(tmp, "props.json")
+            with open(src, "w", encoding="utf-8") as f:
+                f.write("<xmi:XMI/>")
+            os.utime(src, (0, 0))
+            sysml_spec._write_cached_properties(src, cache, {"BlockUsage": ["ports"]})
+            with open(cache, encoding="utf-8") as f:
+                data = json.load(f)
+            data["key"] = "0:old"
+            with open(cache, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            self.assertIsNone(sysml_spec._read_cached_properties(src, cache))
+            sysml_spec._write_cached_properties(src, cache, {"BlockUsage": []})
+            other = os.path.join(tmp, "Other.xmi")
+            with open(other, "w", encoding="utf-8") as f:
+                f.write("<xmi:XMI/>")
+            os.utime(other, (0, 0))
+            self.assertIsNone(sysml_spec._read_cached_properties(other, cache))
+
+    def test_parse_xmi_properties_single_pass(self):
+        from mainappsrc.models.sysml.sysml_spec import _parse_xmi_properties
+
+        text = (
+            "header\n<xmi:XMI>"
+            '<packagedElement xmi:type="uml:Class" name="A">'
+            '<ownedComment body="<p>raw</p>"/>'
+            '<ownedAttribute xmi:id="a1" name="x"/>'
+            '<ownedAttribute xmi:id="a2" name="y"/>'
+            "</packagedElement>"
+            '<packagedElement xmi:type="uml:Package" name="P">'
+            '<ownedAttribute name="ignored"/>'
+            "</packagedElement>"
+            '<packagedElement xmi:type="uml:Class" name="B"></packagedElement>'
+            "</xmi:XMI>"
+        )
+        self.assertEqual(_parse_xmi_properties(text), {"A": ["x", "y"], "B": []})
+        self.assertIsNone(_parse_xmi_properties("<root/>"))
+
     def test_action_usage_property_removed(self):
         """Ensure derived ActionUsage attributes are excluded."""
         from mainappsrc.models.sysml.sysml_spec import SYSML_PROPERTIES
@@ -124,6 +363,29 @@ class RepositoryTests(unittest.TestCase):
         new_repo.load(path)
         os.remove(path)
         self.assertEqual(new_repo.get_linked_diagram(uc.elem_id), ad.diag_id)
+        self.assertEqual(new_repo.get_linking_elements(ad.diag_id), {uc.elem_id})
+
+    def test_linking_elements_follow_relinks(self):
+        uc = self.repo.create_element("Use Case")
+        ad1 = self.repo.create_diagram("Activity Diagram", name="AD1")
+        ad2 = self.repo.create_diagram("Activity Diagram", name="AD2")
+        self.repo.link_diagram(uc.elem_id, ad1.diag_id)
+        self.repo.link_diagram(uc.elem_id, ad2.diag_id)
+        self.assertEqual(self.repo.get_linking_elements(ad1.diag_id), set())
+        self.assertEqual(self.repo.get_linking_elements(ad2.diag_id), {uc.elem_id})
+        self.assertIsNone(self.repo.get_linking_element(ad1.diag_id))
+        self.assertEqual(self.repo.get_linking_element(ad2.diag_id), uc.elem_id)
+        self.repo.delete_diagram(ad2.diag_id)
+        self.assertIsNone(self.repo.get_linked_diagram(uc.elem_id))
+        self.assertEqual(self.repo.get_linking_elements(ad2.diag_id), set())
+
+    def test_frozen_diagrams_follow_locked_flag(self):
+        diag = self.repo.create_diagram("Block Diagram", name="BD")
+        self.assertEqual(self.repo.frozen_diagrams, frozenset())
+        diag.locked = True
+        self.assertEqual(self.repo.frozen_diagrams, {diag.diag_id})
+        with self.assertRaises(AttributeError):
+            self.repo.frozen_diagrams.add("other")
 
     def test_diagram_package(self):
         pkg = self.repo.create_package("PkgA")
@@ -218,6 +480,10 @@ class RepositoryTests(unittest.TestCase):
         matches = self.repo.find_requirements("R1")
         self.assertEqual(matches, [(diag.diag_id, 1)])
         self.assertEqual(self.repo.find_requirements("R2"), [])
+        self.assertEqual(
+            self.repo.requirement_allocations(), {"R1": [(diag.diag_id, 1)]}
+        )
+        self.assertEqual(self.repo.requirement_trace_labels(), {"R1": ["UC:User"]})
 
     def test_connection_persistence(self):
         diag = self.repo.create_diagram("Block Diagram", name="BD")
@@ -252,6 +518,24 @@ class RepositoryTests(unittest.TestCase):
         e2 = self.repo.create_element("Actor", name="Dup")
         self.assertNotEqual(e1.name, e2.name)
 
+    def test_unique_element_names_reuse_freed_suffixes(self):
+        elems = [self.repo.create_element("Block", name="Dup") for _ in range(4)]
+        self.assertEqual(
+            [e.name for e in elems], ["Dup", "Dup_1", "Dup_2", "Dup_3"]
+        )
+        self.repo.delete_element(elems[2].elem_id)
+        self.assertEqual(self.repo.create_element("Block", name="Dup").name, "Dup_2")
+        self.repo.rename_element(elems[1].elem_id, "Other")
+        self.assertEqual(self.repo.ensure_unique_element_name("Other"), "Other_1")
+        self.assertEqual(self.repo.create_element("Block", name="Dup").name, "Dup_1")
+        self.assertEqual(self.repo.create_element("Block", name="Dup").name, "Dup_4")
+        self.assertEqual(
+            self.repo.ensure_unique_element_name("Dup_1", elems[0].elem_id), "Dup_1_1"
+        )
+        blocks = [self.repo.create_element("Block") for _ in range(3)]
+        self.repo.delete_element(blocks[0].elem_id)
+        self.assertEqual(self.repo.create_element("Block").name, blocks[0].name)
+
     def test_to_from_dict(self):
         diag = self.repo.create_diagram("Use Case Diagram", name="UC")
         actor = self.repo.create_element("Actor", name="User")
@@ -263,6 +547,17 @@ class RepositoryTests(unittest.TestCase):
         self.assertIn(diag.diag_id, new_repo.diagrams)
         self.assertIn(actor.elem_id, new_repo.diagrams[diag.diag_id].elements)
 
+    def test_from_dict_normalizes_requirement_ids(self):
+        diag = self.repo.create_diagram("Use Case Diagram", name="UC")
+        diag.objects = [{"obj_id": 1, "obj_type": "Actor", "requirements": ["R1"]}]
+        data = self.repo.to_dict()
+        SysMLRepository._instance = None
+        new_repo = SysMLRepository.get_instance()
+        new_repo.from_dict(data)
+        obj = new_repo.diagrams[diag.diag_id].objects[0]
+        self.assertEqual(obj["requirements"], [{"id": "R1"}])
+        self.assertEqual(new_repo.find_requirements("R1"), [(diag.diag_id, 1)])
+
     def test_save_load_consistency(self):
         """Ensure saved JSON matches data reloaded from disk."""
         pkg = self.repo.create_package("Pkg")
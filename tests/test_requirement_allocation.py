@@ -18,9 +18,6 @@
 
 import types
 import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 from gui.architecture import SysMLObjectDialog, SysMLObject
 from analysis.safety_management import SafetyWorkProduct, SafetyManagementToolbox
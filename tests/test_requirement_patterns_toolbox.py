@@ -17,11 +17,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import sys
-from pathlib import Path
 import types
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 PIL_stub = types.ModuleType("PIL")
 PIL_stub.Image = types.SimpleNamespace()
 PIL_stub.ImageTk = types.SimpleNamespace()
@@ -33,9 +30,6 @@ sys.modules.setdefault("PIL.ImageTk", PIL_stub.ImageTk)
 sys.modules.setdefault("PIL.ImageDraw", PIL_stub.ImageDraw)
 sys.modules.setdefault("PIL.ImageFont", PIL_stub.ImageFont)
 
-from AutoML import AutoMLApp
-import tkinter as tk
-import pytest
 from gui.requirement_patterns_toolbox import RequirementPatternsEditor
 
 
@@ -53,11 +47,11 @@ def test_requirement_patterns_toolbox_single_instance():
         def select(self, tab):
             pass
 
-    class DummyEditor:
-        created = 0
+    created = []
 
+    class DummyEditor:
         def __init__(self, master, app, path):
-            DummyEditor.created += 1
+            created.append(self)
 
         def pack(self, **kwargs):
             pass
@@ -65,6 +59,7 @@ def test_requirement_patterns_toolbox_single_instance():
         def winfo_exists(self):
             return True
 
+    from AutoML import AutoMLApp
     import gui.requirement_patterns_toolbox as rpt
 
     rpt.RequirementPatternsEditor = DummyEditor
@@ -81,23 +76,20 @@ def test_requirement_patterns_toolbox_single_instance():
     app = DummyApp()
     app.open_requirement_patterns_toolbox()
     app.open_requirement_patterns_toolbox()
-    assert DummyEditor.created == 1
+    assert len(created) == 1
 
 
-def test_pattern_tree_wraps_text(tmp_path):
-    try:
-        root = tk.Tk()
-    except tk.TclError:
-        pytest.skip("Tk not available")
-
+def test_pattern_tree_wraps_text(tmp_path, tk_session_root):
     cfg = tmp_path / "patterns.json"
     cfg.write_text("[]")
 
-    editor = RequirementPatternsEditor(root, object(), cfg)
-    editor.data = [{"Trigger": "A " * 30, "Template": "B " * 30}]
-    editor._populate_pattern_tree()
-    vals = editor.tree.item(editor.tree.get_children()[0], "values")
-    assert vals[0] == "1"
-    assert "\n" in vals[1]
-    assert "\n" in vals[2]
-    root.destroy()
+    editor = RequirementPatternsEditor(tk_session_root, object(), cfg)
+    try:
+        editor.data = [{"Trigger": "A " * 30, "Template": "B " * 30}]
+        editor._populate_pattern_tree()
+        vals = editor.tree.item(editor.tree.get_children()[0], "values")
+        assert vals[0] == "1"
+        assert "\n" in vals[1]
+        assert "\n" in vals[2]
+    finally:
+        editor.destroy()
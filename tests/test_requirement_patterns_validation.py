@@ -18,11 +18,9 @@
 
 import json
 from pathlib import Path
-import sys
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 from config import load_requirement_patterns, validate_requirement_patterns
 
 
@@ -17,17 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import types
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-# Provide dummy PIL modules so AutoML can be imported without Pillow
-sys.modules.setdefault("PIL", types.ModuleType("PIL"))
-sys.modules.setdefault("PIL.Image", types.ModuleType("Image"))
-sys.modules.setdefault("PIL.ImageTk", types.ModuleType("ImageTk"))
-sys.modules.setdefault("PIL.ImageDraw", types.ModuleType("ImageDraw"))
-sys.modules.setdefault("PIL.ImageFont", types.ModuleType("ImageFont"))
 
 from AutoML import EditNodeDialog
 from analysis.models import global_requirements
@@ -16,12 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
-import sys
 import pytest
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
 from analysis.safety_management import SafetyManagementToolbox
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
 from analysis.models import global_requirements
@@ -76,20 +72,11 @@ def test_link_requirements_respects_governance():
 
 
 def test_non_requirement_work_product_ignored():
-    SysMLRepository.reset_instance()
-    repo = SysMLRepository.get_instance()
-    toolbox = SafetyManagementToolbox()
-    gov = repo.create_diagram("Governance Diagram", name="Gov")
-    toolbox.diagrams["Gov"] = gov.diag_id
-    gov.objects = [
-        {"obj_id": 1, "obj_type": "Work Product", "x": 0, "y": 0, "properties": {"name": "Requirement Specification"}},
-        {"obj_id": 2, "obj_type": "Work Product", "x": 0, "y": 100, "properties": {"name": "Requirement Specification"}},
-        {"obj_id": 3, "obj_type": "Work Product", "x": 0, "y": 200, "properties": {"name": "Architecture Diagram"}},
-    ]
-    gov.connections = [
-        {"src": 1, "dst": 2, "stereotype": "satisfied by"},
-        {"src": 1, "dst": 3, "stereotype": "satisfied by"},
-    ]
-    toolbox.add_work_product("Gov", "Requirement Specification", "")
+    toolbox = setup_toolbox()
+    gov = SysMLRepository.get_instance().diagrams[toolbox.diagrams["Gov"]]
+    gov.objects.append(
+        {"obj_id": 3, "obj_type": "Work Product", "x": 0, "y": 200, "properties": {"name": "Architecture Diagram"}}
+    )
+    gov.connections.append({"src": 1, "dst": 3, "stereotype": "satisfied by"})
     mapping = toolbox._req_relation_mapping()
     assert mapping.get("Requirement Specification", {}).get("satisfied by") == {"Requirement Specification"}
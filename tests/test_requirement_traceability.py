@@ -16,9 +16,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import types
 import unittest
 
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
+from mainappsrc.managers.requirements_manager import RequirementsManagerSubApp
 from gui.architecture import SysMLObject
 from gui.toolboxes import find_requirement_traces
 from analysis.models import global_requirements
@@ -48,6 +50,31 @@ class RequirementTraceabilityTests(unittest.TestCase):
         traces = find_requirement_traces("R1")
         self.assertIn("BD:B1", traces)
 
+    def test_allocation_names_accept_prebuilt_allocations(self):
+        global_requirements["R1"] = {"id": "R1", "text": "Req1"}
+        diag = self.repo.create_diagram("Block Definition Diagram", name="BD")
+        for oid, name in ((1, "B1"), (2, "")):
+            obj = SysMLObject(
+                oid,
+                "Block",
+                0,
+                0,
+                properties={"name": name},
+                requirements=[global_requirements["R1"]],
+            )
+            diag.objects.append(obj.__dict__)
+        app = types.SimpleNamespace(
+            root_node=None, get_all_nodes=lambda root: [], fmeas=[]
+        )
+        manager = RequirementsManagerSubApp(app)
+        expected = ["BD:B1", "BD", "B1", "Block"]
+        self.assertEqual(manager.get_requirement_allocation_names("R1"), expected)
+        allocations = self.repo.requirement_allocations()
+        self.assertEqual(
+            manager.get_requirement_allocation_names("R1", allocations), expected
+        )
+        self.assertEqual(manager.get_requirement_allocation_names("R2", allocations), [])
+
 
 if __name__ == "__main__":
     unittest.main()
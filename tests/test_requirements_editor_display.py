@@ -17,14 +17,10 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """Requirements editor display tests."""
 
-from pathlib import Path
-import sys
 import tkinter as tk
 import types
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from analysis.models import global_requirements
 from mainappsrc.core.editors import Editors
 
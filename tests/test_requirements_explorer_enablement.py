@@ -16,14 +16,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import sys
 import types
-from pathlib import Path
 
 import tkinter as tk
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from AutoML import AutoMLApp
 
 
@@ -17,10 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import types
-import os
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from analysis.models import (
     HazopDoc,
@@ -16,19 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import types
-import sys
-from pathlib import Path
-
 # Ensure project root on path and stub optional GUI modules
-ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT))
-
-sys.modules.setdefault('PIL', types.ModuleType('PIL'))
-sys.modules.setdefault('PIL.Image', types.ModuleType('PIL.Image'))
-sys.modules.setdefault('PIL.ImageDraw', types.ModuleType('PIL.ImageDraw'))
-sys.modules.setdefault('PIL.ImageFont', types.ModuleType('PIL.ImageFont'))
-sys.modules.setdefault('PIL.ImageTk', types.ModuleType('PIL.ImageTk'))
 
 from mainappsrc.models.fta.fault_tree_node import FaultTreeNode
 from mainappsrc.services.safety_analysis import SafetyAnalysisService
@@ -16,21 +16,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
-import sys
 import types
 import math
 import csv
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
-# Stub out Pillow modules so AutoML can be imported without the dependency
-sys.modules.setdefault("PIL", types.ModuleType("PIL"))
-sys.modules.setdefault("PIL.Image", types.ModuleType("PIL.Image"))
-sys.modules.setdefault("PIL.ImageTk", types.ModuleType("PIL.ImageTk"))
-sys.modules.setdefault("PIL.ImageDraw", types.ModuleType("PIL.ImageDraw"))
-sys.modules.setdefault("PIL.ImageFont", types.ModuleType("PIL.ImageFont"))
-
 from mainappsrc.models.gsn import GSNNode, GSNDiagram
 from AutoML import AutoMLApp
 if __package__ and __package__.startswith("AutoML"):
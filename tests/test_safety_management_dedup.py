@@ -17,12 +17,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import sys
-from pathlib import Path
 import types
 
-# Ensure repository root on path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 # Stub out Pillow dependencies so importing the main app doesn't require Pillow
 PIL_stub = types.ModuleType("PIL")
 PIL_stub.Image = types.SimpleNamespace()
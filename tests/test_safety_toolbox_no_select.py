@@ -16,12 +16,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import sys
 from pathlib import Path
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 
 def test_safety_ai_toolbox_excludes_select():
     arch_path = Path(__file__).resolve().parents[1] / "gui" / "architecture.py"
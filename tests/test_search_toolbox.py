@@ -16,12 +16,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
-import sys
 import unittest
 from unittest.mock import patch
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from gui import search_toolbox  # noqa: E402
 from gui.controls import messagebox  # noqa: E402
 
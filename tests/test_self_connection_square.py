@@ -18,11 +18,6 @@
 
 import tkinter as tk
 
-import os
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
 from gui.drawing_helper import GSNDrawingHelper
 from gui.architecture import SysMLDiagramWindow, SysMLObject, DiagramConnection
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository, SysMLDiagram
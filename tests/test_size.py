@@ -21,15 +21,16 @@ from gui.architecture import SysMLObject, SysMLDiagramWindow
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
 
 class DummyFont:
-    def measure(self, text: str) -> int:
-        return len(text)
+    # Width in pixels equals the character count, like a one-pixel
+    # monospace font; ``len`` avoids a Python frame per measurement.
+    measure = staticmethod(len)
 
     def metrics(self, name: str) -> int:
         return 1
 
 class DummyWindow:
     def __init__(self):
-        self.repo = SysMLRepository.get_instance()
+        self.repo = None
         self.zoom = 1.0
         self.font = DummyFont()
 
@@ -43,12 +44,15 @@ class DummyWindow:
     _resize_block_to_content = SysMLDiagramWindow._resize_block_to_content
 
 class EnsureTextFitsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.win = DummyWindow()
+
     def setUp(self):
-        SysMLRepository._instance = None
-        self.repo = SysMLRepository.get_instance()
+        self.repo = self.win.repo = SysMLRepository.reset_instance()
 
     def test_part_width_expands_for_properties(self):
-        win = DummyWindow()
+        win = self.win
         part = SysMLObject(
             1,
             "Part",
@@ -63,7 +67,7 @@ class EnsureTextFitsTests(unittest.TestCase):
         self.assertGreater(part.width, 10)
 
     def test_action_width_does_not_expand_for_name(self):
-        win = DummyWindow()
+        win = self.win
         action = SysMLObject(
             1,
             "Action",
@@ -78,7 +82,7 @@ class EnsureTextFitsTests(unittest.TestCase):
         self.assertEqual(action.width, 10)
 
     def test_action_min_size(self):
-        win = DummyWindow()
+        win = self.win
         elem = win.repo.create_element("Action", name="Act")
         action = SysMLObject(
             1,
@@ -96,33 +100,25 @@ class EnsureTextFitsTests(unittest.TestCase):
         self.assertEqual(min_h, 7)
 
     def test_decision_and_merge_sizes_remain_fixed(self):
-        win = DummyWindow()
-        decision = SysMLObject(
-            1,
-            "Decision",
-            0,
-            0,
-            width=40,
-            height=40,
-            properties={"name": "Decide"},
-        )
-        merge = SysMLObject(
-            2,
-            "Merge",
-            0,
-            0,
-            width=40,
-            height=40,
-            properties={"name": "MergeNode"},
-        )
-        for obj in (decision, merge):
-            obj.requirements = []
-            win.ensure_text_fits(obj)
-            self.assertEqual(obj.width, 40)
-            self.assertEqual(obj.height, 40)
+        win = self.win
+        for obj_id, obj_type, name in ((1, "Decision", "Decide"), (2, "Merge", "MergeNode")):
+            with self.subTest(obj_type=obj_type):
+                obj = SysMLObject(
+                    obj_id,
+                    obj_type,
+                    0,
+                    0,
+                    width=40,
+                    height=40,
+                    properties={"name": name},
+                )
+                obj.requirements = []
+                win.ensure_text_fits(obj)
+                self.assertEqual(obj.width, 40)
+                self.assertEqual(obj.height, 40)
 
     def test_role_size_remains_fixed(self):
-        win = DummyWindow()
+        win = self.win
         role = SysMLObject(
             1,
             "Role",
@@ -138,7 +134,7 @@ class EnsureTextFitsTests(unittest.TestCase):
         self.assertEqual(role.height, 40)
 
     def test_data_acquisition_default_and_resize(self):
-        win = DummyWindow()
+        win = self.win
         obj = SysMLObject(
             1,
             "Data acquisition",
@@ -160,7 +156,7 @@ class EnsureTextFitsTests(unittest.TestCase):
         self.assertGreater(obj.height, 80)
 
     def test_block_resizes_when_compartments_toggle(self):
-        win = DummyWindow()
+        win = self.win
         block = SysMLObject(
             1,
             "Block",
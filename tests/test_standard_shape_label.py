@@ -16,15 +16,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import sys
-from pathlib import Path
 from types import SimpleNamespace
 import tkinter.font as tkFont
 
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from gui.architecture import SysMLDiagramWindow
 from gui.style_manager import StyleManager
 
@@ -17,175 +17,139 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import types
-import os
-import sys
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+import pytest
 
 from analysis.models import StpaEntry
+from gui import stpa_window
 from gui.stpa_window import StpaWindow
 
 
-def test_row_dialog_populates_control_actions(monkeypatch):
-    """The control action combo box should list actions and preselect one."""
-
-    app = types.SimpleNamespace()
-    parent = StpaWindow.__new__(StpaWindow)
-    parent.app = app
-    parent._get_control_actions = lambda: ["Act"]
-
-    # ------------------------------------------------------------------
-    # Stub tkinter widgets so the dialog can be created without a display
-    # ------------------------------------------------------------------
-    class DummyWidget:
-        def __init__(self, *args, **kwargs):
-            self.configured = {}
-
-        def grid(self, *a, **k):
-            pass
+# ----------------------------------------------------------------------
+# Stub tkinter widgets so the dialog can be created without a display
+# ----------------------------------------------------------------------
+class DummyWidget:
+    def __init__(self, *args, **kwargs):
+        self.configured = {}
+        self.bindings = {}
 
-        def pack(self, *a, **k):
-            pass
+    def grid(self, *a, **k):
+        pass
 
-        def insert(self, *a, **k):
-            pass
+    def pack(self, *a, **k):
+        pass
 
-        def bind(self, *a, **k):
-            pass
+    def insert(self, *a, **k):
+        pass
 
-        def configure(self, **k):
-            self.configured.update(k)
+    def bind(self, event, func=None, *a, **k):
+        self.bindings[event] = func
 
-    class DummyCombobox(DummyWidget):
-        def __init__(self, *a, textvariable=None, state=None, **k):
-            super().__init__(*a, **k)
-            self.textvariable = textvariable
-            self.state = state
+    def configure(self, **k):
+        self.configured.update(k)
 
-    combo_holder = {}
+    def after(self, *a, **k):
+        pass
 
-    def combo_stub(*a, **k):
-        cb = DummyCombobox(*a, **k)
-        combo_holder["cb"] = cb
-        return cb
-
-    monkeypatch.setattr("gui.stpa_window.ttk.Combobox", combo_stub)
-    monkeypatch.setattr("gui.stpa_window.ttk.Label", lambda *a, **k: DummyWidget())
-    monkeypatch.setattr("gui.stpa_window.ttk.Frame", lambda *a, **k: DummyWidget())
-    monkeypatch.setattr("gui.stpa_window.ttk.Button", lambda *a, **k: DummyWidget())
-    monkeypatch.setattr("gui.stpa_window.TranslucidButton", lambda *a, **k: DummyWidget())
-    monkeypatch.setattr("gui.stpa_window.tk.Entry", lambda *a, **k: DummyWidget())
-    monkeypatch.setattr("gui.stpa_window.tk.Listbox", lambda *a, **k: DummyWidget())
 
-    class DummyVar:
-        def __init__(self, value=""):
-            self._value = value
+class DummyCombobox(DummyWidget):
+    def __init__(self, *a, textvariable=None, state=None, **k):
+        super().__init__(*a, **k)
+        self.textvariable = textvariable
+        self.state = state
 
-        def get(self):
-            return self._value
 
-        def set(self, v):
-            self._value = v
+class DummyVar:
+    def __init__(self, value=""):
+        self._value = value
 
-    monkeypatch.setattr("gui.stpa_window.tk.StringVar", lambda value="": DummyVar(value))
+    def get(self):
+        return self._value
 
-    dlg = StpaWindow.RowDialog.__new__(StpaWindow.RowDialog)
-    dlg.parent = parent
-    dlg.app = app
-    dlg.row = StpaEntry("", "", "", "", "", [])
-
-    dlg.body(master=DummyWidget())
-
-    cb = combo_holder["cb"]
-    assert cb.configured["values"] == ["Act"]
-    assert dlg.action_var.get() == "Act"
-
-
-def test_row_dialog_control_action_tooltip(monkeypatch):
-    """The combo box tooltip should show the full selected action."""
-
-    app = types.SimpleNamespace()
-    parent = StpaWindow.__new__(StpaWindow)
-    parent.app = app
-    parent._get_control_actions = lambda: ["Act1", "Act2"]
+    def set(self, v):
+        self._value = v
 
-    class DummyWidget:
-        def __init__(self, *args, **kwargs):
-            self.configured = {}
-            self.bindings = {}
 
-        def grid(self, *a, **k):
-            pass
+def _widget(*a, **k):
+    return DummyWidget()
 
-        def pack(self, *a, **k):
-            pass
 
-        def insert(self, *a, **k):
-            pass
-
-        def bind(self, event, func):
-            self.bindings[event] = func
-
-        def configure(self, **k):
-            self.configured.update(k)
-
-        def after(self, *a, **k):
-            pass
-
-    class DummyCombobox(DummyWidget):
-        def __init__(self, *a, textvariable=None, state=None, **k):
-            super().__init__(*a, **k)
-            self.textvariable = textvariable
-            self.state = state
-
-    combo_holder = {}
+@pytest.fixture
+def stpa_tk_stubs(monkeypatch):
+    """Patch the STPA window's Tk widgets and record the combo box and tooltip."""
+    holders = types.SimpleNamespace(combo_holder={}, tooltip_holder={})
 
     def combo_stub(*a, **k):
         cb = DummyCombobox(*a, **k)
-        combo_holder["cb"] = cb
+        holders.combo_holder["cb"] = cb
         return cb
 
-    tooltip_holder = {}
-
     class DummyToolTip:
         def __init__(self, widget, text):
             self.widget = widget
             self.text = text
-            tooltip_holder["tip"] = self
-
-    monkeypatch.setattr("gui.stpa_window.ttk.Combobox", combo_stub)
-    monkeypatch.setattr("gui.stpa_window.ttk.Label", lambda *a, **k: DummyWidget())
-    monkeypatch.setattr("gui.stpa_window.ttk.Frame", lambda *a, **k: DummyWidget())
-    monkeypatch.setattr("gui.stpa_window.ttk.Button", lambda *a, **k: DummyWidget())
-    monkeypatch.setattr("gui.stpa_window.TranslucidButton", lambda *a, **k: DummyWidget())
-    monkeypatch.setattr("gui.stpa_window.tk.Entry", lambda *a, **k: DummyWidget())
-    monkeypatch.setattr("gui.stpa_window.tk.Listbox", lambda *a, **k: DummyWidget())
-    monkeypatch.setattr("gui.stpa_window.ToolTip", DummyToolTip)
-
-    class DummyVar:
-        def __init__(self, value=""):
-            self._value = value
-
-        def get(self):
-            return self._value
+            holders.tooltip_holder["tip"] = self
+
+    patches = {
+        stpa_window.ttk: {
+            "Label": _widget,
+            "Frame": _widget,
+            "Button": _widget,
+            "Combobox": combo_stub,
+        },
+        stpa_window.tk: {
+            "Entry": _widget,
+            "Listbox": _widget,
+            "StringVar": lambda value="": DummyVar(value),
+        },
+        stpa_window: {"TranslucidButton": _widget, "ToolTip": DummyToolTip},
+    }
+    for target, attrs in patches.items():
+        for name, value in attrs.items():
+            monkeypatch.setattr(target, name, value)
+    return holders
+
+
+def _row_dialog(actions):
+    app = types.SimpleNamespace()
+    parent = StpaWindow.__new__(StpaWindow)
+    parent.app = app
+    parent.action_lookups = 0
 
-        def set(self, v):
-            self._value = v
+    def _get_control_actions():
+        parent.action_lookups += 1
+        return actions
 
-    monkeypatch.setattr("gui.stpa_window.tk.StringVar", lambda value="": DummyVar(value))
+    parent._get_control_actions = _get_control_actions
 
     dlg = StpaWindow.RowDialog.__new__(StpaWindow.RowDialog)
     dlg.parent = parent
     dlg.app = app
     dlg.row = StpaEntry("", "", "", "", "", [])
-
     dlg.body(master=DummyWidget())
+    return dlg
 
-    tip = tooltip_holder["tip"]
+
+def test_row_dialog_populates_control_actions(stpa_tk_stubs):
+    """The control action combo box should list actions and preselect one."""
+
+    dlg = _row_dialog(["Act"])
+
+    cb = stpa_tk_stubs.combo_holder["cb"]
+    assert cb.configured["values"] == ["Act"]
+    assert dlg.action_var.get() == "Act"
+
+
+def test_row_dialog_control_action_tooltip(stpa_tk_stubs):
+    """The combo box tooltip should show the full selected action."""
+
+    dlg = _row_dialog(["Act1", "Act2"])
+
+    tip = stpa_tk_stubs.tooltip_holder["tip"]
     assert tip.text == "Act1"
-    cb = combo_holder["cb"]
+    cb = stpa_tk_stubs.combo_holder["cb"]
     dlg.action_var.set("Act2")
     cb.bindings["<<ComboboxSelected>>"](None)
     assert tip.text == "Act2"
-
-
+    # Selecting an action reuses the list fetched when the dialog was built.
+    assert dlg.parent.action_lookups == 1
@@ -17,10 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from types import SimpleNamespace
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from analysis.models import StpaDoc, StpaEntry
 from mainappsrc.core.reporting_export import Reporting_Export
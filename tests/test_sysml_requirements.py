@@ -16,9 +16,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
 
 
@@ -92,3 +89,34 @@ def test_non_activity_diagram_requirement_type():
     bdd.connections = [{"src": 1, "dst": 2, "conn_type": "Association"}]
     reqs = repo.generate_requirements(bdd.diag_id)
     assert reqs == [("A shall be connected to B.", "functional")]
+
+
+def test_nested_call_behavior_order_and_cycles():
+    repo = setup_repo()
+    leaf = repo.create_diagram("Activity Diagram", name="Leaf")
+    leaf.objects = [
+        {"obj_id": 1, "obj_type": "Action", "properties": {"name": "L1"}},
+        {"obj_id": 2, "obj_type": "Action", "properties": {"name": "L2"}},
+    ]
+    leaf.connections = [{"src": 1, "dst": 2}]
+    main = repo.create_diagram("Activity Diagram", name="Main")
+    main.objects = [
+        {"obj_id": 1, "obj_type": "Action", "properties": {"name": "A"}},
+        {
+            "obj_id": 2,
+            "obj_type": "CallBehaviorAction",
+            "properties": {"name": "CallLeaf", "behavior": leaf.diag_id},
+        },
+        {
+            "obj_id": 3,
+            "obj_type": "CallBehaviorAction",
+            "properties": {"name": "CallMain", "behavior": main.diag_id},
+        },
+    ]
+    main.connections = [{"src": 1, "dst": 2}, {"src": 2, "dst": 3}]
+    reqs = repo.generate_requirements(main.diag_id)
+    assert [r[0] for r in reqs] == [
+        "L1 shall precede L2.",
+        "A shall precede CallLeaf.",
+        "CallLeaf shall precede CallMain.",
+    ]
@@ -16,11 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import sys
-from pathlib import Path
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 from gui.utils.closable_notebook import ClosableNotebook
 
 
@@ -23,13 +23,15 @@ import tkinter as tk
 from tkinter import ttk
 
 root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-sys.path.append(root_dir)
 sys.path.append(os.path.join(root_dir, "gui", "utils"))
 try:  # Import GUI extras if available
     from gui import CapsuleButton, _StyledButton
 except Exception:  # pragma: no cover - optional GUI dependency
     CapsuleButton = _StyledButton = None
 from closable_notebook import ClosableNotebook
+from _tk_available import TK_AVAILABLE
+
+pytestmark = pytest.mark.skipif(not TK_AVAILABLE, reason="Tk not available")
 
 
 @pytest.mark.detached_tab
@@ -82,14 +84,13 @@ class TestDetachedTabToolboxDiagram:
 
 class TestTabDetachBasics:
     def test_tab_detach_and_reattach(self):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
         nb.add(frame, text="Tab1")
         nb.update_idletasks()
+        rx, ry = nb.winfo_rootx(), nb.winfo_rooty()
+        rw, rh = nb.winfo_width(), nb.winfo_height()
 
         class Event: ...
 
@@ -97,8 +98,8 @@ class TestTabDetachBasics:
         nb._on_tab_press(press)
         nb._dragging = True
         release = Event()
-        release.x_root = nb.winfo_rootx() + nb.winfo_width() + 40
-        release.y_root = nb.winfo_rooty() + nb.winfo_height() + 40
+        release.x_root = rx + rw + 40
+        release.y_root = ry + rh + 40
         nb._on_tab_release(release)
 
         assert len(nb.tabs()) == 0
@@ -112,8 +113,8 @@ class TestTabDetachBasics:
         new_nb._on_tab_press(press2)
         new_nb._dragging = True
         release2 = Event()
-        release2.x_root = nb.winfo_rootx() + 10
-        release2.y_root = nb.winfo_rooty() + 10
+        release2.x_root = rx + 10
+        release2.y_root = ry + 10
         new_nb._on_tab_release(release2)
 
         assert len(nb.tabs()) == 1
@@ -121,24 +122,22 @@ class TestTabDetachBasics:
         root.destroy()
 
     def test_tab_detach_without_motion(self):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
         nb.add(frame, text="Tab1")
         nb.update_idletasks()
+        rw, rh = nb.winfo_width(), nb.winfo_height()
 
         class Event: ...
 
         press = Event(); press.x = 5; press.y = 5
         nb._on_tab_press(press)
         release = Event()
-        release.x_root = nb.winfo_rootx() + nb.winfo_width() + 40
-        release.y_root = nb.winfo_rooty() + nb.winfo_height() + 40
-        release.x = nb.winfo_width() + 40
-        release.y = nb.winfo_height() + 40
+        release.x_root = nb.winfo_rootx() + rw + 40
+        release.y_root = nb.winfo_rooty() + rh + 40
+        release.x = rw + 40
+        release.y = rh + 40
         nb._on_tab_release(release)
 
         assert len(nb.tabs()) == 0
@@ -146,10 +145,7 @@ class TestTabDetachBasics:
 
 class TestFloatingWindowBehavior:
     def test_detached_window_kept_alive(self):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
         nb.add(frame, text="Tab1")
@@ -171,10 +167,7 @@ class TestFloatingWindowBehavior:
         root.destroy()
 
     def test_tab_stays_detached(self):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
         nb.add(frame, text="Tab1")
@@ -197,10 +190,7 @@ class TestFloatingWindowBehavior:
         root.destroy()
 
     def test_detached_window_shows_content(self):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
         nb.add(frame, text="Tab1")
@@ -224,10 +214,7 @@ class TestFloatingWindowBehavior:
         root.destroy()
 
     def test_detach_moves_widget(self):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
         nb.add(frame, text="Tab1")
@@ -250,10 +237,7 @@ class TestFloatingWindowBehavior:
         root.destroy()
 
     def test_reopen_detached_tab_focuses_window(self):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
         nb.add(frame, text="Tab1")
@@ -279,10 +263,7 @@ class TestFloatingWindowBehavior:
 
 class TestFloatingWindowLayout:
     def test_detached_tab_fits_initial_window(self):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
         ttk.Label(frame, text="hi").pack(expand=True, fill="both")
@@ -308,10 +289,7 @@ class TestFloatingWindowLayout:
         root.destroy()
 
     def test_detached_tab_resizes_with_window(self):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
         ttk.Label(frame, text="hi").pack(expand=True, fill="both")
@@ -340,10 +318,7 @@ class TestFloatingWindowLayout:
         root.destroy()
 
     def test_nested_widgets_expand_with_window(self):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         outer = ttk.Frame(nb)
         inner = ttk.Frame(outer)
@@ -378,10 +353,7 @@ class TestFloatingWindowLayout:
 
 class TestDetachedWindowLayout:
     def test_pack_layout_preserved(self, monkeypatch):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
         l1 = ttk.Label(frame, text="a")
@@ -420,10 +392,7 @@ class TestDetachedWindowLayout:
         root.destroy()
 
     def test_grid_layout_preserved(self, monkeypatch):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
         frame.grid_rowconfigure(0, weight=1)
@@ -470,10 +439,7 @@ class TestDetachedWindowLayout:
         root.destroy()
 
     def test_pack_before_after_ignored(self, monkeypatch):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
         l1 = ttk.Label(frame, text="1")
@@ -514,10 +480,7 @@ class TestDetachedWindowLayout:
         root.destroy()
 
     def test_grid_parent_weights_preserved(self, monkeypatch):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         nb.grid_rowconfigure(0, weight=1)
         nb.grid_columnconfigure(0, weight=1)
@@ -562,10 +525,7 @@ class TestDetachedWindowLayout:
 
 class TestCloning:
     def test_detach_handles_required_args(self, monkeypatch):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
 
         class RequiredButton(ttk.Button):
@@ -596,10 +556,7 @@ class TestCloning:
         root.destroy()
 
     def test_detach_handles_attribute_args(self, monkeypatch):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
 
         class AttrWidget(ttk.Frame):
@@ -631,10 +588,7 @@ class TestCloning:
         root.destroy()
 
     def test_detach_keeps_entry_content(self, monkeypatch):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         entry = ttk.Entry(nb)
         entry.insert(0, "data")
@@ -661,10 +615,7 @@ class TestCloning:
         root.destroy()
 
     def test_detach_preserves_layout(self, monkeypatch):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
         label = ttk.Label(frame, text="hi")
@@ -698,10 +649,7 @@ class TestCloning:
 
     def test_detach_resets_pack_parent(self, monkeypatch):
         """Detached widgets should pack into the new notebook, not the original."""
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
         ttk.Label(frame, text="hi").pack()
@@ -730,10 +678,7 @@ class TestCloning:
     @pytest.mark.skipif(_StyledButton is None, reason="Styled button unavailable")
     def test_detach_styled_button(self, monkeypatch):
         """Styled button detachment should preserve the original widget."""
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         btn = _StyledButton(nb, text="ok")
         nb.add(btn, text="Tab1")
@@ -763,10 +708,7 @@ class TestCloning:
 @pytest.mark.skipif(CapsuleButton is None, reason="CapsuleButton unavailable")
 class TestCapsuleButtonDetach:
     def test_detach_capsule_preserves_type(self, monkeypatch):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         btn = CapsuleButton(nb, text="ok")
         btn._text = None
@@ -793,10 +735,7 @@ class TestCapsuleButtonDetach:
         root.destroy()
 
     def test_detach_capsule_with_none_text(self, monkeypatch):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
         btn = CapsuleButton(nb, text="ok")
         btn._text = None
@@ -826,10 +765,7 @@ class TestCapsuleButtonDetach:
 
 class TestDetachCleanup:
     def test_detach_cancels_after_events(self, monkeypatch):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
 
         class Blinker(ttk.Label):
@@ -869,10 +805,7 @@ class TestDetachCleanup:
 
 class TestAnimatedWidgetDetach:
     def test_detach_untracked_animation(self, monkeypatch, capsys):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
 
         class Untracked(ttk.Frame):
@@ -941,10 +874,7 @@ class TestDetachedTabRegression:
 
 class TestTabDetachCallbacks:
     def test_detach_tab_with_after_callback(self):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         root.report_callback_exception = lambda exc, val, tb: (_ for _ in ()).throw(val)
         nb = ClosableNotebook(root)
         frame = ttk.Frame(nb)
@@ -967,10 +897,7 @@ class TestTabDetachCallbacks:
         root.destroy()
 
     def test_detach_child_untracked_animation(self, monkeypatch, capsys):
-        try:
-            root = tk.Tk()
-        except tk.TclError:
-            pytest.skip("Tk not available")
+        root = tk.Tk()
         nb = ClosableNotebook(root)
 
         class Parent(ttk.Frame):
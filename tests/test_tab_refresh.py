@@ -16,13 +16,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
-import sys
 import pytest
 import tkinter as tk
 from tkinter import ttk
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from gui.utils.closable_notebook import ClosableNotebook
 
 
@@ -16,12 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
-import sys
 import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
 from gui.threat_dialog import ThreatDialog
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
 
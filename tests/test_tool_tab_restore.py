@@ -16,11 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import sys
 import types
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import mainappsrc.ui.app_lifecycle_ui as app_lifecycle_ui
 from mainappsrc.ui.app_lifecycle_ui import AppLifecycleUI
@@ -17,36 +17,66 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import json
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import pytest
 
 from gui import architecture
 from config import load_json_with_comments
 
 
-def test_toolbox_updates_with_new_relation(tmp_path, monkeypatch):
+@pytest.fixture
+def config_override(tmp_path):
+    """Return ``apply(cfg)`` loading *cfg* as the active diagram rules.
+
+    The original rules are reloaded at teardown only when ``apply`` ran.
+    """
     orig_path = architecture._CONFIG_PATH
-    cfg = load_json_with_comments(orig_path)
+    applied = False
+
+    def apply(cfg):
+        nonlocal applied
+        tmp_file = tmp_path / "diagram_rules.json"
+        tmp_file.write_text(json.dumps(cfg))
+        architecture._CONFIG_PATH = tmp_file
+        applied = True
+        architecture.reload_config()
+
+    yield apply
+    if applied:
+        architecture._CONFIG_PATH = orig_path
+        architecture.reload_config()
+
+
+def _with_rule(base, stereotype, src, dsts, diagram="Governance Diagram"):
+    """Return *base* with ``connection_rules[diagram][stereotype][src] = dsts``.
+
+    Only the dictionaries along that path are copied; every other branch is
+    shared with *base*, which is left unchanged.
+    """
+    rules = base["connection_rules"]
+    diag_rules = rules.get(diagram, {})
+    return {
+        **base,
+        "connection_rules": {
+            **rules,
+            diagram: {
+                **diag_rules,
+                stereotype: {**diag_rules.get(stereotype, {}), src: list(dsts)},
+            },
+        },
+    }
+
+
+def test_toolbox_updates_with_new_relation(config_override):
+    cfg = load_json_with_comments(architecture._CONFIG_PATH)
     before = architecture._toolbox_defs()
     assert "Reviews" not in before["Artifacts"]["relations"]
-    new_cfg = json.loads(json.dumps(cfg))
-    conns = new_cfg["connection_rules"].setdefault("Governance Diagram", {})
     # Add a new relation between two artifact types to ensure it surfaces only
     # in the Artifacts toolbox.
-    conns.setdefault("Reviews", {})["Document"] = ["Record"]
-    tmp_file = tmp_path / "diagram_rules.json"
-    tmp_file.write_text(json.dumps(new_cfg))
-    try:
-        monkeypatch.setattr(architecture, "_CONFIG_PATH", tmp_file)
-        architecture.reload_config()
-        after = architecture._toolbox_defs()
-        assert "Reviews" in after["Artifacts"]["relations"]
-        assert "Reviews" not in after.get("Entities", {}).get("relations", [])
-    finally:
-        monkeypatch.setattr(architecture, "_CONFIG_PATH", orig_path)
-        architecture.reload_config()
+    config_override(_with_rule(cfg, "Reviews", "Document", ["Record"]))
+    after = architecture._toolbox_defs()
+    assert "Reviews" in after["Artifacts"]["relations"]
+    assert "Reviews" not in after.get("Entities", {}).get("relations", [])
 
 
 def test_irrelevant_relations_filtered():
@@ -69,7 +99,7 @@ def test_cross_category_relations_surface():
     assert "Approves" in art_ext["Entities"]["relations"]
 
 
-def test_governance_core_relations_and_externals(tmp_path, monkeypatch):
+def test_governance_core_relations_and_externals(config_override):
     defs = architecture._toolbox_defs()
     core = defs["Governance Core"]
     # Governance core toolbox hides Work Product and Lifecycle Phase buttons
@@ -84,45 +114,23 @@ def test_governance_core_relations_and_externals(tmp_path, monkeypatch):
         "Used By",
     } <= set(relations)
     assert relations.index("Used By") < relations.index("Used after Approval")
-    orig_path = architecture._CONFIG_PATH
-    cfg = load_json_with_comments(orig_path)
-    new_cfg = json.loads(json.dumps(cfg))
-    conns = new_cfg["connection_rules"].setdefault("Governance Diagram", {})
-    conns.setdefault("Reviews", {})["Work Product"] = ["Document"]
-    tmp_file = tmp_path / "diagram_rules.json"
-    tmp_file.write_text(json.dumps(new_cfg))
-    try:
-        monkeypatch.setattr(architecture, "_CONFIG_PATH", tmp_file)
-        architecture.reload_config()
-        updated = architecture._toolbox_defs()
-        ext = updated["Governance Core"]["externals"]["Artifacts"]
-        assert "Document" in ext["nodes"]
-        assert "Reviews" in ext["relations"]
-    finally:
-        monkeypatch.setattr(architecture, "_CONFIG_PATH", orig_path)
-        architecture.reload_config()
+    cfg = load_json_with_comments(architecture._CONFIG_PATH)
+    config_override(_with_rule(cfg, "Reviews", "Work Product", ["Document"]))
+    updated = architecture._toolbox_defs()
+    ext = updated["Governance Core"]["externals"]["Artifacts"]
+    assert "Document" in ext["nodes"]
+    assert "Reviews" in ext["relations"]
 
 
-def test_bidirectional_external_relations(tmp_path, monkeypatch):
-    orig_path = architecture._CONFIG_PATH
-    cfg = load_json_with_comments(orig_path)
-    new_cfg = json.loads(json.dumps(cfg))
-    conns = new_cfg["connection_rules"].setdefault("Governance Diagram", {})
+def test_bidirectional_external_relations(config_override):
+    cfg = load_json_with_comments(architecture._CONFIG_PATH)
     # Introduce a relation from an artifact to an entity so both toolboxes
     # expose it under their related sections.
-    conns.setdefault("Creates", {}).setdefault("Document", ["Role"])
-    tmp_file = tmp_path / "diagram_rules.json"
-    tmp_file.write_text(json.dumps(new_cfg))
-    try:
-        monkeypatch.setattr(architecture, "_CONFIG_PATH", tmp_file)
-        architecture.reload_config()
-        defs = architecture._toolbox_defs()
-        art_ext = defs["Artifacts"]["externals"]["Entities"]
-        assert "Role" in art_ext["nodes"]
-        assert "Creates" in art_ext["relations"]
-        ent_ext = defs["Entities"]["externals"]["Artifacts"]
-        assert "Document" in ent_ext["nodes"]
-        assert "Creates" in ent_ext["relations"]
-    finally:
-        monkeypatch.setattr(architecture, "_CONFIG_PATH", orig_path)
-        architecture.reload_config()
+    config_override(_with_rule(cfg, "Creates", "Document", ["Role"]))
+    defs = architecture._toolbox_defs()
+    art_ext = defs["Artifacts"]["externals"]["Entities"]
+    assert "Role" in art_ext["nodes"]
+    assert "Creates" in art_ext["relations"]
+    ent_ext = defs["Entities"]["externals"]["Artifacts"]
+    assert "Document" in ent_ext["nodes"]
+    assert "Creates" in ent_ext["relations"]
@@ -16,11 +16,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository
 from gui.architecture import link_trace_between_objects, DiagramConnection
 
@@ -20,12 +20,6 @@ from __future__ import annotations
 
 """Unit tests for the TrashEater resource monitor."""
 
-import sys
-from pathlib import Path
-
-# Ensure repository root is on sys.path for local imports
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from tools.trash_eater import TrashEater
 
 
@@ -17,14 +17,10 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from types import SimpleNamespace
-from pathlib import Path
-import sys
 import tkinter.font as tkFont
 
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from gui.architecture import SysMLDiagramWindow
 from gui.style_manager import StyleManager
 
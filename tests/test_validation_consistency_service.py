@@ -20,14 +20,11 @@
 from __future__ import annotations
 
 import ast
-import sys
 from pathlib import Path
 
 # Ensure project root on path for direct module imports when running from the
 # tests directory.
 ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
 
 from mainappsrc.services.validation import ValidationConsistencyService
 
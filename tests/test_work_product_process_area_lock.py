@@ -16,76 +16,117 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import unittest
-from gui.architecture import SysMLObject, SysMLDiagramWindow, GovernanceDiagramWindow
+import copy
+
+import pytest
+
+from gui.architecture import SysMLObject, GovernanceDiagramWindow
 from mainappsrc.models.sysml.sysml_repository import SysMLRepository, SysMLDiagram
 
 
-class WorkProductProcessAreaLockTests(unittest.TestCase):
-    class DummyCanvas:
-        def canvasx(self, x):
-            return x
+class DummyCanvas:
+    def canvasx(self, x):
+        return x
+
+    def canvasy(self, y):
+        return y
+
+    def delete(self, *args, **kwargs):
+        pass
+
+    def configure(self, **kwargs):
+        pass
+
+
+class DummyEvent:
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def _prototype_window():
+    win = GovernanceDiagramWindow.__new__(GovernanceDiagramWindow)
+    win.canvas = DummyCanvas()
+    win.zoom = 1.0
+    win.current_tool = "Select"
+    win.drag_offset = (0, 0)
+    win.resizing_obj = None
+    win.start = None
+    win.select_rect_start = None
+    win.dragging_point_index = None
+    win.dragging_endpoint = None
+    win.conn_drag_offset = None
+    win.endpoint_drag_pos = None
+    win.app = None
+    win.selected_conn = None
+    win.redraw = lambda: None
+    win._sync_to_repository = lambda: None
+    return win
 
-        def canvasy(self, y):
-            return y
 
-        def delete(self, *args, **kwargs):
-            pass
+# Shallow-copied per test. Methods are left to resolve through the class:
+# binding them here would tie every copy to the prototype's own state.
+_PROTOTYPE = _prototype_window()
 
-        def configure(self, **kwargs):
-            pass
 
-    class DummyEvent:
-        def __init__(self, x, y):
-            self.x = x
-            self.y = y
+@pytest.fixture(scope="module")
+def repo():
+    """Repository shared by the tests in this module."""
+    return SysMLRepository.reset_instance()
 
-    def setUp(self):
-        SysMLRepository._instance = None
-        self.repo = SysMLRepository.get_instance()
 
-    def _create_window(self):
-        repo = self.repo
+@pytest.fixture(autouse=True)
+def _clean_repo(repo):
+    """Empty the diagram bookkeeping left by the previous test."""
+    SysMLRepository._instance = repo
+    repo.diagrams.clear()
+    repo.element_diagrams.clear()
+    repo._diagram_elements.clear()
+
+
+@pytest.fixture
+def make_window(repo):
+    """Return a factory building a bare governance window over *objects*."""
+
+    def _make_window(objects, selected_obj=None):
         diag = SysMLDiagram(diag_id="d", diag_type="Governance Diagram")
         repo.diagrams[diag.diag_id] = diag
-        win = GovernanceDiagramWindow.__new__(GovernanceDiagramWindow)
+        win = copy.copy(_PROTOTYPE)
         win.repo = repo
         win.diagram_id = diag.diag_id
-        boundary = SysMLObject(1, "System Boundary", 0.0, 0.0, width=100.0, height=100.0)
-        wp = SysMLObject(2, "Work Product", 0.0, 0.0, properties={"boundary": "1", "name": "WP", "name_locked": "1"})
-        win.objects = [boundary, wp]
+        win.objects = objects
         win.connections = []
-        win.canvas = self.DummyCanvas()
-        win.zoom = 1.0
-        win.current_tool = "Select"
-        win.selected_obj = wp
-        win.drag_offset = (0, 0)
-        win.resizing_obj = None
-        win.start = None
-        win.select_rect_start = None
-        win.dragging_point_index = None
-        win.dragging_endpoint = None
-        win.conn_drag_offset = None
-        win.endpoint_drag_pos = None
-        win.app = None
-        win.selected_conn = None
-        win._constrain_horizontal_movement = SysMLDiagramWindow._constrain_horizontal_movement.__get__(win)
-        win.get_object = SysMLDiagramWindow.get_object.__get__(win)
-        win.get_ibd_boundary = SysMLDiagramWindow.get_ibd_boundary.__get__(win)
-        win.find_boundary_for_obj = SysMLDiagramWindow.find_boundary_for_obj.__get__(win)
-        win._object_within = SysMLDiagramWindow._object_within.__get__(win)
-        win.redraw = lambda: None
-        win._sync_to_repository = lambda: None
-        return win, boundary, wp
-
-    def test_work_product_remains_in_process_area(self):
-        win, boundary, wp = self._create_window()
-        win.on_left_drag(self.DummyEvent(200, 0))
-        win.on_left_release(self.DummyEvent(200, 0))
-        self.assertEqual(wp.properties.get("boundary"), "1")
-        expected_x = boundary.x + boundary.width / 2 - wp.width / 2
-        self.assertEqual((wp.x, wp.y), (expected_x, boundary.y))
-
-
-if __name__ == "__main__":
-    unittest.main()
+        win.selected_obj = selected_obj
+        return win
+
+    return _make_window
+
+
+def _area_and_work_product():
+    boundary = SysMLObject(1, "System Boundary", 0.0, 0.0, width=100.0, height=100.0)
+    wp = SysMLObject(2, "Work Product", 0.0, 0.0, properties={"boundary": "1", "name": "WP", "name_locked": "1"})
+    return boundary, wp
+
+
+def test_work_product_remains_in_process_area(make_window):
+    boundary, wp = _area_and_work_product()
+    win = make_window([boundary, wp], selected_obj=wp)
+    event = DummyEvent(200, 0)
+    win.on_left_drag(event)
+    win.on_left_release(event)
+    assert wp.properties.get("boundary") == "1"
+    expected_x = boundary.x + boundary.width / 2 - wp.width / 2
+    assert (wp.x, wp.y) == (expected_x, boundary.y)
+
+
+def test_work_product_position_preserved_on_boundary_move(make_window):
+    boundary, wp = _area_and_work_product()
+    win = make_window([boundary, wp], selected_obj=boundary)
+    event = DummyEvent(30, 40)
+    win.on_left_drag(event)
+    win.on_left_release(event)
+    assert wp.properties.get("boundary") == "1"
+    assert (wp.x - boundary.x, wp.y - boundary.y) == (0.0, 0.0)
+    assert (boundary.x, boundary.y) == (30.0, 40.0)